@@ -1,5 +1,29 @@
-from .gacha_bot import GachaBot
-from .config_validator import ConfigValidator
-from .stations import *
+import importlib
 
-__version__ = "2.1.4"
\ No newline at end of file
+__version__ = "2.1.4"
+
+# the bot itself depends on ark, which can only be imported on windows. The
+# modules are only imported once they are accessed so that the platform
+# independent parts (for example the simulation) can be used anywhere.
+_LAZY_IMPORTS = {
+    "GachaBot": ".gacha_bot",
+    "ConfigValidator": ".config_validator",
+    "Station": ".stations",
+    "ARBStation": ".stations",
+    "CrystalStation": ".stations",
+    "BerryFeedStation": ".stations",
+    "MeatFeedStation": ".stations",
+    "SmallMeatStation": ".stations",
+    "GrindingStation": ".stations",
+    "HealingStation": ".stations",
+    "MedbrewStation": ".stations",
+    "YTrapStation": ".stations",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
@@ -90,6 +90,13 @@ class ConfigValidator:
             "hide_region": "(1240,690,613,355)",
         },
         "arb": {"arb_enabled": True},
+        "scheduler": {"ytrap_mode": "budget", "lateness_budget": 30},
+        "profiler": {"enabled": False, "directory": "profiles"},
+        "delays": {"enabled": True, "min_factor": 0.5, "max_factor": 2.0},
+        "vision": {"frame_cache_ttl": 0.1},
+        "ocr": {"backend": "auto", "workers": 3, "vote_frames": 5},
+        "capture": {"mode": "live", "directory": "recordings"},
+        "crop_plots": {"persist": True, "max_age": 60, "analytics": True},
     }
 
     def __init__(self) -> None:
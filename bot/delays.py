@@ -0,0 +1,121 @@
+import json
+from typing import Optional
+
+
+class DelayController:
+    """Learns the shortest safe delay for each place the bot waits after an
+    action, instead of always waiting a hardcoded amount of time.
+
+    Each call site asks for its delay by name together with the delay it used
+    to be hardcoded to. Every time the action following the delay succeeds
+    (the crop plot opened, the next turn was reached) the delay shrinks a
+    little, every failure backs it off considerably. The delays are kept
+    within the bounds set as factors of the default, and persisted so that
+    the next session starts off where the last one stopped.
+
+    Sites whose outcome is only known later, for example whether the crop
+    plot after the delay opened, can be marked as pending with `expect` and
+    are resolved once the outcome is known. Sites still pending once the
+    station finished or failed are discarded, neither tells whether their
+    delay was long enough.
+
+    Parameters
+    ----------
+    path :class:`str`:
+        The path to persist the learned delays at
+    """
+
+    SHRINK = 0.97
+    BACKOFF = 1.5
+    SAVE_EVERY = 25
+
+    def __init__(self, path: str = "bot/_data/delays.json") -> None:
+        self._path = path
+        self._delays: Optional[dict[str, float]] = None
+        self._defaults: dict[str, float] = {}
+        self._pending: set[str] = set()
+        self._unsaved = 0
+
+        self.enabled = False
+        self.min_factor = 0.5
+        self.max_factor = 2.0
+
+    def configure(self, enabled: bool, min_factor: float, max_factor: float) -> None:
+        self.enabled = enabled
+        self.min_factor = min_factor
+        self.max_factor = max_factor
+
+    def get(self, site: str, default: float) -> float:
+        """Returns the delay to use at the given site.
+
+        Parameters
+        ----------
+        site :class:`str`:
+            The name of the call site, unique across the bot
+
+        default :class:`float`:
+            The delay the site would use without the controller
+        """
+        if not self.enabled:
+            return default
+
+        self._defaults[site] = default
+        return self._clamp(site, self._load().get(site, default))
+
+    def report(self, site: str, success: bool) -> None:
+        """Shrinks the delay of the site if the action following it was
+        successful, backs it off otherwise."""
+        if not self.enabled or site not in self._defaults:
+            return
+
+        delays = self._load()
+        current = delays.get(site, self._defaults[site])
+        if success:
+            delays[site] = self._clamp(site, current * self.SHRINK)
+            self._unsaved += 1
+        else:
+            delays[site] = self._clamp(site, current * self.BACKOFF)
+            print(f"Backing off delay '{site}' to {delays[site]:.2f}s.")
+            self._unsaved = self.SAVE_EVERY
+
+        if self._unsaved >= self.SAVE_EVERY:
+            self._save()
+
+    def expect(self, site: str) -> None:
+        """Marks the site as waiting for its outcome to be resolved."""
+        self._pending.add(site)
+
+    def resolve(self, success: bool, *sites: str) -> None:
+        """Reports the outcome of the given pending sites, or all pending
+        sites if none are given."""
+        for site in sites or tuple(self._pending):
+            if site in self._pending:
+                self._pending.discard(site)
+                self.report(site, success)
+
+    def discard(self) -> None:
+        """Forgets the pending sites without reporting an outcome for them."""
+        self._pending.clear()
+
+    def _clamp(self, site: str, delay: float) -> float:
+        default = self._defaults[site]
+        return min(max(delay, default * self.min_factor), default * self.max_factor)
+
+    def _load(self) -> dict[str, float]:
+        if self._delays is not None:
+            return self._delays
+
+        try:
+            with open(self._path) as f:
+                self._delays = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._delays = {}
+        return self._delays
+
+    def _save(self) -> None:
+        with open(self._path, "w") as f:
+            json.dump(self._load(), f, indent=4)
+        self._unsaved = 0
+
+
+delays = DelayController()
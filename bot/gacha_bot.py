@@ -11,9 +11,23 @@ from ark import Console, Player, Server, TribeLog, UserSettings, config, excepti
 from discord import Embed  # type:ignore[import]
 
 from . import tools
+from .delays import delays
 from .exceptions import ConfigError
+from .inventory_model import inventory_models
+from .profiler import profiler
 from .recovery import Unstucking
-from .settings import TowerSettings
+from .scheduler import Scheduler
+from .settings import (
+    CaptureSettings,
+    CropPlotSettings,
+    DelaySettings,
+    OCRSettings,
+    ProfilerSettings,
+    SchedulerSettings,
+    TowerSettings,
+    VisionSettings,
+)
+from .sleeps import sleep_accounting
 from .stations import (
     ARBStation,
     BerryFeedStation,
@@ -26,6 +40,17 @@ from .stations import (
     Station,
     YTrapStation,
 )
+from .stations._crop_plot_store import crop_plot_store
+from .stations.ytrap.analytics import ytrap_analytics
+from .vision import (
+    FrameCache,
+    create_capture_backend,
+    install_capture_backend,
+    install_frame_cache,
+    ocr,
+    station_templates,
+    templates,
+)
 from .webhooks import DiscordSettings, InfoWebhook, TimerWebhook, TribeLogWebhook
 
 
@@ -46,6 +71,19 @@ class GachaBot:
         self.settings = TowerSettings.load()
         self._set_environment()
 
+        sleep_accounting.install()
+        delay_settings = DelaySettings.load()
+        delays.configure(
+            delay_settings.enabled, delay_settings.min_factor, delay_settings.max_factor
+        )
+        profiler_settings = ProfilerSettings.load()
+        if profiler_settings.enabled:
+            profiler.enable(profiler_settings.directory)
+        capture_settings = CaptureSettings.load()
+        install_capture_backend(
+            create_capture_backend(capture_settings.mode, capture_settings.directory)
+        )
+
         self.ark_settings = UserSettings.load()
         self.validate_game_settings(self.ark_settings)
 
@@ -55,10 +93,43 @@ class GachaBot:
         with open("settings/settings.json") as f:
             self.player = Player(**json.load(f)["player"])
 
+        vision_settings = VisionSettings.load()
+        if vision_settings.frame_cache_ttl > 0:
+            install_frame_cache(vision_settings.frame_cache_ttl)
+        ocr_settings = OCRSettings.load()
+        ocr.configure(
+            ocr_settings.backend, ocr_settings.workers, ocr_settings.vote_frames
+        )
+        templates.install()
+        templates.preload(station_templates(), self.player.window)
+        crop_plot_settings = CropPlotSettings.load()
+        crop_plot_store.configure(
+            crop_plot_settings.persist, crop_plot_settings.max_age
+        )
+        ytrap_analytics.enabled = crop_plot_settings.analytics
+
         self.stations = self.create_stations()
+        self.scheduler = self.create_scheduler()
         print("Initialization successful.")
         self.hour_start = datetime.now()
 
+    def create_scheduler(self) -> Scheduler:
+        """Creates the scheduler to hand out the stations. In budget mode, a
+        Y-Trap station is only started if it is not expected to delay the next
+        timed station by more than the configured lateness budget."""
+        settings = SchedulerSettings.load()
+        if settings.ytrap_mode == "budget":
+            budget = settings.lateness_budget
+        else:
+            budget = None
+
+        return Scheduler(
+            self.stations,
+            sleep=self._idle,
+            filler_duration=YTrapStation.expected_duration,
+            lateness_budget=budget,
+        )
+
     def create_stations(self) -> list[Station | Iterable[YTrapStation]]:
         """Creates a list of the stations the gacha bot will run, the stations
         are ordered by 'priority', e.g the crystal station comes first, the
@@ -123,13 +194,19 @@ class GachaBot:
 
     def do_next_task(self) -> None:
         """Gacha bots main call method, call repeatedly to keep doing the
-        next task in line. Iterates over each station in our station list
-        and checks for the first one to be ready.
+        next task in line. The scheduler hands out the highest priority station
+        that is ready, which is put back into the schedule once completed.
         """
+        task = None
         try:
             task = self._find_next_task()
             print(f"Found next task: '{task.name}'")
-            task.complete()
+            inventory_models.reset()
+            with profiler.span(str(task)), sleep_accounting.station(
+                type(task).__name__
+            ):
+                task.complete()
+            delays.discard()
 
             if (datetime.now() - self.hour_start) > timedelta(hours=1):
                 self.post_total_statistics()
@@ -145,10 +222,15 @@ class GachaBot:
             print(f"Ran into a connection error!\n{e}")
 
         except Exception as e:
+            delays.discard()
             self.info_webhook.send_error(f"Station '{task}'", e)
             print(traceback.format_exc())
             self._unstuck()
 
+        finally:
+            if task is not None:
+                self.scheduler.reschedule(task)
+
     def post_total_statistics(self) -> None:
         runtime_diff = (datetime.now() - self.SESSION_START).total_seconds()
         total_runtime = tools.format_seconds(round(runtime_diff))
@@ -167,6 +249,11 @@ class GachaBot:
         )
         embed.add_field(name="Laps completed:", value=YTrapStation.lap - 1)
 
+        next_timer = Station.timers.next_due()
+        if next_timer is not None:
+            name, ready_at = next_timer
+            embed.add_field(name="Next timer:", value=f"{name} at {ready_at:%H:%M}")
+
         for statistic, amount in Station.statistics.items():
             if not amount:
                 continue
@@ -181,6 +268,73 @@ class GachaBot:
         for _ in range(missing if missing != 3 else 0):
             embed.add_field(name="\u200b", value="\u200b")
 
+        if isinstance(self.player.window, FrameCache):
+            cache = self.player.window
+            embed.add_field(
+                name="Frame cache:",
+                value=f"{cache.hits} hits, {cache.misses} misses "
+                f"({round(cache.hit_rate * 100)}%)",
+                inline=False,
+            )
+
+        dust_yields = "\n".join(
+            f"{bed}: {stats}"
+            for bed, stats in CrystalStation.dust_yields.items()
+            if stats.count
+        )
+        if dust_yields:
+            embed.add_field(
+                name="Dust per pickup:", value=dust_yields[:1024], inline=False
+            )
+
+        if YTrapStation.tower.plots:
+            embed.add_field(
+                name="Y-Trap crop plots:", value=str(YTrapStation.tower), inline=False
+            )
+
+        inventory_reads = inventory_models.report()
+        if inventory_reads:
+            embed.add_field(
+                name="Inventory model:", value=inventory_reads, inline=False
+            )
+
+        ocr_latency = ocr.report()
+        if ocr_latency:
+            embed.add_field(name="OCR:", value=ocr_latency, inline=False)
+
+        workers = "\n".join(
+            report
+            for report in (tools.input_worker.report(), tools.io_worker.report())
+            if report
+        )
+        if workers:
+            embed.add_field(name="Workers:", value=workers, inline=False)
+
+        waits = "\n".join(
+            f"{name}: {histogram}" for name, histogram in tools.wait_times.items()
+        )
+        if waits:
+            embed.add_field(name="Waits:", value=waits[:1024], inline=False)
+
+        sleep_shares, sleep_sites = sleep_accounting.report()
+        if sleep_shares:
+            embed.add_field(
+                name="Time spent sleeping:", value=sleep_shares[:1024], inline=False
+            )
+        if sleep_sites:
+            embed.add_field(
+                name="Longest sleeps:", value=sleep_sites[:1024], inline=False
+            )
+
+        lateness = "\n".join(
+            f"{station}: {histogram}"
+            for station, histogram in self.scheduler.lateness.items()
+        )
+        if lateness:
+            embed.add_field(
+                name="Station lateness:", value=lateness[:1024], inline=False
+            )
+
         embed.set_thumbnail(
             url="https://static.wikia.nocookie.net/arksurvivalevolved_gamepedia/images/b/b1/Element_Dust.png/revision/latest/scale-to-width-down/228?cb=20181107161643"
         )
@@ -197,15 +351,18 @@ class GachaBot:
         )
 
     def _find_next_task(self) -> Station:
-        for station in self.stations:
-            if isinstance(station, Station):
-                if station.is_ready():
-                    return station
-
-            elif isinstance(station, itertools.cycle):
-                return next(station)
-
-        raise LookupError("Could not find a ready station!")
+        return self.scheduler.next_task()
+
+    def _idle(self, seconds: float) -> None:
+        """Waits for the next station in small steps, so that pausing or
+        terminating the bot still takes effect right away. Stops waiting early
+        when a station timer was set in the meantime."""
+        Station.timers.wake_up.clear()
+        end = time.time() + seconds
+        while (remaining := end - time.time()) > 0:
+            if Station.timers.wake_up.is_set():
+                return
+            self.player.sleep(min(1, remaining))
 
     def start(self) -> None:
         try:
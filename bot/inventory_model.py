@@ -0,0 +1,272 @@
+from typing import Callable, Iterable, Optional
+
+from ark import Inventory, PlayerInventory
+from ark.items import Item
+
+
+class InventoryModel:
+    """The amount of stacks of each item a container is believed to hold,
+    kept up to date by the operations the bot performs on the container so
+    that its contents do not have to be read from the screen after each step.
+
+    Reads go through `count` and `has`, which answer from the model when it
+    knows the item and only read the screen when it does not, or once the
+    model answered `RECONCILE_EVERY` reads since it was last compared to the
+    screen. A read that disagrees with the model means that something the
+    model does not know of happened, the rest of the model is dropped then.
+
+    Parameters
+    ----------
+    name :class:`str`:
+        The name of the container, for the reports
+    """
+
+    RECONCILE_EVERY = 4
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.stacks: dict[Item, int] = {}
+        # whether items missing from `stacks` are known not to be there
+        self.complete = False
+        # the item the inventory is searched for, only it is shown and moved
+        # by the transfer and drop all buttons
+        self.searched: Optional[Item] = None
+
+        self.reads = 0
+        self.skipped = 0
+        self.mismatches = 0
+        self._answered = 0
+
+    def __repr__(self) -> str:
+        return f"InventoryModel({self.name!r}, {self.stacks}, complete={self.complete})"
+
+    def known(self, item: Item) -> Optional[int]:
+        """The stacks of the item the model believes there are, `None` if
+        the model does not know."""
+        if item in self.stacks:
+            return self.stacks[item]
+        return 0 if self.complete else None
+
+    def due(self, item: Item) -> bool:
+        """Whether the item has to be read from the screen, because the model
+        does not know it or is due to be reconciled."""
+        return self.known(item) is None or self._answered >= self.RECONCILE_EVERY
+
+    def count(self, item: Item, read: Callable[[], int]) -> int:
+        """Returns the stacks of the item, reading them with the given function
+        only if the model does not know or is due to be reconciled."""
+        if self.due(item):
+            return self.reconcile(item, read())
+        return self._answer(item)
+
+    def has(self, item: Item, read: Callable[[], bool]) -> bool:
+        """Returns whether the container has the item, reading it with the
+        given function only if the model does not know or is due to be
+        reconciled."""
+        if not self.due(item):
+            return self._answer(item) > 0
+
+        expected = self.known(item)
+        found = read()
+        self.reads += 1
+        self._answered = 0
+        if expected is not None and found != (expected > 0):
+            self._diverged(item, expected, "some" if found else "none")
+        if not found:
+            self.stacks[item] = 0
+        elif not expected:
+            # there is some of it, but the amount is unknown
+            self.stacks.pop(item, None)
+        return found
+
+    def reconcile(self, item: Item, stacks: int) -> int:
+        """Sets the stacks of the item to those read from the screen."""
+        self.reads += 1
+        self._answered = 0
+        expected = self.known(item)
+        if expected is not None and expected != stacks:
+            self._diverged(item, expected, stacks)
+        self.stacks[item] = stacks
+        return stacks
+
+    def add(self, item: Item, stacks: Optional[int]) -> None:
+        """Adds the stacks of the item, forgets the item if either amount is
+        unknown."""
+        expected = self.known(item)
+        if expected is None or stacks is None:
+            self.forget(item)
+        else:
+            self.stacks[item] = expected + stacks
+
+    def remove(self, item: Item, stacks: int) -> None:
+        """Removes up to the given stacks of the item."""
+        expected = self.known(item)
+        if expected is not None:
+            self.stacks[item] = max(0, expected - stacks)
+
+    def clear(self, items: Optional[Iterable[Item]] = None) -> None:
+        """Empties the container of the given items, or of everything."""
+        if items is None:
+            self.stacks.clear()
+            self.complete = True
+            return
+
+        for item in items:
+            self.stacks[item] = 0
+
+    def forget(self, item: Optional[Item] = None) -> None:
+        """Forgets what is known about the item, or about everything, for
+        when something happened to the container the model can not follow."""
+        if item is None:
+            self.stacks.clear()
+            self.complete = False
+            self.searched = None
+        else:
+            self.stacks.pop(item, None)
+            if self.complete:
+                # the item may be there now, so nothing else is certain either
+                self.complete = False
+
+    def shown(self, items: Optional[Iterable[Item]]) -> Optional[list[Item]]:
+        """The items a transfer or drop of the given items, or of everything,
+        affects, `None` for everything."""
+        if items is not None:
+            return list(items)
+        return None if self.searched is None else [self.searched]
+
+    def _answer(self, item: Item) -> int:
+        self._answered += 1
+        self.skipped += 1
+        return self.known(item)  # type: ignore[return-value]
+
+    def _diverged(self, item: Item, expected: int, found: int | str) -> None:
+        print(
+            f"{self.name} inventory model expected {expected} stacks of "
+            f"{item.name}, read {found}. Dropping the model."
+        )
+        self.mismatches += 1
+        self.stacks.clear()
+        self.complete = False
+
+
+class InventoryModels:
+    """The model of each container the bot works with. The models are reset
+    whenever a station is started, as the bot can not follow what happens to
+    the containers in between.
+
+    The operations that change what a container holds or shows are made
+    through the models, so that each of them is kept up to date."""
+
+    # the slots in a row of an inventory
+    ROW = 6
+
+    def __init__(self) -> None:
+        self._models: dict[int, InventoryModel] = {}
+
+    def __getitem__(self, inventory: Inventory) -> InventoryModel:
+        key = id(inventory)
+        if key not in self._models:
+            self._models[key] = InventoryModel(inventory._name)
+        return self._models[key]
+
+    def count(self, inventory: Inventory, item: Item) -> int:
+        """The stacks of the item in the inventory, see `InventoryModel.count`."""
+        return self[inventory].count(item, lambda: inventory.count(item))
+
+    def has(self, inventory: Inventory, item: Item) -> bool:
+        """Whether the inventory has the item, see `InventoryModel.has`."""
+        return self[inventory].has(item, lambda: inventory.has(item))
+
+    def search(self, inventory: Inventory, item: Item) -> None:
+        """Searches the inventory for the item."""
+        inventory.search(item)
+        self[inventory].searched = item
+
+    def transfer_all(
+        self,
+        source: Inventory,
+        target: Inventory,
+        items: Optional[Item | list[Item]] = None,
+    ) -> None:
+        """Transfers all of the items, or everything shown, from the source
+        into the target inventory. Assumes the target has the room for them,
+        which the next reconcile catches if not."""
+        if isinstance(items, Item):
+            items = [items]
+        if items is None:
+            source.transfer_all()
+        else:
+            source.transfer_all(items)
+
+        model, target_model = self[source], self[target]
+        shown = model.shown(items)
+        if shown is None:
+            if model.complete:
+                for item, stacks in model.stacks.items():
+                    target_model.add(item, stacks)
+            else:
+                target_model.forget()
+            model.clear()
+        else:
+            for item in shown:
+                target_model.add(item, model.known(item))
+            model.clear(shown)
+        if items:
+            # ark searches for each of the items to transfer them
+            model.searched = items[-1]
+
+    def transfer_top_row(
+        self, inventory: PlayerInventory, target: Inventory, item: Item
+    ) -> None:
+        """Transfers the top row of the player inventory, which is searched for
+        the item, into the target inventory."""
+        inventory.transfer_top_row(0.2)
+        stacks = self[inventory].known(item)
+        self[inventory].remove(item, self.ROW)
+        self[target].add(item, None if stacks is None else min(stacks, self.ROW))
+
+    def drop_all(
+        self, inventory: Inventory, items: Optional[list[Item]] = None
+    ) -> None:
+        """Drops all of the items, or everything shown, from the inventory."""
+        if items is None:
+            inventory.drop_all()
+        else:
+            inventory.drop_all(items)
+
+        model = self[inventory]
+        shown = model.shown(items)
+        model.clear(shown)
+        if items:
+            model.searched = items[-1]
+
+    def drop(self, inventory: Inventory, item: Item) -> None:
+        """Drops a stack of the item from the inventory."""
+        inventory.drop(item)
+        self[inventory].remove(item, 1)
+        self[inventory].searched = item
+
+    def reset(self) -> None:
+        """Forgets the contents of all containers, keeping their statistics."""
+        for model in self._models.values():
+            model.forget()
+
+    def report(self) -> str:
+        """Returns how many reads were answered by the models since the last
+        report, an empty string if there were none."""
+        reads = skipped = mismatches = 0
+        for model in self._models.values():
+            reads += model.reads
+            skipped += model.skipped
+            mismatches += model.mismatches
+            model.reads = model.skipped = model.mismatches = 0
+
+        if not reads + skipped:
+            return ""
+        return (
+            f"{skipped} of {reads + skipped} inventory reads answered by the "
+            f"model, {mismatches} mismatches"
+        )
+
+
+inventory_models = InventoryModels()
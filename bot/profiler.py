@@ -0,0 +1,106 @@
+import contextlib
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Profiler:
+    """Records nested timing spans of the stations and their steps. Disabled
+    until `enable` is called, in which case a span costs a single check.
+
+    Each finished span is streamed to a trace file in the chrome trace event
+    format (load it in chrome://tracing or https://ui.perfetto.dev), the time
+    spent in each stack of spans is kept in the collapsed stack format used by
+    flamegraph tools and written next to it whenever a top level span ends.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._trace: Optional[Any] = None
+        self._collapsed_path = ""
+        self._collapsed: dict[str, float] = {}
+        self._start = time.perf_counter()
+
+    def enable(self, directory: str) -> None:
+        """Starts recording spans into a new trace in the given directory."""
+        os.makedirs(directory, exist_ok=True)
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+
+        self._trace = open(os.path.join(directory, f"trace_{stamp}.json"), "w")
+        self._trace.write("[\n")
+        self._collapsed_path = os.path.join(directory, f"collapsed_{stamp}.txt")
+        self.enabled = True
+        print(f"Profiling enabled, writing traces to '{directory}'.")
+
+    @contextlib.contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Times the enclosed block as a span nested in the current span."""
+        if not self.enabled:
+            yield
+            return
+
+        stack: list[list] = self._local.__dict__.setdefault("stack", [])
+        # each frame holds the name and the time spent in child spans
+        stack.append([name, 0.0])
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            path = ";".join(frame[0] for frame in stack)
+            _, children = stack.pop()
+            if stack:
+                stack[-1][1] += duration
+
+            self._record(name, path, start, duration, duration - children)
+            if not stack:
+                self._write_collapsed()
+
+    def _record(
+        self, name: str, path: str, start: float, duration: float, own: float
+    ) -> None:
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": round((start - self._start) * 1e6),
+            "dur": round(duration * 1e6),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        with self._lock:
+            self._collapsed[path] = self._collapsed.get(path, 0) + own
+            assert self._trace is not None
+            self._trace.write(json.dumps(event, separators=(",", ":")) + ",\n")
+            self._trace.flush()
+
+    def _write_collapsed(self) -> None:
+        """Writes the time spent in each stack in milliseconds."""
+        with self._lock:
+            lines = [
+                f"{path} {round(seconds * 1000)}\n"
+                for path, seconds in self._collapsed.items()
+            ]
+        with open(self._collapsed_path, "w") as f:
+            f.writelines(lines)
+
+
+profiler = Profiler()
+
+
+def profiled(func: F) -> F:
+    """Decorator to time each call of the function as a span of its name."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with profiler.span(func.__name__):
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
@@ -9,6 +9,7 @@ from ark import (ArkWindow, Console, EscapeMenu, MainMenu, Player, Server,
                  SessionList, exceptions)
 from ark.server import server_query
 
+from .vision import grab_thumbnail
 from .webhooks import InfoWebhook
 
 
@@ -82,8 +83,8 @@ class Unstucking:
         if self._server.status == "Down":
             self.webhook.send_error(
                 "Unstucking",
-                self.screen.grab_screen((0, 0, 1920, 1080)),
                 ConnectionError(f"{self._server.name} has crashed!"),
+                grab_thumbnail(self.screen),
                 mention=True,
             )
 
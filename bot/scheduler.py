@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import time
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Optional, Protocol
+
+
+class Schedulable(Protocol):
+    """Anything the scheduler can hand out as a task."""
+
+    def ready_at(self) -> Optional[datetime]:
+        ...
+
+
+class LatenessHistogram:
+    """Counts how late a station was started after it became ready, bucketed
+    by the upper bound (in seconds) of each bucket."""
+
+    BUCKETS = (5, 15, 30, 60, 120, 300)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def __str__(self) -> str:
+        labels = [f"<{b}s" for b in self.BUCKETS] + [f">{self.BUCKETS[-1]}s"]
+        buckets = ", ".join(
+            f"{label}: {count}" for label, count in zip(labels, self.counts) if count
+        )
+        return f"avg {round(self.mean)}s, max {round(self.max)}s ({buckets})"
+
+    @property
+    def mean(self) -> float:
+        return self.total / len(self) if len(self) else 0
+
+    def add(self, seconds: float) -> None:
+        seconds = max(0, seconds)
+        self.counts[bisect.bisect_left(self.BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+class Scheduler:
+    """Keeps track of when each station is going to be ready next so that
+    the gacha bot does not have to ask every station on every loop.
+
+    Stations that know when they will be ready (interval stations, or the
+    timed steps of the ARB, grinding and medbrew stations) are kept in a
+    min-heap keyed on that time. Once their time has come they are moved into
+    a second heap keyed on their priority, so the order of the station list
+    still decides which of multiple ready stations goes first.
+
+    Stations that can not tell when they will be ready, for example the ARB
+    station waiting for the crystal station to deposit wood, return `None`
+    and are re-checked whenever the next task is requested.
+
+    An iterator in the station list (the Y-Trap cycle) is used to fill the
+    gaps between the other stations. Without such a filler, the scheduler
+    sleeps until the earliest deadline instead of polling.
+
+    When a lateness budget is given, the filler is only started if it is
+    expected to finish no more than that many seconds after the next deadline,
+    otherwise the scheduler waits for the deadline. How late each station was
+    started after it became ready is recorded in `lateness` either way.
+
+    Parameters
+    ----------
+    stations :class:`Iterable[Station | Iterator[Station]]`:
+        The stations in order of priority
+
+    sleep :class:`Callable[[float], None]`:
+        The function to wait with when no station is ready
+
+    clock :class:`Callable[[], datetime]`:
+        The function returning the current time
+
+    filler_duration :class:`Optional[Callable[[], float]]`:
+        The function estimating how many seconds the next filler task takes
+
+    lateness_budget :class:`Optional[float]`:
+        How many seconds a filler task may delay the next deadline by, `None`
+        to always start the filler when no station is ready
+    """
+
+    MAX_IDLE = 60
+
+    def __init__(
+        self,
+        stations: Iterable[Schedulable | Iterator[Schedulable]],
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], datetime] = datetime.now,
+        filler_duration: Optional[Callable[[], float]] = None,
+        lateness_budget: Optional[float] = None,
+    ) -> None:
+        self._sleep = sleep
+        self._clock = clock
+        self._filler_duration = filler_duration
+        self._lateness_budget = lateness_budget
+        self.lateness: dict[str, LatenessHistogram] = {}
+
+        self._waiting: list[tuple[datetime, int, Schedulable]] = []
+        self._ready: list[tuple[int, datetime, Schedulable]] = []
+        self._unscheduled: dict[Schedulable, int] = {}
+        self._priorities: dict[Schedulable, int] = {}
+        self._filler: Optional[Iterator[Schedulable]] = None
+
+        for priority, station in enumerate(stations):
+            if isinstance(station, Iterator):
+                self._filler = station
+                continue
+
+            self._priorities[station] = priority
+            self.reschedule(station)
+
+    @property
+    def next_deadline(self) -> Optional[datetime]:
+        """The earliest time a currently scheduled station will be ready at."""
+        if self._ready:
+            return self._ready[0][1]
+        if self._waiting:
+            return self._waiting[0][0]
+        return None
+
+    def reschedule(self, station: Schedulable) -> None:
+        """Puts a station back into the schedule after it has been completed,
+        stations that did not come from the schedule are ignored."""
+        if station not in self._priorities:
+            return
+
+        priority = self._priorities[station]
+        ready_at = station.ready_at()
+        if ready_at is None:
+            self._unscheduled[station] = priority
+            return
+
+        self._unscheduled.pop(station, None)
+        heapq.heappush(self._waiting, (ready_at, priority, station))
+
+    def next_task(self) -> Schedulable:
+        """Returns the next station to complete.
+
+        The highest priority station that is ready is returned first, then
+        the filler station if it fits into the lateness budget. If there is
+        neither, it sleeps until the earliest deadline (capped at `MAX_IDLE`
+        seconds).
+
+        Raises
+        ------
+        `LookupError` if no station became ready while waiting.
+        """
+        station = self._pop_ready()
+        if station is not None:
+            return station
+
+        if self._filler is not None and self._filler_fits():
+            return next(self._filler)
+
+        deadline = self.next_deadline
+        if deadline is None:
+            wait = self.MAX_IDLE
+        else:
+            wait = min(self.MAX_IDLE, (deadline - self._clock()).total_seconds())
+
+        if wait > 0:
+            print(f"No station is ready, waiting {round(wait)} seconds...")
+            self._sleep(wait)
+
+        station = self._pop_ready()
+        if station is None:
+            raise LookupError("Could not find a ready station!")
+        return station
+
+    def _pop_ready(self) -> Optional[Schedulable]:
+        """Moves all stations whose time has come into the ready heap and
+        returns the one with the highest priority, if any."""
+        self._check_unscheduled()
+
+        now = self._clock()
+        while self._waiting and self._waiting[0][0] <= now:
+            ready_at, priority, station = heapq.heappop(self._waiting)
+            heapq.heappush(self._ready, (priority, ready_at, station))
+
+        if not self._ready:
+            return None
+
+        _, ready_at, station = heapq.heappop(self._ready)
+        histogram = self.lateness.setdefault(str(station), LatenessHistogram())
+        histogram.add((now - ready_at).total_seconds())
+        return station
+
+    def _filler_fits(self) -> bool:
+        """Checks whether the filler is expected to finish before the next
+        deadline has been missed by more than the lateness budget."""
+        if self._lateness_budget is None or self._filler_duration is None:
+            return True
+
+        deadline = self.next_deadline
+        if deadline is None:
+            return True
+
+        slack = (deadline - self._clock()).total_seconds()
+        return self._filler_duration() - slack <= self._lateness_budget
+
+    def _check_unscheduled(self) -> None:
+        """Asks the stations that could not tell when they are ready again."""
+        for station in sorted(self._unscheduled, key=self._unscheduled.__getitem__):
+            self.reschedule(station)
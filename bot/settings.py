@@ -19,4 +19,90 @@ class TowerSettings:
     def load() -> TowerSettings:
         with open("settings/settings.json") as f:
             data = json.load(f)["main"]
-        return dacite.from_dict(TowerSettings, data)
\ No newline at end of file
+        return dacite.from_dict(TowerSettings, data)
+
+
+@dataclass
+class SchedulerSettings:
+    ytrap_mode: Literal["fill", "budget"]
+    lateness_budget: int
+
+    @staticmethod
+    def load() -> SchedulerSettings:
+        with open("settings/settings.json") as f:
+            data = json.load(f)["scheduler"]
+        return dacite.from_dict(SchedulerSettings, data)
+
+
+@dataclass
+class ProfilerSettings:
+    enabled: bool
+    directory: str
+
+    @staticmethod
+    def load() -> ProfilerSettings:
+        with open("settings/settings.json") as f:
+            data = json.load(f)["profiler"]
+        return dacite.from_dict(ProfilerSettings, data)
+
+
+@dataclass
+class DelaySettings:
+    enabled: bool
+    min_factor: float
+    max_factor: float
+
+    @staticmethod
+    def load() -> DelaySettings:
+        with open("settings/settings.json") as f:
+            data = json.load(f)["delays"]
+        return dacite.from_dict(DelaySettings, data)
+
+
+@dataclass
+class VisionSettings:
+    frame_cache_ttl: float
+
+    @staticmethod
+    def load() -> VisionSettings:
+        with open("settings/settings.json") as f:
+            data = json.load(f)["vision"]
+        return dacite.from_dict(VisionSettings, data)
+
+
+@dataclass
+class OCRSettings:
+    backend: Literal["auto", "tesserocr", "pytesseract"]
+    workers: int
+    vote_frames: int
+
+    @staticmethod
+    def load() -> OCRSettings:
+        with open("settings/settings.json") as f:
+            data = json.load(f)["ocr"]
+        return dacite.from_dict(OCRSettings, data)
+
+
+@dataclass
+class CaptureSettings:
+    mode: Literal["live", "record", "replay"]
+    directory: str
+
+    @staticmethod
+    def load() -> CaptureSettings:
+        with open("settings/settings.json") as f:
+            data = json.load(f)["capture"]
+        return dacite.from_dict(CaptureSettings, data)
+
+
+@dataclass
+class CropPlotSettings:
+    persist: bool
+    max_age: int
+    analytics: bool
+
+    @staticmethod
+    def load() -> CropPlotSettings:
+        with open("settings/settings.json") as f:
+            data = json.load(f)["crop_plots"]
+        return dacite.from_dict(CropPlotSettings, data)
@@ -0,0 +1,3 @@
+from .clock import VirtualClock
+from .measurements import Distribution, Measurements
+from .simulator import SimulationResult, TowerSimulation
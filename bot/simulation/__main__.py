@@ -0,0 +1,37 @@
+"""Simulates the tower of a settings.json on a virtual clock.
+
+Usage: python -m bot.simulation [--settings PATH] [--hours N] [--measurements PATH]
+"""
+import argparse
+import json
+
+from .measurements import Measurements
+from .simulator import TowerSimulation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m bot.simulation",
+        description="Simulates the gacha tower to compare the throughput of settings.",
+    )
+    parser.add_argument("--settings", default="settings/settings.json")
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument(
+        "--measurements",
+        help="json file with measured durations and yields to override the defaults",
+    )
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    with open(args.settings) as f:
+        settings = json.load(f)
+
+    simulation = TowerSimulation(
+        settings, Measurements.load(args.measurements), seed=args.seed
+    )
+    print(simulation.run(args.hours, verbose=args.verbose))
+
+
+if __name__ == "__main__":
+    main()
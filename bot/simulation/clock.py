@@ -0,0 +1,28 @@
+from datetime import datetime, timedelta
+
+
+class VirtualClock:
+    """A clock that only moves forward when it is told to, so that hours of
+    tower operation can be simulated in a fraction of a second.
+
+    Parameters
+    ----------
+    start :class:`datetime`:
+        The time the clock starts at
+    """
+
+    def __init__(self, start: datetime = datetime(2023, 1, 1)) -> None:
+        self.start = start
+        self._now = start
+
+    @property
+    def elapsed(self) -> float:
+        """The amount of seconds that passed since the clock was started."""
+        return (self._now - self.start).total_seconds()
+
+    def now(self) -> datetime:
+        return self._now
+
+    def sleep(self, seconds: float) -> None:
+        """Advances the clock by the given amount of seconds."""
+        self._now += timedelta(seconds=max(0, seconds))
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import dacite
+
+DEFAULT_MEASUREMENTS = Path(__file__).parent / "measurements.json"
+
+
+@dataclass
+class Distribution:
+    """A normal distribution clipped to a lower bound, used for the durations
+    and yields of the simulated stations."""
+
+    mean: float
+    stdev: float = 0
+    minimum: float = 0
+
+    def sample(self, rng: random.Random) -> float:
+        return max(self.minimum, rng.gauss(self.mean, self.stdev))
+
+
+@dataclass
+class Measurements:
+    """Contains the measured durations and yields the simulation is based on.
+
+    Durations are in seconds and include spawning at the station, the crafting
+    and cooking timers of the ARB and medbrew stations are taken from the
+    stations themselves.
+    """
+
+    ytrap_duration: Distribution
+    ytraps_per_minute: Distribution
+    ytrap_max_traps: int
+
+    gacha_crystals_per_minute: float
+    gacha_traps_per_crystal: float
+    gacha_max_traps: int
+
+    crystal_duration: Distribution
+    dust_per_crystal: Distribution
+    wood_per_crystal: Distribution
+
+    feed_duration: Distribution
+    arb_duration: Distribution
+    arb_per_craft: Distribution
+    medbrew_duration: Distribution
+
+    @staticmethod
+    def load(path: Optional[str | Path] = None) -> Measurements:
+        """Loads the default measurements, updated with the measurements at the
+        given path so that only the measured values have to be provided."""
+        with open(DEFAULT_MEASUREMENTS) as f:
+            data: dict = json.load(f)
+
+        if path is not None:
+            with open(path) as f:
+                for k, v in json.load(f).items():
+                    if isinstance(v, dict):
+                        data[k] = {**data.get(k, {}), **v}
+                    else:
+                        data[k] = v
+
+        return dacite.from_dict(Measurements, data)
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import random
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Optional
+
+from .clock import VirtualClock
+from .measurements import Measurements
+
+
+class SimulatedGacha:
+    """A gacha that turns the Y-Traps it was fed into crystals over time.
+
+    Parameters
+    ----------
+    clock :class:`VirtualClock`:
+        The clock of the simulation
+
+    measurements :class:`Measurements`:
+        The measurements to take the crystal rate and capacities from
+    """
+
+    def __init__(self, clock: VirtualClock, measurements: Measurements) -> None:
+        self._clock = clock
+        self._measurements = measurements
+        self._last_update = clock.now()
+        self.traps = 0.0
+        self.crystals = 0.0
+
+    def add_traps(self, amount: float) -> None:
+        self._update()
+        self.traps = min(self.traps + amount, self._measurements.gacha_max_traps)
+
+    def collect(self) -> int:
+        """Takes the crystals the gacha produced since the last collection."""
+        self._update()
+        crystals = int(self.crystals)
+        self.crystals -= crystals
+        return crystals
+
+    def _update(self) -> None:
+        """Produces the crystals the gacha had the traps for since the last
+        update."""
+        minutes = (self._clock.now() - self._last_update).total_seconds() / 60
+        self._last_update = self._clock.now()
+
+        per_crystal = self._measurements.gacha_traps_per_crystal
+        crystals = min(
+            minutes * self._measurements.gacha_crystals_per_minute,
+            self.traps / per_crystal,
+        )
+        self.traps -= crystals * per_crystal
+        self.crystals += crystals
+
+
+class SimulatedStation(ABC):
+    """The base of the simulated stations, behaves like the `Station` base class
+    as far as the scheduler is concerned but completing it only advances the
+    clock by the sampled duration.
+
+    Parameters
+    ----------
+    name :class:`str`:
+        The name of the station
+
+    clock :class:`VirtualClock`:
+        The clock of the simulation
+
+    rng :class:`random.Random`:
+        The random generator to sample the measurements with
+
+    measurements :class:`Measurements`:
+        The measured durations and yields
+
+    statistics :class:`dict[str, float]`:
+        The statistics of the simulation to add the yields to
+
+    interval :class:`Optional[int]`:
+        The station interval in minutes
+    """
+
+    def __init__(
+        self,
+        name: str,
+        clock: VirtualClock,
+        rng: random.Random,
+        measurements: Measurements,
+        statistics: dict[str, float],
+        interval: Optional[int] = None,
+    ) -> None:
+        self._name = name
+        self._clock = clock
+        self._rng = rng
+        self._measurements = measurements
+        self.statistics = statistics
+        self.interval = interval
+        self.last_completed: Optional[datetime] = None
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__.removeprefix('Simulated')} {self._name}"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def ready_at(self) -> Optional[datetime]:
+        if self.last_completed is None or self.interval is None:
+            return self._clock.now()
+        return self.last_completed + timedelta(minutes=self.interval)
+
+    def complete(self) -> None:
+        self._clock.sleep(self.duration())
+        self.last_completed = self._clock.now()
+
+    @abstractmethod
+    def duration(self) -> float:
+        """Samples how many seconds completing the station takes."""
+        ...
+
+
+class SimulatedYTrapStation(SimulatedStation):
+    """Collects the Y-Traps that grew since the last visit and loads them into
+    the gacha of the station.
+
+    Parameters
+    ----------
+    gacha :class:`SimulatedGacha`:
+        The gacha the station loads
+
+    station_times :class:`list[float]`:
+        The durations of all Y-Trap stations, shared between the stations
+    """
+
+    def __init__(
+        self,
+        *args,
+        gacha: SimulatedGacha,
+        station_times: list[float],
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.gacha = gacha
+        self.station_times = station_times
+        self._last_visit = self._clock.now()
+
+    def complete(self) -> None:
+        duration = self.duration()
+        self._clock.sleep(duration)
+        self.station_times.append(duration)
+
+        minutes = (self._clock.now() - self._last_visit).total_seconds() / 60
+        self._last_visit = self._clock.now()
+        traps = min(
+            minutes * self._measurements.ytraps_per_minute.sample(self._rng),
+            self._measurements.ytrap_max_traps,
+        )
+        self.gacha.add_traps(traps)
+        self.statistics["Y-Traps"] = self.statistics.get("Y-Traps", 0) + traps
+
+    def duration(self) -> float:
+        return self._measurements.ytrap_duration.sample(self._rng)
+
+
+class SimulatedARBStation(SimulatedStation):
+    """Goes through the stages of the ARB station, the wood is added by the
+    first crystal station just like on the real tower."""
+
+    WOOD_REQUIRED = 29700
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.status = "Waiting for wood"
+        self.wood = 0.0
+        self._stage_started = self._clock.now()
+
+    def add_wood(self, wood: float) -> None:
+        self.wood += wood
+
+    def ready_at(self) -> Optional[datetime]:
+        if self.status == "Waiting for wood":
+            return self._clock.now() if self.wood >= self.WOOD_REQUIRED else None
+
+        if self.status == "Cooking wood":
+            return self._stage_started + timedelta(minutes=170)
+
+        if self.status == "Waiting for gunpowder":
+            return self._stage_started + timedelta(minutes=5)
+
+        return self._stage_started + timedelta(minutes=15)
+
+    def complete(self) -> None:
+        super().complete()
+        self._stage_started = self._clock.now()
+
+        if self.status == "Waiting for wood":
+            self.wood -= self.WOOD_REQUIRED
+            self.status = "Cooking wood"
+
+        elif self.status == "Cooking wood":
+            self.status = "Waiting for gunpowder"
+
+        elif self.status == "Waiting for gunpowder":
+            self.status = "Waiting for ARB"
+
+        else:
+            arb = self._measurements.arb_per_craft.sample(self._rng)
+            self.statistics["ARB"] = self.statistics.get("ARB", 0) + arb
+            self.status = "Waiting for wood"
+
+    def duration(self) -> float:
+        return self._measurements.arb_duration.sample(self._rng)
+
+
+class SimulatedCrystalStation(SimulatedStation):
+    """Collects the crystals of its gachas, the dust and wood they yield is
+    sampled per crystal.
+
+    Parameters
+    ----------
+    gachas :class:`list[SimulatedGacha]`:
+        The gachas the station collects the crystals of
+
+    arb_station :class:`Optional[SimulatedARBStation]`:
+        The arb station to add the wood to
+    """
+
+    def __init__(
+        self,
+        *args,
+        gachas: list[SimulatedGacha],
+        arb_station: Optional[SimulatedARBStation],
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.gachas = gachas
+        self._arb_station = arb_station
+
+    def complete(self) -> None:
+        super().complete()
+        crystals = sum(gacha.collect() for gacha in self.gachas)
+        dust = crystals * self._measurements.dust_per_crystal.sample(self._rng)
+        self.statistics["Element Dust"] = self.statistics.get("Element Dust", 0) + dust
+        self.statistics["Crystals"] = self.statistics.get("Crystals", 0) + crystals
+
+        if self._arb_station is not None:
+            wood = self._measurements.wood_per_crystal.sample(self._rng)
+            self._arb_station.add_wood(crystals * wood)
+
+    def duration(self) -> float:
+        return self._measurements.crystal_duration.sample(self._rng)
+
+
+class SimulatedFeedStation(SimulatedStation):
+    """A meat, berry or small meat feed station."""
+
+    def duration(self) -> float:
+        return self._measurements.feed_duration.sample(self._rng)
+
+
+class SimulatedMedbrewStation(SimulatedStation):
+    """Goes through the berry, narcotics and medbrew stages of the medbrew
+    station."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.status = "Waiting for berries"
+        self._stage_started = self._clock.now()
+
+    def ready_at(self) -> Optional[datetime]:
+        if self.status == "Waiting for berries":
+            if self.last_completed is None:
+                return self._clock.now()
+            return self.last_completed + timedelta(hours=5)
+
+        if self.status == "Crafting narcotics":
+            return self._stage_started + timedelta(minutes=3)
+
+        return self._stage_started + timedelta(minutes=17)
+
+    def complete(self) -> None:
+        self._clock.sleep(self.duration())
+        self._stage_started = self._clock.now()
+
+        if self.status == "Waiting for berries":
+            self.status = "Crafting narcotics"
+
+        elif self.status == "Crafting narcotics":
+            self.status = "Cooking medbrews"
+
+        else:
+            self.last_completed = self._clock.now()
+            self.status = "Waiting for berries"
+
+    def duration(self) -> float:
+        return self._measurements.medbrew_duration.sample(self._rng)
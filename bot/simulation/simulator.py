@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import contextlib
+import itertools
+import os
+import random
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from ..scheduler import LatenessHistogram, Scheduler
+from .clock import VirtualClock
+from .measurements import Measurements
+from .models import (
+    SimulatedARBStation,
+    SimulatedCrystalStation,
+    SimulatedFeedStation,
+    SimulatedGacha,
+    SimulatedMedbrewStation,
+    SimulatedStation,
+    SimulatedYTrapStation,
+)
+
+
+@dataclass
+class SimulationResult:
+    """The outcome of a simulation run."""
+
+    hours: float
+    statistics: dict[str, float]
+    completions: dict[str, int]
+    lateness: dict[str, LatenessHistogram]
+
+    @property
+    def dust_per_hour(self) -> int:
+        return round(self.statistics.get("Element Dust", 0) / self.hours)
+
+    @property
+    def ytraps_per_hour(self) -> int:
+        return round(self.statistics.get("Y-Traps", 0) / self.hours)
+
+    def __str__(self) -> str:
+        lines = [
+            f"Simulated hours: {self.hours}",
+            f"Dust per hour: {self.dust_per_hour:_}".replace("_", " "),
+            f"Y-Traps per hour: {self.ytraps_per_hour:_}".replace("_", " "),
+            f"ARB crafted: {round(self.statistics.get('ARB', 0)):_}".replace("_", " "),
+            "",
+            "Completions:",
+            *(f"  {station}: {amount}" for station, amount in self.completions.items()),
+            "",
+            "Station lateness:",
+            *(f"  {station}: {hist}" for station, hist in self.lateness.items()),
+        ]
+        return "\n".join(lines)
+
+
+class TowerSimulation:
+    """Simulates the gacha bot on a virtual clock, the stations are replaced
+    by models that take the durations and yields from the measurements.
+
+    The stations are created from the same settings and in the same order
+    as `GachaBot.create_stations` and handed out by the same `Scheduler`, so
+    the effect of changing the settings can be compared without running the
+    game. The grinding and healing stations are not simulated.
+
+    Parameters
+    ----------
+    settings :class:`dict`:
+        The contents of the settings.json to simulate the tower of
+
+    measurements :class:`Measurements`:
+        The measured durations and yields
+
+    seed :class:`Optional[int]`:
+        The seed for the random generator, to make runs reproducible
+    """
+
+    def __init__(
+        self, settings: dict, measurements: Measurements, seed: Optional[int] = None
+    ) -> None:
+        self.settings = settings
+        self.measurements = measurements
+        self.clock = VirtualClock()
+        self.rng = random.Random(seed)
+        self.statistics: dict[str, float] = {}
+        self.completions: dict[str, int] = {}
+        self.station_times: list[float] = []
+
+        self.stations = self.create_stations()
+        self.scheduler = self.create_scheduler()
+
+    def create_stations(self) -> list[SimulatedStation | Iterator[SimulatedStation]]:
+        base_args = (self.clock, self.rng, self.measurements, self.statistics)
+        settings = self.settings
+
+        ytrap: list[SimulatedYTrapStation] = []
+        if settings["ytrap"]["ytrap_enabled"]:
+            prefix = settings["ytrap"]["ytrap_prefix"]
+            ytrap = [
+                SimulatedYTrapStation(
+                    f"{prefix}{i:02d}",
+                    *base_args,
+                    gacha=SimulatedGacha(self.clock, self.measurements),
+                    station_times=self.station_times,
+                )
+                for i in range(settings["ytrap"]["ytrap_beds"])
+            ]
+
+        arb = None
+        if settings["arb"]["arb_enabled"]:
+            arb = SimulatedARBStation("ARB", *base_args)
+
+        crystal_settings = settings["crystal"]
+        crystal_beds = crystal_settings["crystal_beds"]
+        crystal = [
+            SimulatedCrystalStation(
+                f"{crystal_settings['crystal_prefix']}{i:02d}",
+                *base_args,
+                interval=crystal_settings["crystal_interval"],
+                gachas=[station.gacha for station in ytrap[i::crystal_beds]],
+                arb_station=None if i else arb,
+            )
+            for i in range(crystal_beds)
+        ]
+
+        medbrew: list[SimulatedStation] = []
+        if settings["medbrew"]["medbrew_enabled"]:
+            medbrew = [
+                SimulatedMedbrewStation(
+                    f"{settings['medbrew']['medbrew_prefix']}{i:02d}", *base_args
+                )
+                for i in range(settings["medbrew"]["medbrew_beds"])
+            ]
+
+        stations: list[SimulatedStation | Iterator[SimulatedStation]] = [*crystal]
+        if arb is not None:
+            stations.append(arb)
+        stations.extend(medbrew)
+
+        for key in ("meat", "berry", "small_meat"):
+            feed = settings[key]
+            if not feed[f"{key}_enabled"]:
+                continue
+            stations.extend(
+                SimulatedFeedStation(
+                    f"{feed[f'{key}_prefix']}{i:02d}",
+                    *base_args,
+                    interval=feed[f"{key}_interval"],
+                )
+                for i in range(feed[f"{key}_beds"])
+            )
+
+        if ytrap:
+            stations.append(itertools.cycle(ytrap))
+        return stations
+
+    def create_scheduler(self) -> Scheduler:
+        settings = self.settings.get(
+            "scheduler", {"ytrap_mode": "fill", "lateness_budget": 0}
+        )
+        if settings["ytrap_mode"] == "budget":
+            budget = settings["lateness_budget"]
+        else:
+            budget = None
+
+        return Scheduler(
+            self.stations,
+            sleep=self.clock.sleep,
+            clock=self.clock.now,
+            filler_duration=self.expected_ytrap_duration,
+            lateness_budget=budget,
+        )
+
+    def expected_ytrap_duration(self) -> float:
+        """Estimates the duration of the next Y-Trap station the same way as
+        `YTrapStation.expected_duration`."""
+        recent = sorted(self.station_times[-20:])
+        if not recent:
+            return self.measurements.ytrap_duration.mean
+        return recent[min(len(recent) - 1, int(len(recent) * 0.9))]
+
+    def run(self, hours: float, verbose: bool = False) -> SimulationResult:
+        """Runs the simulation for the given amount of hours.
+
+        Parameters
+        ----------
+        hours :class:`float`:
+            The amount of hours of tower operation to simulate
+
+        verbose :class:`bool`:
+            Whether to print the output of the scheduler
+        """
+        with contextlib.ExitStack() as stack:
+            if not verbose:
+                devnull = stack.enter_context(open(os.devnull, "w"))
+                stack.enter_context(contextlib.redirect_stdout(devnull))
+
+            while self.clock.elapsed < hours * 3600:
+                try:
+                    task = self.scheduler.next_task()
+                except LookupError:
+                    continue
+
+                task.complete()
+                self.scheduler.reschedule(task)
+
+                kind = str(task).split()[0]
+                self.completions[kind] = self.completions.get(kind, 0) + 1
+
+        return SimulationResult(
+            hours,
+            dict(self.statistics),
+            dict(self.completions),
+            self.scheduler.lateness,
+        )
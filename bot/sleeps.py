@@ -0,0 +1,124 @@
+import contextlib
+import os
+import sys
+import threading
+import time
+from typing import Iterator, Optional
+
+import ark
+from ark import Ark
+
+_ARK_DIR = os.path.dirname(ark.__file__)
+
+
+def call_site(skipped: tuple[str, ...]) -> str:
+    """Returns the first calling frame outside of the given directories and
+    this module as "file:line (function)"."""
+    frame = sys._getframe(1)
+    while frame is not None and (
+        frame.f_code.co_filename.startswith(skipped)
+        or frame.f_code.co_filename == __file__
+    ):
+        frame = frame.f_back  # type: ignore[assignment]
+
+    if frame is None:
+        return "unknown"
+    filename = os.path.basename(frame.f_code.co_filename)
+    return f"{filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+
+class SleepAccounting:
+    """Tags every `Ark.sleep` call (which all player, structure and inventory
+    delays go through) with the station being completed and the line of bot
+    code it came from, so that the time a station spends waiting can be told
+    apart from the time it spends on input and vision.
+
+    Sleeps inside of ark are attributed to the first caller outside of ark,
+    for example a `turn_x_by(..., delay=1)` counts towards the line of the
+    station that turned. The totals are kept per hour and reset once reported.
+    """
+
+    def __init__(self) -> None:
+        self._thread: Optional[threading.Thread] = None
+        self._station: Optional[str] = None
+        self._installed = False
+
+        self.slept: dict[str, float] = {}
+        self.totals: dict[str, float] = {}
+        self.sites: dict[str, list] = {}
+
+    def install(self) -> None:
+        """Wraps `Ark.sleep` to record each sleep, only done once."""
+        if self._installed:
+            return
+
+        original = Ark.sleep
+
+        def sleep(ark_self: Ark, duration: int | float) -> None:
+            start = time.perf_counter()
+            try:
+                original(ark_self, duration)
+            finally:
+                self._record(time.perf_counter() - start)
+
+        Ark.sleep = sleep  # type: ignore[method-assign]
+        self._installed = True
+
+    @property
+    def current_station(self) -> Optional[str]:
+        """The station being completed, if called from the thread completing it."""
+        if threading.current_thread() is not self._thread:
+            return None
+        return self._station
+
+    @contextlib.contextmanager
+    def station(self, name: str) -> Iterator[None]:
+        """Attributes the sleeps of the current thread within the block to
+        the given station and adds the time taken to its total."""
+        self._thread = threading.current_thread()
+        self._station = name
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] = self.totals.get(name, 0) + time.perf_counter() - start
+            self._station = None
+
+    def report(self) -> tuple[str, str]:
+        """Returns the share of time each station slept and the call sites
+        that slept the longest, then starts a new hour."""
+        shares = []
+        for station, total in sorted(
+            self.totals.items(), key=lambda item: item[1], reverse=True
+        ):
+            slept = self.slept.get(station, 0)
+            shares.append(
+                f"{station}: slept {round(slept)}s, active {round(total - slept)}s "
+                f"({round(slept / max(total, 1) * 100)}% sleeping)"
+            )
+
+        sites = "\n".join(
+            f"{site}: {round(seconds)}s in {calls} calls"
+            for site, (seconds, calls) in sorted(
+                self.sites.items(), key=lambda item: item[1][0], reverse=True
+            )[:5]
+        )
+
+        self.slept.clear()
+        self.totals.clear()
+        self.sites.clear()
+        return "\n".join(shares), sites
+
+    def _record(self, duration: float) -> None:
+        if self._station is None or threading.current_thread() is not self._thread:
+            return
+
+        self.slept[self._station] = self.slept.get(self._station, 0) + duration
+        site = self.sites.setdefault(
+            f"{self._station} @ {call_site((_ARK_DIR,))}", [0, 0]
+        )
+        site[0] += duration
+        site[1] += 1
+
+
+sleep_accounting = SleepAccounting()
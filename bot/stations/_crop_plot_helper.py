@@ -1,7 +1,9 @@
 from typing import Optional
 from ark import Player, TekCropPlot, exceptions, items
 
-from ..tools import threaded
+from ..delays import delays
+from ..tools import input_worker, run_on
+from ._crop_plot_tracker import CropPlotTracker
 
 
 def do_crop_plot_stack(
@@ -13,15 +15,17 @@ def do_crop_plot_stack(
     *,
     refill: bool,
     precise: bool,
-    delay: float = 0.3
+    delay: float = 0.3,
+    tracker: Optional[CropPlotTracker] = None
 ) -> None:
-    """Empties a stack of crop plots."""
+    """Empties a stack of crop plots, updating the tracker with the contents
+    of each crop plot if one is given."""
 
-    @threaded("Standing up")
+    @run_on(input_worker)
     def stand_up() -> None:
         player.stand_up()
 
-    @threaded("Crouching")
+    @run_on(input_worker)
     def crouch() -> None:
         player.crouch()
 
@@ -33,19 +37,35 @@ def do_crop_plot_stack(
     player.sleep(0.3)
     
     fails = 0
+    standing = None
     for idx, (turn_value, crop_plot) in enumerate(zip(turns, stack)):
         if idx == 6:
-            stand_up()
-
-        player.turn_y_by(turn_value, delay=0.3)
-        if not take_and_refill(
-            player, crop_plot, item, dead, refill=refill, precise=precise
-        ):
+            standing = stand_up()
+
+        player.turn_y_by(turn_value, delay=delays.get("crop plot turn", 0.3))
+        accessed = take_and_refill(
+            player,
+            crop_plot,
+            item,
+            dead,
+            refill=refill,
+            precise=precise,
+            tracker=tracker,
+        )
+        delays.report("crop plot turn", accessed)
+        delays.resolve(accessed, "crop plot delay")
+
+        if not accessed:
             fails += 1
             if fails >= 2:
                 raise exceptions.InventoryNotAccessibleError(crop_plot.inventory)
 
-        player.sleep(delay)
+        player.sleep(delays.get("crop plot delay", delay))
+        delays.expect("crop plot delay")
+
+    # do not start turning to the next stack while still standing up
+    if standing is not None:
+        standing.result()
         
 def take_and_refill(
     player: Player,
@@ -54,7 +74,8 @@ def take_and_refill(
     dead: list[TekCropPlot],
     *,
     refill: bool,
-    precise: bool
+    precise: bool,
+    tracker: Optional[CropPlotTracker] = None
 ) -> bool:
     """Takes ytraps out of a crop plot, then puts pellets in if
     we need to refill them. Skips taking or transferring if there
@@ -69,21 +90,35 @@ def take_and_refill(
         crop_plot.action_wheel.deactivate()
         return False
 
-    if not crop_plot.inventory.has(items.YTRAP_SEED):
+    seeded = crop_plot.inventory.has(items.YTRAP_SEED)
+    if not seeded:
         dead.append(crop_plot)
 
     crop_plot.inventory.set_content(items.PELLET)
+    pellets = crop_plot.inventory.contents.get(items.PELLET.name, 0)
+    if tracker is not None:
+        tracker.set_seeded(crop_plot, seeded)
+        tracker.set_pellets(crop_plot, pellets)
 
+    harvested = False
     if items_to_take:
         for item in items_to_take:
             if not crop_plot.inventory.has(item):
                 continue
+            harvested = True
             crop_plot.inventory.transfer_all(item, delete_search=False)
 
+    added = 0
     if refill:
         player.inventory.transfer_all()
         player.click_with_delay(0.2)
         crop_plot.inventory.set_content(items.PELLET)
+        added = crop_plot.inventory.contents.get(items.PELLET.name, 0) - pellets
+        if tracker is not None:
+            tracker.set_pellets(crop_plot, pellets + added)
+
+    if tracker is not None:
+        tracker.set_harvest(crop_plot, harvested, max(0, added))
 
     crop_plot.close()
     return True
@@ -0,0 +1,106 @@
+import json
+import os
+import time
+from typing import Optional
+
+from ark import TekCropPlot, items
+
+from ._crop_plot_tracker import CropPlotTracker
+
+
+class CropPlotStore:
+    """Persists what is known about the crop plots of each station, so that
+    a restarted bot can decide whether a station needs a refill on its very
+    first lap instead of having to complete every station once first.
+
+    Each station is stored as the time it was last visited and the pellets
+    and seed of each of its crop plots, in the order the crop plots are
+    visited in. The crop plots have kept consuming pellets since, so the
+    restored pellets are reduced by how old they are, down to none at
+    `max_age` minutes. A station that was last visited longer ago than that
+    is not restored at all.
+
+    Parameters
+    ----------
+    path :class:`str`:
+        The path to persist the crop plots at
+    """
+
+    def __init__(self, path: str = "bot/_data/crop_plots.json") -> None:
+        self._path = path
+        self._stations: Optional[dict[str, dict]] = None
+
+        self.enabled = False
+        self.max_age = 60
+
+    def configure(self, enabled: bool, max_age: int) -> None:
+        self.enabled = enabled
+        self.max_age = max_age
+
+    def restore(
+        self, station: str, plots: list[TekCropPlot], tracker: CropPlotTracker
+    ) -> bool:
+        """Restores the stored pellets and seeds of the station's crop plots
+        into the tracker, aged as of now. Call it right before deciding on a
+        refill, rather than when the bot starts. Returns whether the station
+        could be restored, which is not the case if it is unknown, stale or its
+        crop plots changed."""
+        if not self.enabled:
+            return False
+
+        data = self._load().get(station)
+        if data is None or len(data["pellets"]) != len(plots):
+            return False
+
+        age = (time.time() - data["visited"]) / 60
+        if age >= self.max_age:
+            print(f"Not restoring {station}, last visited {round(age)} minutes ago.")
+            return False
+
+        # rather underestimate the pellets left, a refill too many costs less
+        # than crop plots running dry
+        remaining = 1 - age / self.max_age
+        for plot, pellets, seeded in zip(plots, data["pellets"], data["seeded"]):
+            if pellets is not None:
+                pellets = int(pellets * remaining)
+                plot.inventory.set_content(items.PELLET, pellets)
+                tracker.set_pellets(plot, pellets)
+            if seeded is not None:
+                tracker.set_seeded(plot, seeded)
+        return True
+
+    def save(
+        self, station: str, plots: list[TekCropPlot], tracker: CropPlotTracker
+    ) -> None:
+        """Stores the pellets and seeds the tracker knows of the station's
+        crop plots as of now."""
+        if not self.enabled:
+            return
+
+        stations = self._load()
+        stations[station] = {
+            "visited": round(time.time()),
+            "pellets": [tracker.pellets_of(plot) for plot in plots],
+            "seeded": [tracker.seeded_of(plot) for plot in plots],
+        }
+        self._save()
+
+    def _load(self) -> dict[str, dict]:
+        if self._stations is not None:
+            return self._stations
+
+        try:
+            with open(self._path) as f:
+                self._stations = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._stations = {}
+        return self._stations
+
+    def _save(self) -> None:
+        # replace the file in one go so a crash can not leave half of it behind
+        with open(f"{self._path}.tmp", "w") as f:
+            json.dump(self._load(), f, separators=(",", ":"))
+        os.replace(f"{self._path}.tmp", self._path)
+
+
+crop_plot_store = CropPlotStore()
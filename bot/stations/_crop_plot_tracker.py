@@ -0,0 +1,100 @@
+from typing import Iterable, Optional
+
+from ark import TekCropPlot
+
+
+class CropPlotTracker:
+    """Keeps running totals of the pellets, dead and seeded crop plots of a
+    station, updated one crop plot at a time as their contents are read, so
+    that the coverage can be read without going over every crop plot.
+
+    The totals of a tracker are also added to its parent, if it has one, so
+    that the totals of the whole tower are kept up to date just the same.
+
+    Parameters
+    ----------
+    plots :class:`Iterable[TekCropPlot]`:
+        The crop plots to keep track of
+
+    parent :class:`CropPlotTracker`: [optional]
+        The tracker to add the totals to
+    """
+
+    # the amount of pellets a crop plot counts as full at
+    FULL = 19
+
+    def __init__(
+        self,
+        plots: Iterable[TekCropPlot] = (),
+        parent: Optional["CropPlotTracker"] = None,
+    ) -> None:
+        self.parent = parent
+        self.plots = 0
+        self.pellets = 0
+        self.dead = 0
+        self.seeded = 0
+
+        self._pellets: dict[str, int] = {}
+        self._seeded: dict[str, bool] = {}
+        # whether anything was taken out of and the pellets put into each
+        # crop plot on the current visit of the station, for the analytics
+        self.harvests: dict[str, tuple[bool, int]] = {}
+        self._add(plots=len({plot.name for plot in plots}))
+
+    @property
+    def capacity(self) -> int:
+        return self.plots * self.FULL
+
+    @property
+    def coverage(self) -> float:
+        """The fill level of the crop plots, i.e if every crop plot has 10/20
+        pellets, the fill level is 0.5 or 50%"""
+        if not self.capacity:
+            return 0.0
+        return min(self.pellets / self.capacity, 1.0)
+
+    def pellets_of(self, plot: TekCropPlot) -> Optional[int]:
+        """The pellets of the crop plot, `None` if they were never read."""
+        return self._pellets.get(plot.name)
+
+    def seeded_of(self, plot: TekCropPlot) -> Optional[bool]:
+        """Whether the crop plot has its seed, `None` if it was never read."""
+        return self._seeded.get(plot.name)
+
+    def set_pellets(self, plot: TekCropPlot, pellets: int) -> None:
+        """Updates the pellets of the crop plot."""
+        self._add(pellets=pellets - self._pellets.get(plot.name, 0))
+        self._pellets[plot.name] = pellets
+
+    def set_seeded(self, plot: TekCropPlot, seeded: bool) -> None:
+        """Updates whether the crop plot still has its seed, dead if not."""
+        previous = self._seeded.get(plot.name)
+        if previous == seeded:
+            return
+
+        self._seeded[plot.name] = seeded
+        if previous is not None:
+            self._add(seeded=-previous, dead=-(not previous))
+        self._add(seeded=seeded, dead=not seeded)
+
+    def set_harvest(self, plot: TekCropPlot, harvested: bool, pellets: int) -> None:
+        """Sets whether anything was taken and the pellets added on the
+        current visit."""
+        self.harvests[plot.name] = (harvested, pellets)
+
+    def _add(
+        self, *, plots: int = 0, pellets: int = 0, dead: int = 0, seeded: int = 0
+    ) -> None:
+        tracker: Optional[CropPlotTracker] = self
+        while tracker is not None:
+            tracker.plots += plots
+            tracker.pellets += pellets
+            tracker.dead += dead
+            tracker.seeded += seeded
+            tracker = tracker.parent
+
+    def __str__(self) -> str:
+        return (
+            f"{round(self.coverage * 100)}% pellets over {self.plots} crop plots, "
+            f"{self.seeded} seeded, {self.dead} dead"
+        )
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 from ark import Bed, Player
 
+from ..profiler import profiled
+from ..timers import TimerService
 from ..webhooks import InfoWebhook, TribeLogWebhook
 
 
@@ -31,6 +33,7 @@ class Station(ABC):
         The timestamp of the last completion, to check whether its ready
     """
     statistics: dict[str, int] = {}
+    timers = TimerService()
 
     def __init__(
         self,
@@ -56,15 +59,25 @@ class Station(ABC):
         return self._name
 
     def is_ready(self) -> bool:
-        """Checks whether the station is ready by comparing the station
-        datas' interval to the last emptied datetime.
+        """Checks whether the station is ready by comparing the time it will
+        be ready at to the current time.
+        """
+        ready_at = self.ready_at()
+        return ready_at is not None and ready_at <= datetime.now()
+
+    def ready_at(self) -> Optional[datetime]:
+        """Returns the time the station will be ready at given the station
+        datas' interval and the last emptied datetime.
+
+        Stations that can not tell when they will be ready (e.g because they
+        are waiting for another station) return `None`.
         """
         if self.interval is None or self.last_completed is None:
-            return True
+            return datetime.now()
 
-        time_diff = datetime.now() - self.last_completed
-        return time_diff.total_seconds() > (self.interval * 60)
+        return self.last_completed + timedelta(minutes=self.interval)
 
+    @profiled
     def spawn(self) -> None:
         """Spawns at the station given the station datas bed object.
         Checks tribelogs during whitescreen and awaits to be loaded
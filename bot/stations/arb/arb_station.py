@@ -1,6 +1,6 @@
 import json
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Literal, Optional
 
 import pyautogui  # type: ignore[import]
@@ -8,7 +8,7 @@ from ark import (Bed, ChemistryBench, Dinosaur, IndustrialForge, Player,
                  TekDedicatedStorage, items)
 from discord import Embed  # type: ignore[import]
 
-from ...tools import format_seconds
+from ...vision import SlotGrid, templates
 from ...webhooks import InfoWebhook, TribeLogWebhook
 from .._station import Station
 from ._settings import ArbStationSettings
@@ -59,11 +59,16 @@ class ARBStation(Station):
         self.status = data["status"]
         print(f"Loaded ARB status: {self.status}")
 
-        if self.status == Status.COOKING_WOOD:
-            self._started_cooking_wood = datetime.strptime(
+        if (
+            self.status == Status.COOKING_WOOD
+            and self._name not in self.timers
+            and data.get("cooking_start")
+        ):
+            # data from before the timers were persisted
+            started_cooking = datetime.strptime(
                 data["cooking_start"][:-3], "%Y-%m-%d %H:%M:%S.%f"
             )
-            print(f"Loaded start of cooking: {self._started_cooking_wood}")
+            self.timers.set_at(self._name, started_cooking + timedelta(minutes=170))
 
         self.ready = self._wood_in_dedi > 29900
         print(f"Station is ready: {self.ready}")
@@ -73,6 +78,8 @@ class ARBStation(Station):
         self.chembench = ChemistryBench()
         self.forge = IndustrialForge()
         self.exo_mek = Dinosaur("Exo Mek", "assets/templates/exo_mek.png")
+        self.spark_icon = templates[items.SPARKPOWDER.inventory_icon]
+        self.slot_grid = SlotGrid(self.chembench.inventory.SLOTS)
         self.bed = Bed("arb_craft")
         self.forge_bed = Bed("arb_cooking")
         self.pickup_bed = Bed("arb_pickup")
@@ -92,29 +99,21 @@ class ARBStation(Station):
             (self._player.turn_x_by, -50),
         ]
 
-    def is_ready(self) -> bool:
-        """Checks if the station is ready for the next step."""
+    def ready_at(self) -> Optional[datetime]:
+        """Returns when the next step of the station will be ready, `None` while
+        waiting for the crystal station to deposit enough wood."""
         if not self.settings.enabled:
-            return False
+            return None
 
-        print(f"Checking whether arb station is ready, status: '{self.status}'")
         if self.status == Status.WAITING_FOR_WOOD:
-            # set ready by 'add_wood' method, called from crystal station
-            # when wood gets teleported
-            return self.ready
+            return datetime.now() if self.ready else None
 
-        if self.status == Status.COOKING_WOOD:
-            # currently cooking the wood, checks if 2.75 hours have passed.
-            return self.charcoal_ready()
-
-        if self.status == Status.WAITING_FOR_GUNPOWDER:
-            # currently waiting for the gunpoweder to be crafted
-            # so it can queue the ARB
-            return self.gunpowder_ready()
-
-        if self.status == Status.WAITING_FOR_ARB:
-            # waiting for the ARB to finish crafting (approx 5k crafts)
-            return self.arb_ready()
+        if self.status in [
+            Status.COOKING_WOOD,
+            Status.WAITING_FOR_GUNPOWDER,
+            Status.WAITING_FOR_ARB,
+        ]:
+            return self.timers.get(self._name) or datetime.now()
 
         raise ValueError(f"{self.status} is not a valid status!")
 
@@ -155,46 +154,6 @@ class ARBStation(Station):
 
         self._set_data("wood", self._wood_in_dedi)
 
-    def gunpowder_ready(self) -> bool:
-        """Checks if 5 minutes have passed since queuing gunpowder"""
-        try:
-            time_diff = round(
-                (datetime.now() - self._started_crafting_gunpowder).total_seconds()
-            )
-            time_left = max(0, (5 * 60) - time_diff)
-            if not time_left:
-                print("Gunpowder has finished crafting.")
-                return True
-            print(f"{format_seconds(time_left)} left on gunpowder...")
-            return False
-        except AttributeError:
-            return True
-
-    def arb_ready(self) -> bool:
-        """Checks if 15 minutes have passed since queuing arb"""
-        try:
-            time_diff = round(
-                (datetime.now() - self._started_crafting_arb).total_seconds()
-            )
-            time_left = max(0, (15 * 60) - time_diff)
-            if not time_left:
-                print("ARB has finished crafting.")
-                return True
-            print(f"{format_seconds(time_left)} left on ARB...")
-            return False
-        except AttributeError:
-            return True
-
-    def charcoal_ready(self) -> bool:
-        """Checks if 2h 45min have passed since filling the forges"""
-        time_diff = round((datetime.now() - self._started_cooking_wood).total_seconds())
-        time_left = max(0, (170 * 60) - time_diff)
-        if not time_left:
-            print("Charcoal has finished burning.")
-            return True
-        print(f"{format_seconds(time_left)} left on charcoal...")
-        return False
-
     def spawn_at_forges(self) -> None:
         """Spawns at the forge bed"""
         self._player.prone()
@@ -323,11 +282,10 @@ class ARBStation(Station):
         embed = self.create_forges_refilled_embed(round(time.time() - start))
         self._webhook.send_embed(embed)
 
-        self._started_cooking_wood = datetime.now()
+        self.timers.set(self._name, timedelta(minutes=170))
         self._wood_in_dedi -= 30000
         self.ready = False
 
-        self._set_data("cooking_start", self._started_cooking_wood)
         self._set_data("wood", self._wood_in_dedi)
 
     def access_gasoline(self, mode: Literal["take", "deposit"]) -> None:
@@ -518,21 +476,25 @@ class ARBStation(Station):
         self._player.sleep(1)
 
         i = 0
-        while self._slot_51_has_spark():
-            self.chembench.inventory.select_slot(0)
-            pyautogui.press("t")
-            i += 1
-            self._player.sleep(i / 200)
-
-    def _slot_51_has_spark(self) -> bool:
-        return (
-            self.chembench.window.locate_template(
-                items.SPARKPOWDER.inventory_icon,
-                region=self.chembench.inventory.SLOTS[38],
-                confidence=0.7,
-                grayscale=True,
-            )
-            is not None
+        remaining = self._spark_from_slot_51()
+        while remaining:
+            for _ in range(remaining):
+                self.chembench.inventory.select_slot(0)
+                pyautogui.press("t")
+                i += 1
+                self._player.sleep(i / 200)
+            remaining = self._spark_from_slot_51()
+
+    def _spark_from_slot_51(self) -> int:
+        """Returns how many of the visible slots from slot 51 on contain spark,
+        each of which takes one transfer to clear."""
+        return self.slot_grid.count(
+            self.chembench.window,
+            items.SPARKPOWDER,
+            self.spark_icon,
+            confidence=0.7,
+            start=38,
+            grayscale=True,
         )
 
     def distribute_spark_evenly(self) -> None:
@@ -635,7 +597,7 @@ class ARBStation(Station):
         self._webhook.send_embed(embed)
 
         self.status = Status.WAITING_FOR_GUNPOWDER
-        self._started_crafting_gunpowder: datetime = datetime.now()
+        self.timers.set(self._name, timedelta(minutes=5))
 
         self._set_data("status", "Waiting for gunpowder")
 
@@ -684,8 +646,7 @@ class ARBStation(Station):
         Returns an embed displaying the time taken and the statistics.
 
         Upon finishing, the the status property is set to `WAITING_FOR_ARB`,
-        and the `_started_crafting_arb` datetime is created to check when its
-        finished.
+        and a 15 minute timer is set to check when its finished.
         """
         self.spawn()
         start = time.time()
@@ -697,7 +658,7 @@ class ARBStation(Station):
         self._webhook.send_embed(embed)
 
         self.status = Status.WAITING_FOR_ARB
-        self._started_crafting_arb: datetime = datetime.now()
+        self.timers.set(self._name, timedelta(minutes=15))
         self._set_data("status", "Waiting for ARB")
 
     def travel_to_pickup_bed(self) -> None:
@@ -744,6 +705,7 @@ class ARBStation(Station):
 
         finally:
             self.status = Status.WAITING_FOR_WOOD
+            self.timers.cancel(self._name)
             self._set_data("status", "Waiting for wood")
 
     def create_embed(self, time_taken: int, arb_profit: int) -> Embed:
@@ -11,12 +11,19 @@ from ark.items import *
 from discord import Embed  # type: ignore[import]
 
 from ...exceptions import NoCrystalAddedError
+from ...profiler import profiled
+from ...streaming import YieldStats
+from ...tools import wait_until
+from ...vision import FrameCache, ocr, vote
 from ...webhooks import InfoWebhook, TimerWebhook, TribeLogWebhook
 from .._station import Station
 from ..arb import ARBStation
 from ..grinding import GrindingStation
 from ._settings import CrystalStationSettings
 
+# the characters tesseract may read the deposited amounts as, same as ark uses
+DUST_OCR_WHITELIST = "0123456789liIxObL"
+
 
 class CrystalStation(Station):
     """Crystal Station handle.
@@ -69,6 +76,9 @@ class CrystalStation(Station):
         TREE_PLATFORM,
     ]
 
+    # the dust of each pickup, kept per bed
+    dust_yields: dict[str, YieldStats] = {}
+
     def __init__(
         self,
         name: str,
@@ -106,6 +116,8 @@ class CrystalStation(Station):
         self._first_pickup = True
 
         self._total_pickups = 0
+        self.dust_sources: list[str] = []
+        self.dust_yield = self.dust_yields.setdefault(name, YieldStats())
         self.last_completed = datetime.now()
         self.interval = self.settings.crystal_interval
 
@@ -182,6 +194,7 @@ class CrystalStation(Station):
         finally:
             self.last_completed = datetime.now()
 
+    @profiled
     def deposit_into_stryder(self) -> dict[Item, int]:
         self._player.turn_y_by(-50, delay=0.5)
         profits: dict[Item, int] = {}
@@ -241,6 +254,7 @@ class CrystalStation(Station):
         self._player.inventory.unequip(EXO_GLOVES)
         self._player.inventory.transfer_all(EXO_GLOVES)
 
+    @profiled
     def _pick_crystals(self) -> None:
         """Picks up the crystals in the collection point.
 
@@ -289,6 +303,7 @@ class CrystalStation(Station):
 
         self._player.walk("w", 2)
 
+    @profiled
     def _walk_to_dedi(self) -> None:
         """Walks forward to dedi with various lag protection
 
@@ -314,6 +329,7 @@ class CrystalStation(Station):
             self._player.walk("w", 1)
         self.dedi.inventory.close()
 
+    @profiled
     def _open_crystals(self) -> None:
         """Opens the crystals at the dedis, counting each iteration of the hotbar
         until there are no more crystals in our player inventory.
@@ -343,8 +359,17 @@ class CrystalStation(Station):
         for _ in range(5):
             self._player.spam_hotbar()
         self._player.inventory.close()
-        self._player.sleep(3)
 
+        # wait for the last crystals to finish opening
+        wait_until(
+            timeout=3,
+            region=self._player._ADDED_REGION,
+            name="crystals opened",
+            sleep=self._player.sleep,
+            expect_change=True,
+        )
+
+    @profiled
     def deposit_dedis(self) -> dict[Item, int]:
         """Deposits all the dust / black pearls into the dedis.
         OCRs the amount amount deposited.
@@ -354,6 +379,7 @@ class CrystalStation(Station):
         A dictionary containing the amounts of items deposited for dust and pearls
         """
         gains = {DUST: 0, BLACK_PEARL: 0}
+        self.dust_sources.clear()
         turns = [
             lambda: self._player.turn_x_by(40, delay=0.2),
             lambda: self._player.turn_y_by(-50, delay=0.2),
@@ -389,6 +415,7 @@ class CrystalStation(Station):
             ]
         )
 
+    @profiled
     def deposit_items(self) -> bool:
         """Puts the gear items into the vaults.
 
@@ -437,7 +464,10 @@ class CrystalStation(Station):
         return vault_full
 
     def validate_dust_amount(self, amount: int) -> int:
-        """Checks if the given amount of dust is valid compared to the usual average.
+        """Checks if the given amount of dust is valid compared to the recent
+        pickups of this bed. If it is not, the deposit message is reread over
+        several frames to vote on the amount before falling back to the
+        expected amount.
 
         Parameters
         ----------
@@ -446,19 +476,71 @@ class CrystalStation(Station):
 
         Returns
         --------
-        The given amount if its within a valid range, else the average amount
+        The given amount if its within a valid range, else the voted amount if
+        that is valid, else the expected amount. Once enough pickups in a row
+        were outliers that agree with each other, the yield is taken to have
+        changed and the amount is accepted.
         """
-        try:
-            average_amount = round(
-                self.statistics.get(DUST.name, 0) / self._total_pickups
-            )
-        except ZeroDivisionError:
-            # assume 6000 dust / minute, or 100 / second
-            average_amount = round(100 * self.settings.crystal_interval)
+        # assume 6000 dust / minute, or 100 / second
+        default = 100 * self.settings.crystal_interval
+        expected = round(self.dust_yield.expected(default))
+
+        def valid(amount: int) -> bool:
+            return not self.dust_yield.is_outlier(amount, default, fallback=15000)
 
-        if average_amount - 15000 < amount < average_amount + 15000:
+        if valid(amount):
+            self.dust_sources.append("determined")
+            self.dust_yield.add(amount)
             return amount
-        return average_amount
+
+        voted = None
+        if ocr.vote_frames:
+            voted = self.vote_dust_amount()
+            if voted is not None and valid(voted):
+                self.dust_sources.append("voted")
+                self.dust_yield.add(voted)
+                return voted
+
+        # a run of outliers that agree is a change of the yield, not misreads
+        outlier = amount if voted is None else voted
+        if self.dust_yield.reject(outlier):
+            print(f"Dust yield changed, now expecting around {outlier}.")
+            self.dust_sources.append("determined")
+            return outlier
+
+        print(f"Dust amount {amount} is an outlier, using {expected} instead.")
+        self.dust_sources.append("defaulted")
+        return expected
+
+    def vote_dust_amount(self) -> Optional[int]:
+        """Rereads the amount of the dust deposit message over `ocr.vote_frames`
+        frames and takes a per digit majority vote over the reads, the frames
+        are read on the OCR service while the next is captured.
+
+        Returns
+        -------
+        The voted amount, `None` if the message could not be found.
+        """
+        roi = self.dedi._get_item_amount_roi(DUST)
+        if roi is None:
+            return None
+
+        window = self.dedi.window
+        pending = []
+        for _ in range(ocr.vote_frames):
+            if isinstance(window, FrameCache):
+                window.invalidate()
+            img = window.grab_screen(roi, convert=False)
+            denoised = window.denoise_text(
+                img, denoise_rgb=(255, 255, 255), variance=10
+            )
+            pending.append(ocr.submit(denoised, whitelist=DUST_OCR_WHITELIST, psm=7))
+            self._player.sleep(0.1)
+
+        reads = [self.dedi._correct_ocr_mistakes(future.result()) for future in pending]
+        amount, agreement = vote(reads)
+        print(f"Dust: voted {amount} from {reads} ({agreement:.0%}).")
+        return amount
 
     def create_embed(self, profit: dict[Item, int], time_taken: int) -> Embed:
         crystals = round(profit[DUST] / 120)
@@ -475,6 +557,12 @@ class CrystalStation(Station):
                 continue
 
             formatted_amount = f"{amount:_}".replace("_", " ")
+            if item == DUST and set(self.dust_sources) - {"determined"}:
+                formatted_amount += "".join(
+                    f"\n{self.dust_sources.count(source)}x {source}"
+                    for source in ("determined", "voted", "defaulted")
+                    if source in self.dust_sources
+                )
             embed.add_field(name=item.name, value=formatted_amount)
 
         missing = 3 - len(embed.fields) % 3
@@ -6,6 +6,8 @@ from ark import Bed, Gacha, Player, Structure, TekCropPlot, items
 
 from bot.stations._station import Station
 
+from ...delays import delays
+from ...tools import wait_settled
 from ...webhooks import InfoWebhook, TribeLogWebhook
 from .._station import Station
 
@@ -189,11 +191,18 @@ class FeedStation(Station):
         # open trough and transfer berries, add delays to make sure we only check
         # for berries in the inventory once they actually transferred.
         self.trough.open()
+        delays.resolve(True, "trough close")
         if popcorn:
             self.trough.inventory.drop(popcorn)
 
         self._player.inventory.transfer_all()
-        self._player.sleep(0.5)
+        wait_settled(
+            self._player.inventory._ITEM_REGION,
+            self.trough.inventory._ITEM_REGION,
+            timeout=0.5,
+            name="trough transfer",
+            sleep=self._player.sleep,
+        )
 
         # check for berries left in our inventory
         if isinstance(item, items.Item):
@@ -204,7 +213,8 @@ class FeedStation(Station):
             raise LookupError(f"No {item} left to transfer!")
 
         self.trough.inventory.close()
-        self._player.sleep(0.3)
+        self._player.sleep(delays.get("trough close", 0.3))
+        delays.expect("trough close")
 
     def fill_troughs(
         self, item: items.Item | list[items.Item], popcorn: Optional[items.Item] = None
@@ -7,6 +7,7 @@ from datetime import datetime
 from ark import Bed, Dinosaur, Player, exceptions, items
 from discord import Embed  # type: ignore[import]
 
+from ...tools import wait_settled, wait_until
 from ...webhooks import InfoWebhook, TribeLogWebhook
 from .._crop_plot_helper import do_crop_plot_stack
 from ._meat_settings import MeatStationSettings
@@ -35,6 +36,9 @@ class MeatFeedStation(FeedStation):
 
     RAW_MEAT_AVATAR = "https://static.wikia.nocookie.net/arksurvivalevolved_gamepedia/images/e/e9/Raw_Meat.png/revision/latest/scale-to-width-down/228?cb=20150704150605"
 
+    # the center of the screen where the bear hits the meat plant
+    ATTACK_REGION = (660, 240, 600, 600)
+
     def __init__(
         self,
         name: str,
@@ -99,7 +103,14 @@ class MeatFeedStation(FeedStation):
             self.bear.attack("left")
             self.bear.sleep(0.7)
 
-        self._player.sleep(5)
+        # wait for the last attacks to finish before dismounting
+        wait_until(
+            timeout=5,
+            region=self.ATTACK_REGION,
+            name="meat attacks",
+            sleep=self._player.sleep,
+            expect_change=True,
+        )
         self.bear.dismount()
 
     def walk_to_spawn(self) -> None:
@@ -149,7 +160,13 @@ class MeatFeedStation(FeedStation):
         self.bear.access()
         self.bear.inventory.transfer_all(items.RAW_MEAT)
         self._player.inventory.await_items_added(items.RAW_MEAT)
-        self._player.sleep(0.5)
+        wait_settled(
+            self._player.inventory._ITEM_REGION,
+            timeout=0.5,
+            name="bear meat transfer",
+            sleep=self._player.sleep,
+            expect_change=False,
+        )
         meat = self._player.inventory.get_amount_transferred(items.RAW_MEAT, "add")
 
         self.bear.inventory.drop_all()
@@ -0,0 +1,103 @@
+"""Compares the digit recognizer to tesseract on a labelled dedi corpus.
+
+Each image of the corpus is read by a recognizer trained on the other folds,
+so that no image is ever read by a recognizer that has seen it.
+
+The corpus the bot learns is labelled by tesseract reads, so tesseract would
+always score itself correct on it. Tesseract is only scored on a corpus that
+was labelled by hand, passed with `--hand-labelled`, named the same way.
+
+Usage: py -m bot.stations.grinding.benchmark_ocr [--corpus DIR] [--folds N]
+    [--backend auto|tesserocr|pytesseract] [--hand-labelled]
+"""
+import argparse
+import statistics
+import time
+
+import cv2  # type: ignore[import]
+from ark import config
+from pytesseract import pytesseract as tes  # type: ignore[import]
+
+from ...vision import DigitRecognizer, ocr
+from .grinding_station import DEDI_OCR_WHITELIST, parse_dedi_amount
+
+
+def summarize(name: str, results: list[tuple[bool, float]]) -> str:
+    latencies = sorted(latency for _, latency in results)
+    accuracy = sum(correct for correct, _ in results) / len(results)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return (
+        f"{name}: {accuracy:.1%} correct, "
+        f"mean {statistics.mean(latencies) * 1000:.2f}ms, p95 {p95 * 1000:.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="py -m bot.stations.grinding.benchmark_ocr",
+        description="Benchmarks the dedi digit recognizer against tesseract.",
+    )
+    parser.add_argument("--corpus", default="bot/_data/dedi_corpus")
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument(
+        "--backend", choices=("auto", "tesserocr", "pytesseract"), default="auto"
+    )
+    parser.add_argument(
+        "--hand-labelled",
+        action="store_true",
+        help="the corpus was labelled by hand, so tesseract can be scored on it",
+    )
+    args = parser.parse_args()
+
+    corpus = [
+        (cv2.imread(path, cv2.IMREAD_GRAYSCALE), value)
+        for path, value in DigitRecognizer.corpus(args.corpus)
+    ]
+    if len(corpus) < args.folds:
+        print(f"Need at least {args.folds} labelled images, found {len(corpus)}.")
+        return
+    tes.tesseract_cmd = config.TESSERACT_PATH
+    ocr.configure(args.backend, workers=1)
+
+    recognizer_results: list[tuple[bool, float]] = []
+    tesseract_results: list[tuple[bool, float]] = []
+    confident_results: list[bool] = []
+
+    for fold in range(args.folds):
+        recognizer = DigitRecognizer(args.corpus)
+        for i, (mask, value) in enumerate(corpus):
+            if i % args.folds != fold:
+                recognizer.train(mask, value)
+
+        for mask, value in corpus[fold :: args.folds]:
+            start = time.perf_counter()
+            reading = recognizer.read(mask)
+            recognizer_results.append(
+                (reading.value == value, time.perf_counter() - start)
+            )
+            if reading.confidence >= recognizer.MIN_CONFIDENCE:
+                confident_results.append(reading.value == value)
+
+            if args.hand_labelled:
+                start = time.perf_counter()
+                amount = parse_dedi_amount(ocr.read(mask, DEDI_OCR_WHITELIST))
+                tesseract_results.append((amount == value, time.perf_counter() - start))
+
+    print(f"Benchmarked {len(corpus)} images in {args.folds} folds.")
+    print(summarize("Recognizer", recognizer_results))
+    if confident_results:
+        print(
+            f"Recognizer was confident on {len(confident_results)} images, "
+            f"{sum(confident_results) / len(confident_results):.1%} of them correct."
+        )
+    if tesseract_results:
+        print(summarize(f"Tesseract ({ocr.backend.name})", tesseract_results))
+    else:
+        print(
+            "Tesseract was not scored, the labels of this corpus are tesseract "
+            "reads. Pass --hand-labelled with a corpus labelled by hand."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 import time
-from itertools import cycle
-from typing import Iterable
+from datetime import datetime, timedelta
+from concurrent.futures import Future
+from typing import Iterable, Optional
 
 import cv2  # type: ignore[import]
+import numpy as np
 from ark import (
     ArkWindow,
     Bed,
@@ -11,21 +13,27 @@ from ark import (
     Player,
     Structure,
     TekDedicatedStorage,
+    _helpers,
+    config,
     exceptions,
     items,
     tools,
 )
 from discord import Embed  # type: ignore[import]
-from PIL import Image  # type: ignore[import]
-from pytesseract import pytesseract as tes  # type: ignore[import]
 
-from ...tools import format_seconds, mss_to_pil
+from ...delays import delays
+from ...profiler import profiled
+from ...tools import format_seconds, wait_settled, wait_until
+from ...vision import DigitRecognizer, RegionCapture, ocr, vote
 from ...webhooks import InfoWebhook, TribeLogWebhook
 from .._station import Station
 from ._settings import GrindingStationSettings
 from ._stations import Stations
 from ._status import Status
 
+# the characters tesseract may read the dedi amounts as
+DEDI_OCR_WHITELIST = "0123456789liI|O"
+
 # map common mistakes in the dedi OCR
 DEDI_NUMBER_MAPPING = {"l": "1", "i": "1", "I": "1", "|": "1", "O": "0"}
 
@@ -40,6 +48,22 @@ DEFAULT_MATS: dict[items.Item, int] = {
 }
 
 
+def parse_dedi_amount(text: str) -> int:
+    """Parses the amount tesseract read from a dedi, returns 0 if the result
+    is not a number."""
+    amount = text.replace("\n", "")
+
+    # replace common tesseract fuckups
+    for char, new_char in DEDI_NUMBER_MAPPING.items():
+        amount = amount.replace(char, new_char)
+
+    try:
+        return int(amount)
+    except ValueError as e:
+        print(e)
+        return 0
+
+
 class GrindingStation(Station):
 
     GRINDER_AVATAR = "https://static.wikia.nocookie.net/arksurvivalevolved_gamepedia/images/f/fe/Industrial_Grinder.png/revision/latest/scale-to-width-down/228?cb=20160728174054"
@@ -78,6 +102,27 @@ class GrindingStation(Station):
 
     _CRAFTABLES_MAP = {item.name: item for item in _SUPPORTED_CRAFTABLES}
 
+    # the delays of turning to a station, verified by whether the station
+    # opens right away once the turn settled, see `confirm_turn`
+    TURN_DELAYS = ("turn_to start", "turn_to settle")
+
+    # the horizontal turn from the pearls and paste on around to the gear vault
+    RETURN_TURN = 70
+
+    # how often to recapture dedis the digit recognizer is not confident about
+    DIGIT_RETRIES = 2
+
+    # the amounts the dedis with a known range can hold
+    DEDI_RANGES = {
+        items.SILICA_PEARL: (3000, 130000),
+        items.PASTE: (7000, 180000),
+        items.ELECTRONICS: (800, 10000),
+        items.METAL_INGOT: (5000, 60000),
+    }
+
+    # the share of votes the reads of a dedi must agree on to be learned
+    LEARN_AGREEMENT = 0.8
+
     def __init__(
         self,
         player: Player,
@@ -99,55 +144,60 @@ class GrindingStation(Station):
         self.ready = False
         self.status = Status.WAITING_FOR_ITEMS
         self.current_station = "Gear Vault"
+        # the status is not persisted, so a timer left over from before a
+        # restart belongs to a stage the station is no longer waiting on
+        self.timers.cancel(self._name)
 
         self.grinder = IndustrialGrinder()
         self.dedi = TekDedicatedStorage()
         self.vault = Structure("Vault", "assets/templates/vault_capped.png")
         self.exo_mek = Dinosaur("Exo Mek", "assets/templates/exo_mek.png")
         self.screen = ArkWindow()
-
-        self.STATION_MAPPING: dict[str, tuple | list] = {
-            "Grinder": (self._player.turn_x_by, -50),
-            "Exo Mek": (self._player.turn_x_by, -110),
-            "Vault": (self._player.turn_x_by, -95),
-            "Crystal": (self._player.turn_x_by, -70),
-            "Hide": (self._player.turn_y_by, 40),
-            "Ingot": (self._player.turn_x_by, -60),
-            "Electronics": (self._player.turn_y_by, -40),
-            "Pearls": (self._player.turn_x_by, -60),
-            "Paste": (self._player.turn_y_by, 40),
-            "Gear Vault": [
-                (self._player.turn_y_by, -40),
-                (self._player.turn_x_by, -70),
-            ],
+        self.digits = DigitRecognizer.load()
+
+        # where each station is as the horizontal and vertical turn from the
+        # gear vault, which the player looks at when spawning at the bed
+        self.STATION_MAPPING: dict[str, tuple[int, int]] = {
+            "Grinder": (-50, 0),
+            "Exo Mek": (-160, 0),
+            "Vault": (-255, 0),
+            "Crystal": (-325, 0),
+            "Hide": (-325, 40),
+            "Ingot": (-385, 40),
+            "Electronics": (-385, 0),
+            "Pearls": (-445, 0),
+            "Paste": (-445, 40),
+            "Gear Vault": (0, 0),
         }
+        # the calibrated turns around the stations make up the full circle,
+        # which is a unit short of 4 times `Player.turn_90_degrees`
+        self.FULL_TURN = self.RETURN_TURN - min(
+            x for x, _ in self.STATION_MAPPING.values()
+        )
 
     def spawn(self) -> None:
         """Override spawn method to set current station"""
         super().spawn()
         self.current_station = Stations.GEAR_VAULT
 
-    def is_ready(self) -> bool:
-        """Checks if the station is ready to be completed. Overriding the
-        base `is_ready` method because the grinding station is responsible
-        for multiple steps within the same instance.
-        """
+    def ready_at(self) -> Optional[datetime]:
+        """Returns when the next step of the station will be ready, `None` while
+        waiting for the crystal station to find the vault full."""
         if not self.settings.enabled:
-            return False
+            return None
 
-        print(f"Checking whether grinding station is ready, status: '{self.status}'")
         if self.status == Status.WAITING_FOR_ITEMS:
-            return self.ready
+            return datetime.now() if self.ready else None
 
         if self.status == Status.AWAITING_EVALUTION:
-            return True
+            return datetime.now()
 
         if self.status in [
             Status.CRAFTING_SUBCOMPONENTS,
             Status.AWAITING_CRAFT,
             Status.AWAITING_PICKUP,
         ]:
-            return self.crafting_finished()
+            return self.timers.get(self._name) or datetime.now()
 
         raise ValueError(
             f"Grinding Station failed to match current status '{self.status}'!"
@@ -198,36 +248,51 @@ class GrindingStation(Station):
     def determine_materials(self, debug: bool = False) -> None:
         assert self.item_to_craft is not None and self.item_to_craft.recipe is not None
 
-        result = self.get_dedi_materials(debug)
-
-        available_mats = result["determined"]
-        undetermined = result["undetermined"]
-
-        for item in undetermined:
-            available_mats[item] = DEFAULT_MATS[item]
-
-        available_mats[items.ORGANIC_POLYMER] = 5000
+        # the dedi amounts are read while counting the exo mek materials
+        amounts, pending = self.read_dedi_materials(debug)
+        exo_mek_mats: dict[items.Item, int] = {}
 
         self.current_station = Stations.ELECTRONICS
-        img = self.screen.grab_screen((0, 0, 1920, 1080))
+        img = RegionCapture(self.screen, self.dedi_regions.values()).image
 
         for item in self.item_to_craft.recipe:
-            if item in available_mats:
+            if item in self.dedi_regions or item == items.ORGANIC_POLYMER:
                 continue
 
             self.turn_to(Stations.EXO_MEK)
+            self.confirm_turn()
             self.exo_mek.access()
             self.exo_mek.inventory.search(item)
             self.exo_mek.sleep(0.3)
 
-            available_mats[item] = max(
+            exo_mek_mats[item] = max(
                 0,
                 self.exo_mek.inventory.count(item) * item.stack_size
                 - (0.5 * item.stack_size),
             )
         self.exo_mek.close()
 
-        embed = self.create_available_materials_embed(available_mats, undetermined)
+        result = self.validate_dedi_materials(amounts, pending)
+        available_mats = result["determined"]
+        undetermined = result["undetermined"]
+        sources = {item: "determined" for item in available_mats}
+
+        if undetermined and ocr.vote_frames:
+            for item, amount in self.vote_dedi_materials(undetermined).items():
+                available_mats[item] = amount
+                sources[item] = "voted"
+
+        for item in undetermined:
+            if item not in available_mats:
+                available_mats[item] = DEFAULT_MATS[item]
+                sources[item] = "defaulted"
+
+        available_mats[items.ORGANIC_POLYMER] = 5000
+        available_mats.update(exo_mek_mats)
+
+        embed = self.create_available_materials_embed(
+            available_mats, undetermined, sources
+        )
         self._webhook.send_embed(embed, img=img)
         self._player.sleep(3)
 
@@ -237,6 +302,7 @@ class GrindingStation(Station):
         embed = self.create_crafting_embed()
         self._webhook.send_embed(embed)
 
+    @profiled
     def grind_armor(self) -> None:
         """Grind all the riot gear down, putting the polymer from the first grinding
         into the Exo Mek and dropping the rest. If a piece was not found, it will
@@ -289,6 +355,7 @@ class GrindingStation(Station):
         if amount_found:
             self.drop_script_from_grinder(items.CRYSTAL)
 
+    @profiled
     def grind_weapons(self) -> None:
         """Grinds all the weapons in the Gear Vault. If a weapon was not found,
         it will simply continue with the next one.
@@ -316,30 +383,9 @@ class GrindingStation(Station):
 
         self.drop_script_from_grinder(items.METAL_INGOT)
 
-    def get_cycle(self, stations: Iterable[str]) -> cycle:
-        """Converts the list of our stations to a `cycle` object starting at
-        our current station to help find the quickest way to the target station.
-
-        Parameters:
-        -----------
-        stations :class:`Iterable`:
-            The stations to convert to the cycle
-
-        Returns:
-        ----------
-        A `cycle` object with the iteration pointer on the current station.
-        """
-        stations = cycle(stations)
-
-        # set the cycle pointer to current station
-        for station in stations:
-            if station == self.current_station:
-                return stations
-        raise Exception("Not sure how we got here...")
-
-    def find_quickest_way_to(self, target_station: Stations) -> tuple[list[str], str]:
-        """Finds the quickest way to the passed target station, forwards
-        and backwards possibilities are considered, the shortest is returned.
+    def plan_turn(self, target_station: Stations) -> tuple[int, int]:
+        """Finds the shortest turn from the current station to the target
+        station, either way around.
 
         Parameters:
         -----------
@@ -348,75 +394,72 @@ class GrindingStation(Station):
 
         Returns:
         --------
-        A list containing the stations to go through to reach the target Stations.
+        The horizontal and vertical amount to turn by.
 
         Raises:
         --------
-        `InvalidStationError` if you passed a station that doesnt exist.
+        `ValueError` if you passed a station that doesnt exist.
         """
-        # ensure the passed station exists to avoid looping infinitely
         if not target_station in self.STATION_MAPPING:
             raise ValueError(f"{target_station} is not a valid station!")
 
-        if target_station == self.current_station:
-            return [], "stay"
-
-        # remove values from keys to get an proper iterable
-        stations = list(self.STATION_MAPPING)
-
-        # get the amount of station to go through if we move forwards
-        # use itertools cycle method to allow counting over lists end
-        forward_path = []
-        for station in self.get_cycle(stations):
-            forward_path.append(station)
-            if station == target_station:
-                break
-
-        backward_path = [self.current_station]
-        for station in self.get_cycle(reversed(stations)):
-            backward_path.append(station)
-            if station == target_station:
-                break
+        current_x, current_y = self.STATION_MAPPING[self.current_station]
+        target_x, target_y = self.STATION_MAPPING[target_station]
 
-        # compare both resulting lists, return the shorter one together with
-        # the direction
-        if len(forward_path) < len(backward_path):
-            return forward_path, "forward"
-        return backward_path, "backwards"
+        # wrap the horizontal turn into half a circle either way
+        half = self.FULL_TURN // 2
+        x = (target_x - current_x + half) % self.FULL_TURN - half
+        return x, target_y - current_y
 
+    @profiled
     def turn_to(self, target_station: Stations) -> None:
-        """Turns to the given station using the fastest way around possible.
+        """Turns to the given station using the shortest turn possible.
 
-        If we are going backwards, the turn amount is multiplies by -1 to
-        get the opposite of the actual movement and go backwards instead.
+        The horizontal and vertical part of the turn are made right after
+        another, then the view is given time to settle once.
 
         Parameters:
         -----------
         target_station :class:`Station` | `str`:
             The station to turn to
         """
-        # get the quickest path and the direction
-        path, direction = self.find_quickest_way_to(target_station)
-        self._player.sleep(1)
-
-        for station in path:
-            self.current_station = station
-            # when going backwards, done once the station is the target
-            if direction == "backwards" and station == target_station:
-                break
+        x, y = self.plan_turn(target_station)
+        if not x and not y:
+            return
 
-            # check if the station requires multiple turns
-            # a station consists of the method (turn x...) + the value
-            if isinstance(self.STATION_MAPPING[station], list):
-                for func, amount in self.STATION_MAPPING[station]:
-                    func(amount * (-1 if direction == "backwards" else 1))
-                    self._player.sleep(0.3)
-                continue
+        self._player.sleep(delays.get("turn_to start", 1))
+        if x:
+            self._player.turn_x_by(x, delay=0)
+        if y:
+            self._player.turn_y_by(y, delay=0)
+        self.current_station = target_station
+        self._player.sleep(delays.get("turn_to settle", 1))
+        for site in self.TURN_DELAYS:
+            delays.expect(site)
+
+    def confirm_turn(self) -> None:
+        """Presses once to open the station the last turn went to, the turn
+        delays were long enough if that opened it. Meant to be called right
+        before the station is opened, which retries if it did not open yet.
+
+        Turns that are not followed by opening the station are not reported.
+        """
+        if self.current_station in (Stations.VAULT, Stations.GEAR_VAULT):
+            inventory = self.vault.inventory
+        elif self.current_station == Stations.GRINDER:
+            inventory = self.grinder.inventory
+        elif self.current_station == Stations.EXO_MEK:
+            inventory = self.exo_mek.inventory
+        else:
+            inventory = self.dedi.inventory
 
-            func, amount = self.STATION_MAPPING[station]
-            func(amount * (-1 if direction == "backwards" else 1))
-            self._player.sleep(0.3)
-        self._player.sleep(1)
+        if inventory.is_open():
+            return
+        inventory.press(inventory.keybinds.target_inventory)
+        reached = _helpers.await_event(
+            inventory.is_open, max_duration=config.INVENTORY_OPEN_INTERVAL
+        )
+        delays.resolve(reached, *self.TURN_DELAYS)
 
     def grind(self, item: items.Item, take: list[items.Item]) -> None:
         """Turns to the grinder and grinds the item, then takes all requested
@@ -436,10 +479,17 @@ class GrindingStation(Station):
         # open the grinder and transfer the items into it
         if not self.grinder.inventory.is_open():
             self.turn_to(Stations.GRINDER)
+            self.confirm_turn()
 
         self.grinder.open()
         self._player.inventory.transfer_all(item)
-        self._player.sleep(0.5)
+        wait_settled(
+            self._player.inventory._ITEM_REGION,
+            self.grinder.inventory._ITEM_REGION,
+            timeout=0.5,
+            name="grinder transfer",
+            sleep=self._player.sleep,
+        )
 
         # turn the grinder on if its not already, grind all the items
         self.grinder.turn_on()
@@ -484,12 +534,18 @@ class GrindingStation(Station):
         """
         if not self.vault.inventory.is_open():
             self.turn_to(Stations.GEAR_VAULT)
+            self.confirm_turn()
             self.vault.open()
 
         # clear inventory, search for the target item
         self._player.inventory.drop_all()
         self.vault.inventory.search(item)
-        self._player.sleep(0.5)
+        wait_settled(
+            self.vault.inventory._ITEM_REGION,
+            timeout=0.5,
+            name="vault search",
+            sleep=self._player.sleep,
+        )
 
         # check if any items are within the vault
         if not self.vault.inventory.has(item, is_searched=True):
@@ -515,12 +571,19 @@ class GrindingStation(Station):
 
         if not self.exo_mek.inventory.is_open():
             self.turn_to(Stations.EXO_MEK)
+            self.confirm_turn()
             self.exo_mek.access()
 
         # deposit the items
         for item in items:
             self._player.inventory.transfer_all(item)
-            self._player.sleep(0.5)
+            wait_settled(
+                self._player.inventory._ITEM_REGION,
+                self.exo_mek.inventory._ITEM_REGION,
+                timeout=0.5,
+                name="exo mek transfer",
+                sleep=self._player.sleep,
+            )
         self.exo_mek.close()
 
     def empty_grinder(self, turn_off: bool = False) -> None:
@@ -533,6 +596,7 @@ class GrindingStation(Station):
         """
         # get all the hide and deposit it
         self.turn_to(Stations.GRINDER)
+        self.confirm_turn()
         self.grinder.open()
         self.grinder.inventory.transfer_all(items.HIDE)
         self.grinder.close()
@@ -540,6 +604,7 @@ class GrindingStation(Station):
 
         # drop all on the remaining items
         self.turn_to(Stations.GRINDER)
+        self.confirm_turn()
         self.grinder.open()
         for item in [items.FIBER, items.STONE, items.ANGLER_GEL, items.WOOD]:
             self.grinder.inventory.search(item)
@@ -581,6 +646,7 @@ class GrindingStation(Station):
             The amount of the item to put into the exo mek
         """
         self.turn_to(Stations.from_item(item))
+        self.confirm_turn()
         self.dedi.open()
         self.dedi.inventory.transfer_all()
 
@@ -589,6 +655,7 @@ class GrindingStation(Station):
 
         # transfer the amount into the exo mek
         self.turn_to(Stations.EXO_MEK)
+        self.confirm_turn()
         self.exo_mek.access()
 
         if self.exo_mek.inventory.has(items.GACHA_CRYSTAL):
@@ -606,8 +673,20 @@ class GrindingStation(Station):
         self.turn_to(Stations.from_item(item))
         self.dedi.deposit([item], get_amount=False)
 
-    def get_dedi_screenshot(self, spawn: bool = True) -> Image.Image:
-        """Grabs a screenshot of the dedi wall to later determine the
+    @property
+    def dedi_regions(self) -> dict[items.Item, tuple[int, int, int, int]]:
+        """The regions of the dedi wall the amounts of each material are at."""
+        return {
+            items.SILICA_PEARL: self.settings.pearls_region,
+            items.PASTE: self.settings.paste_region,
+            items.ELECTRONICS: self.settings.electronics_region,
+            items.METAL_INGOT: self.settings.ingots_region,
+            items.CRYSTAL: self.settings.crystal_region,
+            items.HIDE: self.settings.hide_region,
+        }
+
+    def get_dedi_screenshot(self, spawn: bool = True) -> RegionCapture:
+        """Grabs a screenshot of the dedi wall regions to later determine the
         amount of resources available.
 
         Parameters:
@@ -617,7 +696,7 @@ class GrindingStation(Station):
 
         Returns:
         ----------
-        A PIL Image of the current dedi wall.
+        A capture of the dedi wall regions.
         """
 
         # sync to bed, look at dedi wall
@@ -629,13 +708,13 @@ class GrindingStation(Station):
         # screen temporarily for better clarity
         self._player.hide_hands()
 
-        # save the result, enable HUD and return the Image
-        img = self.screen.grab_screen(region=(0, 0, 1920, 1080))
+        # save the result, enable HUD and return the capture
+        capture = RegionCapture(self.screen, self.dedi_regions.values())
 
         self._player.sleep(0.5)
         self._player.disable_hud()
 
-        return mss_to_pil(img)
+        return capture
 
     def walk_back_little(self) -> None:
         """Crouches and walks back a tiny bit, attempting to getting a better
@@ -660,19 +739,13 @@ class GrindingStation(Station):
         ----------
         Whether the amount is within a regular range.
         """
-        expected = {
-            items.SILICA_PEARL: (3000, 130000),
-            items.PASTE: (7000, 180000),
-            items.ELECTRONICS: (800, 10000),
-            items.METAL_INGOT: (5000, 60000),
-        }
         if self.item_to_craft is None:
             return True
 
         assert self.item_to_craft.recipe is not None
 
         # we dont care about crystal or hide
-        if item not in expected or (
+        if item not in self.DEDI_RANGES or (
             item not in list(self.item_to_craft.recipe)
             and not any(
                 subitem.recipe is not None for subitem in self.item_to_craft.recipe
@@ -680,63 +753,169 @@ class GrindingStation(Station):
         ):
             return True
 
-        # ensure the OCRd amount is within a f
-        lower_range, upper_range = expected[item]
+        return self.in_range(item, amount)
+
+    def in_range(self, item: items.Item, amount: int) -> bool:
+        """Whether the amount is within the range the dedi of the item can
+        hold, `False` for dedis without a known range."""
+        if item not in self.DEDI_RANGES:
+            return False
+        lower_range, upper_range = self.DEDI_RANGES[item]
         return upper_range >= amount >= lower_range - 300
 
     def get_dedi_materials(self, debug: bool = False) -> dict:
-        """Tries to get the dedi materials up to 10 times. Will return a dict
-        of the material and its amount on the first successful attempt.
-
-        Raises `DediNotFoundError` after 10 unsuccessful attempts.
+        """Reads the amount of each material on the dedi wall and checks each
+        read for validity, see `read_dedi_materials`."""
+        return self.validate_dedi_materials(*self.read_dedi_materials(debug))
+
+    @profiled
+    def read_dedi_materials(
+        self, debug: bool = False
+    ) -> tuple[dict[items.Item, int], dict[items.Item, tuple[np.ndarray, Future]]]:
+        """Reads the amount of each material on the dedi wall.
+
+        The amounts are read by the digit recognizer first, amounts it is
+        not confident about are recaptured up to `DIGIT_RETRIES` times before
+        being queued on the OCR service, so that the bot can carry on while
+        tesseract reads them.
+
+        Returns
+        -------
+        The amounts that were read and the images and pending tesseract reads
+        of the remaining dedis, to be passed to `validate_dedi_materials`.
         """
+        capture = self.get_dedi_screenshot(True)
+        amounts: dict[items.Item, int] = {}
+        unread: dict[items.Item, np.ndarray] = {}
+
+        for attempt in range(self.DIGIT_RETRIES + 1):
+            if attempt:
+                print(f"Retrying dedi OCR for {[item.name for item in unread]}...")
+                capture = self.get_dedi_screenshot(spawn=False)
+
+            unread.clear()
+            for item, region in self.dedi_regions.items():
+                if item in amounts:
+                    continue
 
-        dedi_to_region = {
-            items.SILICA_PEARL: self.settings.pearls_region,
-            items.PASTE: self.settings.paste_region,
-            items.ELECTRONICS: self.settings.electronics_region,
-            items.METAL_INGOT: self.settings.ingots_region,
-            items.CRYSTAL: self.settings.crystal_region,
-            items.HIDE: self.settings.hide_region,
-        }
+                roi = capture.crop(region)
+                denoised = self.screen.denoise_text(roi, self.settings.text_rgb, 22)
+                reading = self.digits.read(denoised)
+                if debug:
+                    cv2.imshow(f"{item.name} - {reading.digits}", denoised)
+                    cv2.waitKey(0)
+
+                if reading.value is not None and (
+                    reading.confidence >= self.digits.MIN_CONFIDENCE
+                ):
+                    amounts[item] = reading.value
+                else:
+                    unread[item] = denoised
+
+            if not unread or not self.digits.trained:
+                break
+
+        pending = ocr.submit_batch(unread, whitelist=DEDI_OCR_WHITELIST, psm=6)
+        return amounts, {item: (unread[item], pending[item]) for item in unread}
 
-        img = self.get_dedi_screenshot(True)
+    def validate_dedi_materials(
+        self,
+        amounts: dict[items.Item, int],
+        pending: dict[items.Item, tuple[np.ndarray, Future]],
+    ) -> dict:
+        """Waits for the pending tesseract reads and sorts each amount into
+        determined or undetermined depending on whether it is within a valid
+        range.
+
+        A tesseract read is added to the recognizers corpus only if it is
+        within the range of a dedi that has one. Once the corpus has every
+        digit the recognizer must also have read the same number, so that no
+        misread is learned; before that it could never agree, and the corpus
+        is bootstrapped from the in range reads alone."""
         result: dict[str, dict[items.Item, int]] = {
             "determined": {},
             "undetermined": {},
         }
-
-        for item, region in dedi_to_region.items():
-            roi = img.crop(
-                (region[0], region[1], region[0] + region[2], region[1] + region[3])
-            )
-            denoised_roi = self.screen.denoise_text(roi, self.settings.text_rgb, 22)
-            amount: str = tes.image_to_string(
-                denoised_roi,
-                config="-c tessedit_char_whitelist=0123456789liI|O --psm 6",
-            ).replace("\n", "")
-
-            # replace common tesseract fuckups
-            for char, new_char in DEDI_NUMBER_MAPPING.items():
-                amount = amount.replace(char, new_char)
-            if debug:
-                cv2.imshow(f"{item.name} - {amount}", denoised_roi)
-                cv2.waitKey(0)
-
-            try:
-                final_result = int(amount)
-            except ValueError as e:
-                print(e)
-                final_result = 0
-
+        for item, (denoised, future) in pending.items():
+            amounts[item] = parse_dedi_amount(future.result())
+            if (
+                amounts[item]
+                and self.in_range(item, amounts[item])
+                and (
+                    not self.digits.complete
+                    or self.digits.read(denoised).value == amounts[item]
+                )
+            ):
+                self.digits.learn(denoised, amounts[item])
+
+        for item, amount in amounts.items():
             # validate that the result is within a logical range
-            if not self.amount_valid(item, final_result):
-                result["undetermined"][item] = final_result
+            if not self.amount_valid(item, amount):
+                result["undetermined"][item] = amount
             else:
-                result["determined"][item] = final_result
+                result["determined"][item] = amount
 
         return result
 
+    @profiled
+    def vote_dedi_materials(self, materials: Iterable[items.Item]) -> dict:
+        """Recaptures the dedis of the given materials over `ocr.vote_frames`
+        frames, walking back a little between them to get a slightly different
+        view, and takes a per digit majority vote over all of their reads.
+
+        Every frame is read by the digit recognizer and queued on the OCR
+        service, so tesseract reads the frames while the next is captured.
+        A frame tesseract read as the voted amount is added to the corpus if
+        the frames agreed on it and it is within the range of the dedi.
+
+        Returns
+        -------
+        The voted amount of each material whose vote passed validation.
+        """
+        materials = list(materials)
+        reads: dict[items.Item, list[str]] = {item: [] for item in materials}
+        pending: list[tuple[items.Item, np.ndarray, Future]] = []
+
+        print(f"Voting on {[item.name for item in materials]}...")
+        for frame in range(ocr.vote_frames):
+            if frame:
+                self.walk_back_little()
+            capture = self.get_dedi_screenshot(spawn=not frame)
+
+            for item in materials:
+                roi = capture.crop(self.dedi_regions[item])
+                denoised = self.screen.denoise_text(roi, self.settings.text_rgb, 22)
+                if self.digits.trained:
+                    reads[item].append(self.digits.read(denoised).digits)
+                future = ocr.submit(denoised, whitelist=DEDI_OCR_WHITELIST, psm=6)
+                pending.append((item, denoised, future))
+
+        tesseract: dict[items.Item, list[tuple[np.ndarray, int]]] = {
+            item: [] for item in materials
+        }
+        for item, denoised, future in pending:
+            amount = parse_dedi_amount(future.result())
+            reads[item].append(str(amount))
+            tesseract[item].append((denoised, amount))
+
+        voted: dict[items.Item, int] = {}
+        for item, item_reads in reads.items():
+            amount, agreement = vote(item_reads)
+            print(f"{item.name}: voted {amount} from {item_reads} ({agreement:.0%}).")
+            if amount is not None and self.amount_valid(item, amount):
+                voted[item] = amount
+
+            if (
+                amount
+                and agreement >= self.LEARN_AGREEMENT
+                and self.in_range(item, amount)
+            ):
+                for denoised, read in tesseract[item]:
+                    if read == amount:
+                        self.digits.learn(denoised, amount)
+                        break
+        return voted
+
     def compute_crafting_plan(self, owned_items: dict[items.Item, int]):
         """Receives the list of materials we own and figures out the most
         'efficient' way to craft turrets mainly taking in consideration the
@@ -815,11 +994,16 @@ class GrindingStation(Station):
         return embed
 
     def create_available_materials_embed(
-        self, available: dict[items.Item, int], undetermined: dict[items.Item, int]
+        self,
+        available: dict[items.Item, int],
+        undetermined: dict[items.Item, int],
+        sources: Optional[dict[items.Item, str]] = None,
     ) -> Embed:
         """Sends an embed to the info webhook informing about the crafting
         plan that has been calculated for the ongoing session. Takes its data
-        from the session class attributes."""
+        from the session class attributes. Each dedi material is tagged with
+        whether it was determined, voted or defaulted."""
+        sources = sources or {}
         # reformat the amounts to make it look nicer
         formatted: dict[items.Item, str] = {}
         desired_order = [
@@ -834,6 +1018,8 @@ class GrindingStation(Station):
         ]
         for resource, amount in available.items():
             formatted[resource] = f"{amount:_}x".replace("_", " ")
+            if resource in sources:
+                formatted[resource] += f" ({sources[resource]})"
         formatted = {k: formatted[k] for k in desired_order if k in formatted}
 
         # create embed, black sidebar
@@ -869,21 +1055,7 @@ class GrindingStation(Station):
         embed.set_footer(text="Ling Ling Bot - Kenny#0947 - discord.gg/2mPhj8xhS5")
         return embed
 
-    def crafting_finished(self) -> bool:
-        """Checks if more than 2 minutes passed since the last electronic
-        queue up."""
-
-        try:
-            time_diff = round(time.time() - self.last_crafted)
-            time_left = max(0, (3 * 60) - time_diff)
-            if not time_left:
-                print("Grinding station has finished crafting.")
-                return True
-            print(f"{format_seconds(time_left)} left on crafting components..")
-            return False
-        except AttributeError:
-            return True
-
+    @profiled
     def craft(self, item: items.Item, amount: int, put_items: bool = True) -> None:
         """Turns to the exo mek and crafts the given amount of the given item.
 
@@ -905,6 +1077,7 @@ class GrindingStation(Station):
                 self.put_item_into_exo_mek(material, per_craft * amount)
 
         self.turn_to(Stations.EXO_MEK)
+        self.confirm_turn()
         self.exo_mek.access()
         self.exo_mek.inventory.open_tab("crafting")
         self.exo_mek.inventory.craft(item, amount)
@@ -913,6 +1086,7 @@ class GrindingStation(Station):
     def clear_up_exo_mek(self) -> None:
         """Clears the exo mek after a crafting session."""
         self.turn_to(Stations.VAULT)
+        self.confirm_turn()
         self.vault.open()
         self._player.inventory.transfer_all(self.item_to_craft)
         self.vault.close()
@@ -931,6 +1105,7 @@ class GrindingStation(Station):
 
         # get the non heavy mats, drop all on the rest (poly)
         self.turn_to(Stations.EXO_MEK)
+        self.confirm_turn()
         self.exo_mek.access()
         for item in [items.SILICA_PEARL, items.PASTE, items.ELECTRONICS]:
             self.exo_mek.inventory.transfer_all(item)
@@ -966,7 +1141,7 @@ class GrindingStation(Station):
             self.pickup_final_craft(spawn=False)
         else:
             self.exo_mek.close()
-            self.last_crafted = time.time()
+            self.timers.set(self._name, timedelta(minutes=3))
             self.status = Status.AWAITING_PICKUP
 
     def pickup_final_craft(self, spawn: bool = True) -> None:
@@ -975,10 +1150,17 @@ class GrindingStation(Station):
             self.spawn()
 
         self.turn_to(Stations.EXO_MEK)
+        self.confirm_turn()
 
         self.exo_mek.access()
         self.exo_mek.inventory.transfer_all(self.item_to_craft)
-        self._player.sleep(1)
+        wait_until(
+            timeout=1,
+            region=self._player.inventory._ITEM_REGION,
+            name="final craft transfer",
+            sleep=self._player.sleep,
+            expect_change=True,
+        )
 
         img = self.screen.grab_screen(self._player.inventory._ITEM_REGION)
         stacks_crafted = self._player.inventory.count(self.item_to_craft)
@@ -996,6 +1178,7 @@ class GrindingStation(Station):
             self._webhook.send_error("Transferring items", e)
 
         self.status = Status.WAITING_FOR_ITEMS
+        self.timers.cancel(self._name)
         self.ready = False
 
     def _add_crafts_to_statistics(self, crafts: int) -> None:
@@ -1029,7 +1212,7 @@ class GrindingStation(Station):
             craft_amount = min(amount, 1000)
             self.craft(item, craft_amount)
             self.subcomponents_to_craft[item] -= craft_amount
-            self.last_crafted = time.time()
+            self.timers.set(self._name, timedelta(minutes=3))
             break
 
         img = self.screen.grab_screen(self.exo_mek.inventory.CRAFTING_QUEUE)
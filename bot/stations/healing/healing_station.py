@@ -1,4 +1,6 @@
 import time
+from datetime import datetime
+from typing import Optional
 
 from ark import Player, TekSleepingPod, _helpers, exceptions
 from discord import Embed  # type: ignore[import]
@@ -54,6 +56,10 @@ class HealingStation(Station):
     def is_ready(self) -> bool:
         return self._player.needs_recovery()
 
+    def ready_at(self) -> Optional[datetime]:
+        """The need to heal can not be predicted, so it is checked on demand."""
+        return datetime.now() if self.is_ready() else None
+
     def complete(self) -> None:
         """Spawns at the healing station and enters the tek pod to heal,
         then leaves the tek pod and sends a healing statistics embed.
@@ -3,12 +3,14 @@ from __future__ import annotations
 import json
 import time
 from datetime import datetime, timedelta
+from typing import Optional
 
 from ark import (Bed, ChemistryBench, Dinosaur, Gacha, Player, Structure,
                  TekCropPlot, TekDedicatedStorage, items)
 from discord import Embed  # type: ignore[import]
 
 from ...exceptions import MissingPelletsError, StationNotReadyError
+from ...vision import SlotGrid, templates
 from ...webhooks import InfoWebhook, TribeLogWebhook
 from .._crop_plot_helper import do_crop_plot_stack
 from .._station import Station
@@ -45,6 +47,9 @@ class MedbrewStation(Station):
         self.status = Status.WAITING_FOR_BERRIES
 
         self._load_last_completion("medbrew")
+        # the status is not persisted, so a timer left over from before a
+        # restart belongs to a stage the station is no longer waiting on
+        self.timers.cancel(self._name)
         self._create_turns()
         self.narc_crop_plots = [
             TekCropPlot(f"{name} - Narcoberry 1:{i}") for i in range(1, 10)
@@ -62,6 +67,8 @@ class MedbrewStation(Station):
         self.gacha = Gacha(name)
         self.bear = Dinosaur("Dire Bear", "assets/templates/dire_bear.png")
         self.trough = Structure("Tek Trough", "assets/templates/tek_trough.png")
+        self.tintoberry_icon = templates[items.TINTOBERRY.inventory_icon]
+        self.slot_grid = SlotGrid(self.cooker.inventory.SLOTS)
 
         self.chembench_bed = Bed(name + "cb")
 
@@ -78,15 +85,14 @@ class MedbrewStation(Station):
         spawning, given the stations numeric suffix."""
         return int(self._name[-2:]) % 2 == 0
 
-    def is_ready(self) -> bool:
+    def ready_at(self) -> Optional[datetime]:
+        """Returns when the next step of the station will be ready."""
         if self.status == Status.WAITING_FOR_BERRIES:
-            return self._berries_are_ready()
+            assert self.last_completed is not None
+            return self.last_completed + timedelta(hours=5)
 
-        elif self.status == Status.CRAFTING_NARCOTICS:
-            return self._narcotics_finished_crafting()
-
-        elif self.status == Status.COOKING_MEDBREWS:
-            return self._brews_finished_cooking()
+        elif self.status in [Status.CRAFTING_NARCOTICS, Status.COOKING_MEDBREWS]:
+            return self.timers.get(self._name) or datetime.now()
 
         raise ValueError(f"'{self.status}' is not a valid status!")
 
@@ -140,7 +146,7 @@ class MedbrewStation(Station):
         self._put_gas_into_cookers()
 
         self.status = Status.CRAFTING_NARCOTICS
-        self._started_crafting_narcotics = datetime.now()
+        self.timers.set(self._name, timedelta(minutes=3))
         self._webhook.send_embed(
             self._create_narcotics_queued_embed(round(time.time() - start))
         )
@@ -216,7 +222,7 @@ class MedbrewStation(Station):
                 self.cooker.close()
 
         self.status = Status.COOKING_MEDBREWS
-        self._started_cooking_brews = datetime.now()
+        self.timers.set(self._name, timedelta(minutes=17))
         self._webhook.send_embed(
             self._create_started_cooking_embed(round(time.time() - start))
         )
@@ -257,6 +263,7 @@ class MedbrewStation(Station):
         )
 
         self.status = Status.WAITING_FOR_BERRIES
+        self.timers.cancel(self._name)
         self.last_completed = datetime.now()
         self.set_data("medbrew", "last_completed", self.last_completed)
 
@@ -300,41 +307,27 @@ class MedbrewStation(Station):
         self.cooker.inventory.scroll("down", rows=4)
         self._player.sleep(1)
 
-        while self.cooker.window.locate_template(
-            items.TINTOBERRY.inventory_icon,
-            self.cooker.inventory.SLOTS[36],
-            confidence=0.7,
-        ):
-            self.cooker.inventory.press("t")
-            self._player.sleep(0.2)
+        remaining = self._tintoberries_from_slot_61()
+        while remaining:
+            for _ in range(remaining):
+                self.cooker.inventory.press("t")
+                self._player.sleep(0.2)
+            remaining = self._tintoberries_from_slot_61()
 
         self.cooker.turn_on()
         self.cooker.close()
         self._player.sleep(2)
         
-    def _berries_are_ready(self) -> bool:
-        """Returns whether 5 hours passed since the last completion"""
-        assert self.last_completed is not None
-        try:
-            return (datetime.now() - self.last_completed).total_seconds() > 5 * 3600
-        except AttributeError:
-            return True
-
-    def _narcotics_finished_crafting(self) -> bool:
-        """Returns whether 3 minutes passed since crafting narcotics"""
-        try:
-            return (
-                datetime.now() - self._started_crafting_narcotics
-            ).total_seconds() > 180
-        except AttributeError:
-            return True
-
-    def _brews_finished_cooking(self) -> bool:
-        """Returns whether 18 minutes passed since starting to cook medbrews"""
-        try:
-            return (datetime.now() - self._started_cooking_brews).total_seconds() > 1020
-        except AttributeError:
-            return True
+    def _tintoberries_from_slot_61(self) -> int:
+        """Returns how many of the visible slots from slot 61 on contain
+        tintoberries, each of which takes one transfer to clear."""
+        return self.slot_grid.count(
+            self.cooker.window,
+            items.TINTOBERRY,
+            self.tintoberry_icon,
+            confidence=0.7,
+            start=36,
+        )
 
     def _queue_narcotics(self) -> None:
         """Queues narcotics in the chembenches"""
@@ -0,0 +1,277 @@
+"""Records the harvest of every Y-Trap crop plot across laps and reports on it.
+
+The bot appends a row for every crop plot it visited to `PLOTS_CSV` and a row
+for every completed station to `STATIONS_CSV`. Running this module turns
+those into a heatmap of how often each crop plot had Y-Traps and of its dead
+rate, both as a CSV and an image, and ranks the stations by Y-Traps per
+second of station time, to decide which beds are worth keeping in
+`ytrap_beds`.
+
+The Y-Traps are only counted per station, as they are deposited into the
+gacha. Counting them in every crop plot would cost a scan of its inventory
+on every visit, the crop plots only record whether they had any.
+
+Usage: py -m bot.stations.ytrap.analytics [--output DIRECTORY] [--days N]
+"""
+
+import argparse
+import csv
+import os
+import time
+from collections import defaultdict
+from typing import Iterable, Optional
+
+import cv2 as cv  # type: ignore[import]
+import numpy as np
+
+PLOTS_CSV = "bot/_data/ytrap_plots.csv"
+STATIONS_CSV = "bot/_data/ytrap_stations.csv"
+
+PLOT_FIELDS = [
+    "time",
+    "lap",
+    "station",
+    "stack",
+    "plot",
+    "harvested",
+    "pellets",
+    "dead",
+]
+STATION_FIELDS = ["time", "lap", "station", "seconds", "ytraps", "refill"]
+
+
+class YTrapAnalytics:
+    """Appends the harvest of each crop plot and the result of each station
+    to the CSVs the report is created from.
+
+    Parameters
+    ----------
+    plots_path :class:`str`:
+        The path of the CSV to record the crop plots to
+
+    stations_path :class:`str`:
+        The path of the CSV to record the stations to
+    """
+
+    def __init__(
+        self, plots_path: str = PLOTS_CSV, stations_path: str = STATIONS_CSV
+    ) -> None:
+        self.plots_path = plots_path
+        self.stations_path = stations_path
+        self.enabled = False
+
+    def record(
+        self,
+        station: str,
+        lap: int,
+        seconds: int,
+        ytraps: int,
+        refill: bool,
+        plots: Iterable[tuple[int, int, bool, int, Optional[bool]]],
+    ) -> None:
+        """Records a completed station.
+
+        Parameters
+        ----------
+        plots :class:`Iterable[tuple[int, int, bool, int, Optional[bool]]]`:
+            The stack, index, whether anything was taken, pellets added and
+            whether it had its seed of each crop plot that was visited
+        """
+        if not self.enabled:
+            return
+
+        now = round(time.time())
+        self._append(
+            self.plots_path,
+            PLOT_FIELDS,
+            (
+                [
+                    now,
+                    lap,
+                    station,
+                    stack,
+                    plot,
+                    int(harvested),
+                    pellets,
+                    int(seeded is False),
+                ]
+                for stack, plot, harvested, pellets, seeded in plots
+            ),
+        )
+        self._append(
+            self.stations_path,
+            STATION_FIELDS,
+            [[now, lap, station, seconds, ytraps, int(refill)]],
+        )
+
+    def _append(self, path: str, fields: list[str], rows: Iterable[list]) -> None:
+        new = not os.path.exists(path)
+        with open(path, "a", newline="") as f:
+            writer = csv.writer(f)
+            if new:
+                writer.writerow(fields)
+            writer.writerows(rows)
+
+
+ytrap_analytics = YTrapAnalytics()
+
+
+def _read(path: str, days: Optional[float]) -> list[dict[str, str]]:
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    if days is not None:
+        # the laps start over whenever the bot is restarted, the time does not
+        since = time.time() - days * 86400
+        rows = [row for row in rows if int(row["time"]) >= since]
+    return rows
+
+
+def plot_heatmap(
+    rows: list[dict[str, str]],
+) -> tuple[list[str], list[str], np.ndarray, np.ndarray]:
+    """Returns the stations, the crop plots and the harvest rate, how often it
+    had Y-Traps, and the dead rate of each crop plot of each station, `nan`
+    where a crop plot was never visited."""
+    stations = sorted({row["station"] for row in rows})
+    plots = sorted({(int(row["stack"]), int(row["plot"])) for row in rows})
+    columns = {plot: idx for idx, plot in enumerate(plots)}
+    lines = {station: idx for idx, station in enumerate(stations)}
+
+    visits = np.zeros((len(stations), len(plots)))
+    harvested = np.zeros_like(visits)
+    dead = np.zeros_like(visits)
+    for row in rows:
+        cell = lines[row["station"]], columns[int(row["stack"]), int(row["plot"])]
+        visits[cell] += 1
+        harvested[cell] += int(row["harvested"])
+        dead[cell] += int(row["dead"])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (
+            stations,
+            [f"{stack}:{plot}" for stack, plot in plots],
+            harvested / visits,
+            dead / visits,
+        )
+
+
+def rank_stations(rows: list[dict[str, str]]) -> list[tuple[str, float, int]]:
+    """Returns the stations ordered by Y-Traps per second of station time,
+    best first, with the amount of completions each is based on."""
+    seconds: dict[str, int] = defaultdict(int)
+    ytraps: dict[str, int] = defaultdict(int)
+    completions: dict[str, int] = defaultdict(int)
+    for row in rows:
+        seconds[row["station"]] += int(row["seconds"])
+        ytraps[row["station"]] += int(row["ytraps"])
+        completions[row["station"]] += 1
+
+    return sorted(
+        (
+            (station, ytraps[station] / max(1, seconds[station]), completions[station])
+            for station in seconds
+        ),
+        key=lambda ranked: ranked[1],
+        reverse=True,
+    )
+
+
+def draw_heatmap(
+    stations: list[str], plots: list[str], values: np.ndarray, cell: int = 24
+) -> np.ndarray:
+    """Draws the values as a heatmap, from blue at the lowest to red at the
+    highest value. Crop plots that were never visited are left black."""
+    low, high = np.nanmin(values), np.nanmax(values)
+    scaled = (values - low) / (high - low) if high > low else np.zeros_like(values)
+    gray = np.nan_to_num(scaled * 255).astype(np.uint8)
+    heatmap = cv.applyColorMap(gray, cv.COLORMAP_JET)
+    heatmap[np.isnan(values)] = 0
+    heatmap = cv.resize(
+        heatmap,
+        (len(plots) * cell, len(stations) * cell),
+        interpolation=cv.INTER_NEAREST,
+    )
+
+    # leave room for the labels of the stations and crop plots
+    margin = 8 * max(len(station) for station in stations) + 8
+    img = np.zeros((heatmap.shape[0] + 48, heatmap.shape[1] + margin, 3), np.uint8)
+    img[48:, margin:] = heatmap
+    font = cv.FONT_HERSHEY_SIMPLEX
+    for idx, station in enumerate(stations):
+        y = 48 + idx * cell + cell * 2 // 3
+        cv.putText(img, station, (4, y), font, 0.4, (255, 255, 255))
+    for idx, plot in enumerate(plots):
+        x = margin + idx * cell + 2
+        cv.putText(img, plot, (x, 40), font, 0.3, (255, 255, 255))
+    return img
+
+
+def write_heatmap(
+    path: str,
+    stations: list[str],
+    plots: list[str],
+    harvested: np.ndarray,
+    dead: np.ndarray,
+) -> None:
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["station", "plot", "harvested", "dead"])
+        for line, station in enumerate(stations):
+            for column, plot in enumerate(plots):
+                if np.isnan(harvested[line, column]):
+                    continue
+                writer.writerow(
+                    [
+                        station,
+                        plot,
+                        round(harvested[line, column], 2),
+                        round(dead[line, column], 2),
+                    ]
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="py -m bot.stations.ytrap.analytics",
+        description="Reports the yield of the Y-Trap stations and crop plots.",
+    )
+    parser.add_argument("--output", default="analytics")
+    parser.add_argument("--days", type=float, help="only report the most recent days")
+    args = parser.parse_args()
+
+    if not os.path.exists(PLOTS_CSV) or not os.path.exists(STATIONS_CSV):
+        print("Nothing recorded yet, enable the analytics of the crop plots first.")
+        return
+    os.makedirs(args.output, exist_ok=True)
+
+    plot_rows = _read(PLOTS_CSV, args.days)
+    station_rows = _read(STATIONS_CSV, args.days)
+    if plot_rows:
+        stations, plots, harvested, dead = plot_heatmap(plot_rows)
+        write_heatmap(
+            os.path.join(args.output, "heatmap.csv"), stations, plots, harvested, dead
+        )
+        cv.imwrite(
+            os.path.join(args.output, "harvested.png"),
+            draw_heatmap(stations, plots, harvested),
+        )
+        cv.imwrite(
+            os.path.join(args.output, "dead.png"), draw_heatmap(stations, plots, dead)
+        )
+        print(f"Wrote the heatmaps of {len(stations)} stations to {args.output}.")
+
+    ranking = rank_stations(station_rows)
+    with open(os.path.join(args.output, "ranking.csv"), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["station", "ytraps_per_second", "completions"])
+        writer.writerows(
+            [station, round(rate, 3), count] for station, rate, count in ranking
+        )
+
+    print("Stations by Y-Traps per second of station time:")
+    for rank, (station, rate, count) in enumerate(ranking, start=1):
+        print(f"{rank:>3}. {station}: {rate:.2f} ({count} completions)")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,16 @@ from typing import final
 from ark import Bed, DinoExport, Gacha, Player, TekCropPlot, exceptions, items
 from discord import Embed  # type:ignore[import]
 
+from ...inventory_model import inventory_models
+from ...profiler import profiled
+from ...tools import wait_settled
 from ...webhooks import InfoWebhook, TribeLogWebhook
 from .._crop_plot_helper import do_crop_plot_stack, set_stack_folders
+from .._crop_plot_store import crop_plot_store
+from .._crop_plot_tracker import CropPlotTracker
 from .._station import Station
 from ._settings import YTrapStationSettings
+from .analytics import ytrap_analytics
 
 
 @final
@@ -55,8 +61,13 @@ class YTrapStation(Station):
     Y_TRAP_AVATAR = "https://static.wikia.nocookie.net/arksurvivalevolved_gamepedia/images/c/cb/Plant_Species_Y_Trap_%28Scorched_Earth%29.png/revision/latest?cb=20160901233007"
     total_ytraps_collected = 0
     lap = 0
+    # the crop plots of all stations on the tower
+    tower = CropPlotTracker()
     station_times: list[int] = []
 
+    SPAWN_TIME = 20
+    DEFAULT_STATION_TIME = 90
+
     def __init__(
         self,
         name: str,
@@ -86,6 +97,12 @@ class YTrapStation(Station):
             ]
             for stack in range(self.settings.plot_stacks)
         ]
+        self.crop_plots = CropPlotTracker(
+            self.crop_plots_in_order, parent=YTrapStation.tower
+        )
+        # whether the crop plots are known from before the bot was restarted,
+        # restored on the first completion so that they are aged until then
+        self.restored = False
 
     @property
     def stacks(self) -> str:
@@ -95,16 +112,27 @@ class YTrapStation(Station):
             for idx in range(len(self._stacks))
         )
 
+    @property
+    def crop_plots_in_order(self) -> list[TekCropPlot]:
+        return list(itertools.chain(*self._stacks))
+
     @property
     def pellet_coverage(self) -> float:
         """Gets the fill level of the station, i.e if every crop splot has
         10/20 pellets, the fill level is 0.5 or 50%"""
-        plots = list(itertools.chain(*self._stacks))
-        max_pellets = len(plots) * 19
-        total_pellets = sum(
-            [plot.inventory.contents.get(items.PELLET.name, 0) for plot in plots]
-        )
-        return min(total_pellets / max_pellets, 1.0)
+        return self.crop_plots.coverage
+
+    @classmethod
+    def expected_duration(cls) -> float:
+        """Estimates how many seconds the next station is going to take, given
+        by the 90th percentile of the most recent station times plus the time
+        it usually takes to spawn at the station."""
+        recent = sorted(cls.station_times[-20:])
+        if not recent:
+            return cls.DEFAULT_STATION_TIME + cls.SPAWN_TIME
+
+        station_time = recent[min(len(recent) - 1, int(len(recent) * 0.9))]
+        return station_time + cls.SPAWN_TIME
 
     @staticmethod
     def build_stations(
@@ -136,13 +164,19 @@ class YTrapStation(Station):
         Spawns at the station, empties the crop plots and loads the gacha.
         Whether the crop plots need to be refilled with pellets is determined
         by the pellet coverage of the station, which will only be available
-        once the station has been completed at least once.
+        once the station has been completed at least once, or restored from
+        the state stored before the bot was restarted.
         """
         self.spawn()
         start = time.time()
-        refill = (
-            self.pellet_coverage < self.settings.min_pellet_coverage
-        ) and self.total_completions > 0
+        self.crop_plots.harvests.clear()
+        if not self.total_completions:
+            self.restored = crop_plot_store.restore(
+                self._name, self.crop_plots_in_order, self.crop_plots
+            )
+        refill = (self.pellet_coverage < self.settings.min_pellet_coverage) and (
+            self.total_completions > 0 or self.restored
+        )
 
         if refill:
             self._take_pellets_from_gacha()
@@ -156,6 +190,8 @@ class YTrapStation(Station):
 
         time_taken = round(time.time() - start)
         self._add_statistics(time_taken, added_traps)
+        crop_plot_store.save(self._name, self.crop_plots_in_order, self.crop_plots)
+        self._record_analytics(time_taken, added_traps, refill)
         embed = self._create_embed(time_taken, added_traps, dead_crop_plots, refill)
         self._webhook.send_embed(embed)
 
@@ -170,6 +206,24 @@ class YTrapStation(Station):
             YTrapStation.lap = self.total_completions
         YTrapStation.total_ytraps_collected += traps_collected
 
+    def _record_analytics(self, time_taken: int, ytraps: int, refill: bool) -> None:
+        """Records the harvest of each crop plot visited on this completion."""
+        harvests = self.crop_plots.harvests
+        ytrap_analytics.record(
+            self._name,
+            self.total_completions,
+            time_taken,
+            ytraps,
+            refill,
+            (
+                (stack, idx, *harvests[plot.name], self.crop_plots.seeded_of(plot))
+                for stack, plots in enumerate(self._stacks, start=1)
+                for idx, plot in enumerate(plots, start=1)
+                if plot.name in harvests
+            ),
+        )
+
+    @profiled
     def _do_crop_plot_stacks(self, refill: bool) -> list[TekCropPlot]:
         """Empties the crop plots using the crop plot helpers."""
         dead_crop_plots: list[TekCropPlot] = []
@@ -192,36 +246,55 @@ class YTrapStation(Station):
                 refill=refill,
                 precise=precise,
                 delay=self.settings.plot_delay,
+                tracker=self.crop_plots,
             )
             self._player.sleep(0.2)
-            
+
+        # the Y-Traps taken and pellets put in differ from crop plot to crop
+        # plot and are not counted, the player inventory is unknown after
+        inventory_models[self._player.inventory].forget()
         return dead_crop_plots
 
+    @profiled
     def _take_pellets_from_gacha(self) -> None:
         """Takes the pellets from the gacha (on a refill lap only).
 
         Expects the gacha in a closed state, leaves the gacha in a closed state.
         Raises a `NoItemsAddedError` if no pellets could be taken from the gacha.
         """
+        player, gacha = self._player.inventory, self.gacha.inventory
         self.gacha.access()
-        self.gacha.inventory.search(items.PELLET)
+        inventory_models.search(gacha, items.PELLET)
 
-        if not self.gacha.inventory.has(items.PELLET):
+        if not inventory_models.has(gacha, items.PELLET):
             self.gacha.close()
             return
 
-        # take the pellets and transfer some rows back
-        self.gacha.inventory.transfer_all()
-        self._player.inventory.await_items_added(items.PELLET)
-        self._player.inventory.search(items.PELLET)
+        # take the pellets and transfer some rows back, the stacks taken are
+        # only known once counted, each row transferred back moves 6 of them
+        # so they do not have to be counted again
+        inventory_models.transfer_all(gacha, player)
+        player.await_items_added(items.PELLET)
+        inventory_models.search(player, items.PELLET)
 
+        model = inventory_models[player]
         for _ in range(7):
-            self._player.inventory.transfer_top_row(0.2)
-            if self._player.inventory.count(items.PELLET) <= 30:
+            inventory_models.transfer_top_row(player, gacha, items.PELLET)
+            reads = model.reads
+            pellets = inventory_models.count(player, items.PELLET)
+            if pellets <= 30 and model.reads == reads:
+                # the model assumes the rows went through, make sure they did
+                # before leaving with too many pellets
+                pellets = model.reconcile(items.PELLET, player.count(items.PELLET))
+            if pellets <= 30:
                 break
+            if pellets >= len(player.SLOTS):
+                # more stacks than fit on the screen, the count is a lower bound
+                model.forget(items.PELLET)
 
-        self.gacha.inventory.close()
+        gacha.close()
 
+    @profiled
     def _load_gacha(self) -> int:
         """Fills the gacha after emptying crop plots. It does so by first
         taking all the pellets to make space for ytraps, then putting the
@@ -245,22 +318,29 @@ class YTrapStation(Station):
         if self.settings.auto_level_gachas:
             self._check_level_gacha()
 
-        ytraps = self._player.inventory.count(items.Y_TRAP) * 10
+        player, gacha = self._player.inventory, self.gacha.inventory
+        ytraps = inventory_models.count(player, items.Y_TRAP) * 10
         if ytraps:
-            self.gacha.inventory.transfer_all(items.PELLET)
-            self._player.inventory.transfer_all(items.Y_TRAP)
-
-        self._player.inventory.transfer_all()
-        self._player.sleep(0.3)
+            inventory_models.transfer_all(gacha, player, items.PELLET)
+            inventory_models.transfer_all(player, gacha, items.Y_TRAP)
+
+        inventory_models.transfer_all(player, gacha)
+        wait_settled(
+            player._ITEM_REGION,
+            gacha._ITEM_REGION,
+            timeout=0.3,
+            name="gacha transfer",
+            sleep=self._player.sleep,
+        )
 
-        if not self._player.inventory.has(items.Y_TRAP):
-            self._player.inventory.drop_all()
-            self._player.inventory.close()
+        if not inventory_models.has(player, items.Y_TRAP):
+            inventory_models.drop_all(player)
+            player.close()
             return ytraps
 
-        self._player.inventory.drop_all([items.PELLET])
-        self._player.inventory.drop(items.Y_TRAP)
-        self._player.inventory.close()
+        inventory_models.drop_all(player, [items.PELLET])
+        inventory_models.drop(player, items.Y_TRAP)
+        player.close()
         return ytraps
 
     def _ensure_looking_at_gacha(self) -> None:
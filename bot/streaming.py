@@ -0,0 +1,273 @@
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Iterator, Optional
+
+
+class RollingWindow:
+    """The median and median absolute deviation of the last `size` values.
+
+    The values are kept sorted as well as in arrival order, so an update costs
+    a bisection and a bounded list shift, no matter how long the session runs.
+
+    Parameters
+    ----------
+    size :class:`int`:
+        The amount of recent values to keep
+    """
+
+    def __init__(self, size: int = 25) -> None:
+        self._values: deque[float] = deque(maxlen=size)
+        self._sorted: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._values)
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._sorted.clear()
+
+    def add(self, value: float) -> None:
+        if len(self._values) == self._values.maxlen:
+            del self._sorted[bisect_left(self._sorted, self._values[0])]
+        self._values.append(value)
+        insort(self._sorted, value)
+
+    @property
+    def median(self) -> Optional[float]:
+        if not self._sorted:
+            return None
+        return self._median(self._sorted)
+
+    @property
+    def mad(self) -> Optional[float]:
+        """The median absolute deviation from the median."""
+        median = self.median
+        if median is None:
+            return None
+        return self._median(sorted(abs(value - median) for value in self._sorted))
+
+    @staticmethod
+    def _median(values: list[float]) -> float:
+        middle = len(values) // 2
+        if len(values) % 2:
+            return values[middle]
+        return (values[middle - 1] + values[middle]) / 2
+
+
+class EWMA:
+    """An exponentially weighted moving average and variance.
+
+    Parameters
+    ----------
+    alpha :class:`float`:
+        The weight of each new value, higher adapts faster
+    """
+
+    def __init__(self, alpha: float = 0.1) -> None:
+        self.alpha = alpha
+        self.mean: Optional[float] = None
+        self.variance = 0.0
+
+    def add(self, value: float) -> None:
+        if self.mean is None:
+            self.mean = value
+            return
+
+        diff = value - self.mean
+        increment = self.alpha * diff
+        self.mean += increment
+        self.variance = (1 - self.alpha) * (self.variance + diff * increment)
+
+
+class P2Quantile:
+    """Estimates a quantile of all values seen using the P² algorithm, which
+    keeps five markers instead of the values themselves.
+
+    Parameters
+    ----------
+    quantile :class:`float`:
+        The quantile to estimate, between 0 and 1
+    """
+
+    def __init__(self, quantile: float) -> None:
+        self.quantile = quantile
+        self.count = 0
+        self._heights: list[float] = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]
+        self._increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        heights = self._heights
+        if len(heights) < 5:
+            insort(heights, value)
+            return
+
+        # find the cell the value falls into, extending the extremes
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+
+        for i in range(cell + 1, 5):
+            self._positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # move the middle markers towards their desired positions
+        positions = self._positions
+        for i in range(1, 4):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (
+                        positions[i + step] - positions[i]
+                    )
+                heights[i] = height
+                positions[i] += step
+
+    @property
+    def value(self) -> Optional[float]:
+        if not self._heights:
+            return None
+        if self.count < 5:
+            return self._heights[round(self.quantile * (len(self._heights) - 1))]
+        return self._heights[2]
+
+    def _parabolic(self, i: int, step: int) -> float:
+        heights, positions = self._heights, self._positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step)
+            * (heights[i + 1] - heights[i])
+            / (positions[i + 1] - positions[i])
+            + (positions[i + 1] - positions[i] - step)
+            * (heights[i] - heights[i - 1])
+            / (positions[i] - positions[i - 1])
+        )
+
+
+class YieldStats:
+    """Streaming statistics of the yield of a station, such as the dust of each
+    crystal pickup, with constant cost per update and bounded memory.
+
+    The rolling median and MAD decide what is an outlier and what to expect,
+    so that the early pickups or a change of the crystal rate do not skew
+    them for the rest of the session. The EWMA and the percentile sketches
+    describe the yield over the whole session.
+
+    Outliers never enter the window, so a real change of the yield is kept
+    apart in a drift window of the consecutive outliers. Once it holds
+    `DRIFT_SAMPLES` outliers that agree with each other, the window is
+    re-anchored to them and the new yield is expected from then on.
+
+    Parameters
+    ----------
+    window :class:`int`:
+        The amount of recent values the median and MAD are taken over
+    """
+
+    # the amount of values needed before outliers are rejected by the MAD
+    MIN_SAMPLES = 5
+    # how many scaled MADs a value may be away from the median
+    MAX_DEVIATIONS = 4
+    # the smallest relative deviation ever rejected, in case the MAD is tiny
+    MIN_TOLERANCE = 0.25
+    # the amount of consecutive, agreeing outliers that re-anchor the window
+    DRIFT_SAMPLES = 5
+
+    def __init__(self, window: int = 25) -> None:
+        self.window = RollingWindow(window)
+        self.drift = RollingWindow(self.DRIFT_SAMPLES)
+        self.ewma = EWMA()
+        self.percentiles = {q: P2Quantile(q) for q in (0.1, 0.5, 0.9)}
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.window.add(value)
+        self.drift.clear()
+        self.ewma.add(value)
+        for sketch in self.percentiles.values():
+            sketch.add(value)
+
+    def expected(self, default: float) -> float:
+        """The value to expect, the rolling median once there are values."""
+        median = self.window.median
+        return default if median is None else median
+
+    def tolerance(self) -> Optional[float]:
+        """How far a value may be from the median, `None` without enough
+        values to tell."""
+        median, mad = self.window.median, self.window.mad
+        if median is None or mad is None or len(self.window) < self.MIN_SAMPLES:
+            return None
+
+        # 1.4826 scales the MAD to the standard deviation of a normal distribution
+        return max(self.MAX_DEVIATIONS * 1.4826 * mad, self.MIN_TOLERANCE * abs(median))
+
+    def is_outlier(self, value: float, default: float, fallback: float) -> bool:
+        """Returns whether the value is an outlier.
+
+        Parameters
+        ----------
+        value :class:`float`:
+            The value to check
+
+        default :class:`float`:
+            The value to expect while there are no values yet
+
+        fallback :class:`float`:
+            The tolerance to use while there are not enough values yet
+        """
+        tolerance = self.tolerance()
+        if tolerance is None:
+            tolerance = fallback
+        return abs(value - self.expected(default)) >= tolerance
+
+    def reject(self, value: float) -> bool:
+        """Keeps the outlier in the drift window, re-anchoring the window to
+        the drift once it holds enough outliers that agree with each other.
+
+        Returns
+        -------
+        Whether the window was re-anchored, the value is expected then
+        """
+        self.drift.add(value)
+        median, mad = self.drift.median, self.drift.mad
+        if len(self.drift) < self.DRIFT_SAMPLES or median is None or mad is None:
+            return False
+
+        if self.MAX_DEVIATIONS * 1.4826 * mad >= self.MIN_TOLERANCE * abs(median):
+            # the outliers are all over the place, not a change of the yield
+            return False
+
+        drift = list(self.drift)
+        self.window.clear()
+        for outlier in drift:
+            self.add(outlier)
+        return True
+
+    def __str__(self) -> str:
+        if not self.count:
+            return "no data"
+
+        def fmt(value: Optional[float]) -> str:
+            return "-" if value is None else f"{round(value):_}".replace("_", " ")
+
+        p10, p50, p90 = (sketch.value for sketch in self.percentiles.values())
+        return (
+            f"median {fmt(self.window.median)}, ewma {fmt(self.ewma.mean)}, "
+            f"p10/p50/p90 {fmt(p10)}/{fmt(p50)}/{fmt(p90)} ({self.count} samples)"
+        )
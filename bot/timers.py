@@ -0,0 +1,120 @@
+import json
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+TIMER_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+class TimerService:
+    """Keeps track of the stages that finish after a fixed amount of time, such
+    as the charcoal cooking at the ARB station or the narcotics crafting at the
+    medbrew station.
+
+    A stage registers when it will be ready once, instead of the station
+    computing the time left every time it is checked. The timers are persisted
+    in the station data so that a restart resumes them exactly, and setting a
+    timer sets the `wake_up` event so an idling bot can reconsider what to do.
+
+    Parameters
+    ----------
+    path :class:`str`:
+        The path of the station data to persist the timers in
+
+    clock :class:`Callable[[], datetime]`:
+        The function returning the current time
+    """
+
+    def __init__(
+        self,
+        path: str = "bot/_data/station_data.json",
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._timers: Optional[dict[str, datetime]] = None
+        self.wake_up = threading.Event()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._load()
+
+    def set(self, name: str, duration: timedelta) -> datetime:
+        """Registers a timer that is ready after the given duration, replacing
+        any previous timer of the same name.
+
+        Parameters
+        ----------
+        name :class:`str`:
+            The name of the timer, should be unique across all stations
+
+        duration :class:`timedelta`:
+            The time from now until the timer is ready
+
+        Returns
+        --------
+        The time the timer will be ready at
+        """
+        ready_at = self._clock() + duration
+        self.set_at(name, ready_at)
+        return ready_at
+
+    def set_at(self, name: str, ready_at: datetime) -> None:
+        """Registers a timer that is ready at the given time."""
+        with self._lock:
+            self._load()[name] = ready_at
+            self._save()
+        print(f"Timer '{name}' set, ready at {ready_at:%H:%M:%S}.")
+        self.wake_up.set()
+
+    def get(self, name: str) -> Optional[datetime]:
+        """Returns when the timer of the given name is ready, `None` if there
+        is no such timer."""
+        return self._load().get(name)
+
+    def cancel(self, name: str) -> None:
+        """Removes the timer of the given name, if it exists."""
+        with self._lock:
+            if self._load().pop(name, None) is not None:
+                self._save()
+
+    def next_due(self) -> Optional[tuple[str, datetime]]:
+        """Returns the name and time of the timer that is ready next."""
+        timers = self._load()
+        if not timers:
+            return None
+        name = min(timers, key=timers.__getitem__)
+        return name, timers[name]
+
+    def _load(self) -> dict[str, datetime]:
+        """Loads the timers from the station data the first time they are
+        needed, missing data is treated as having no timers."""
+        if self._timers is not None:
+            return self._timers
+
+        try:
+            with open(self._path) as f:
+                data: dict = json.load(f).get("timers", {})
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+
+        self._timers = {
+            name: datetime.strptime(value, TIMER_FORMAT) for name, value in data.items()
+        }
+        return self._timers
+
+    def _save(self) -> None:
+        try:
+            with open(self._path) as f:
+                data: dict = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+
+        assert self._timers is not None
+        data["timers"] = {
+            name: ready_at.strftime(TIMER_FORMAT)
+            for name, ready_at in self._timers.items()
+        }
+
+        with open(self._path, "w") as f:
+            json.dump(data, f, indent=4, default=str)
@@ -1,16 +1,168 @@
+import bisect
 import functools
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
 from threading import Thread
-from typing import Callable
+from typing import Callable, Optional
 
 import cv2 as cv  # type:ignore[import]
 import numpy as np
+from ark import Ark
 from discord import File  # type:ignore[import]
 from PIL import Image  # type:ignore[import]
 
+from .vision import FrameCache, SettleDetector
+from .vision.regions import FULL_FRAME
+
+
+class WaitHistogram:
+    """Counts how long each wait took, bucketed by the upper bound (in seconds)
+    of each bucket, and how many of the waits ran into their timeout."""
+
+    BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5)
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.total = 0.0
+        self.max = 0.0
+        self.timeouts = 0
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def __str__(self) -> str:
+        labels = [f"<{b}s" for b in self.BUCKETS] + [f">{self.BUCKETS[-1]}s"]
+        buckets = ", ".join(
+            f"{label}: {count}" for label, count in zip(labels, self.counts) if count
+        )
+        return (
+            f"avg {self.mean:.2f}s, max {self.max:.2f}s, "
+            f"{self.timeouts} timed out ({buckets})"
+        )
+
+    @property
+    def mean(self) -> float:
+        return self.total / len(self) if len(self) else 0
+
+    def add(self, seconds: float, timed_out: bool = False) -> None:
+        self.counts[bisect.bisect_left(self.BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.timeouts += timed_out
+
+
+# how long each named wait actually took
+wait_times: dict[str, WaitHistogram] = {}
+
+
+class Worker:
+    """A long-lived pool of threads that runs the work it is given in the
+    order it was submitted, rather than starting a new thread for each call.
+
+    Keeps track of how many calls are waiting to be run, so that a backlog,
+    for example of embeds to send while discord is slow, shows in the report
+    instead of as an ever growing amount of threads.
+
+    Parameters
+    ----------
+    name :class:`str`:
+        The name of the worker, its threads are named after it
+
+    workers :class:`int`:
+        The amount of threads, 1 to run the calls strictly one after another
+    """
+
+    def __init__(self, name: str, workers: int) -> None:
+        self.name = name
+        self._workers = workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        self.pending = 0
+        self.max_pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.queued: list[float] = []
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Queues the call, returns the future of its result."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    self._workers, thread_name_prefix=self.name
+                )
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+        submitted = time.perf_counter()
+
+        def run():
+            with self._lock:
+                self.pending -= 1
+                self.queued.append(time.perf_counter() - submitted)
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                # nobody may ever look at the future, so print it like a thread would
+                print(f"Unhandled error in {self.name} worker running {func.__name__}!")
+                traceback.print_exc()
+                with self._lock:
+                    self.failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self.completed += 1
+
+        return self._pool.submit(run)
+
+    def report(self) -> str:
+        """Returns the amount of calls and how long they were queued for since
+        the last report, an empty string if none were run or waiting."""
+        with self._lock:
+            queued = sorted(self.queued)
+            self.queued.clear()
+            backlog = self.max_pending
+            summary = (
+                f"{self.name}: {self.completed} calls, {self.failed} failed, "
+                f"queue depth {self.pending} (max {self.max_pending}), "
+            )
+            self.completed = self.failed = 0
+            self.max_pending = self.pending
+
+        if not queued:
+            # calls piling up behind one that hangs must show all the same
+            return summary + "none started" if backlog else ""
+        p95 = queued[min(len(queued) - 1, int(len(queued) * 0.95))]
+        return summary + f"p95 wait {round(p95 * 1000)}ms"
+
+
+# game inputs must happen in the order they were made, so they get one thread
+input_worker = Worker("input", 1)
+# discord posts and other I/O that may be slow, but should not pile up threads
+io_worker = Worker("io", 4)
+
+
+def run_on(worker: Worker):
+    """Runs the function on the worker, returns the future of its result so
+    that the caller can wait for it to finish when the order matters."""
+
+    def outer(func: Callable):
+        @functools.wraps(func)
+        def inner(*args, **kwargs) -> Future:
+            return worker.submit(func, *args, **kwargs)
+
+        return inner
+
+    return outer
+
 
 def threaded(name: str):
-    """Threads a function, beware that it will lose its return values"""
+    """Threads a function, beware that it will lose its return values.
+
+    Starts a new thread on each call, only for long running loops that would
+    otherwise hold on to a worker forever, see `run_on` for anything else."""
 
     def outer(func: Callable):
         @functools.wraps(func)
@@ -52,3 +204,122 @@ def format_seconds(seconds: int) -> str:
         return f"{minutes} minute{'s' if minutes != 1 else ''} {seconds} second{'s' if seconds != 1 else ''}"
     else:
         return f"{seconds} seconds"
+
+
+def wait_until(
+    predicate: Optional[Callable[[], bool]] = None,
+    timeout: float = 5,
+    poll: float = 0.05,
+    *,
+    region: Optional[
+        tuple[int, int, int, int] | list[tuple[int, int, int, int]]
+    ] = None,
+    settle: int = 3,
+    tolerance: float = 2.0,
+    expect_change: bool = False,
+    name: str = "wait",
+    sleep: Callable[[float], None] = time.sleep,
+) -> bool:
+    """Waits until the predicate holds or the given region of the screen has
+    settled, whichever comes first, instead of always sleeping the worst case.
+
+    Parameters
+    ----------
+    predicate :class:`Optional[Callable[[], bool]]`:
+        The condition to wait for, checked after every poll
+
+    timeout :class:`float`:
+        The maximum time to wait, usually the delay that was used before
+
+    poll :class:`float`:
+        The time between two checks
+
+    region :class:`Optional[tuple[int, int, int, int] | list[tuple[int, int, int, int]]]`:
+        The region or regions to watch, they have settled once none of them
+        changed for `settle` polls in a row, see `SettleDetector`
+
+    tolerance :class:`float`:
+        The mean pixel difference still considered to be unchanged
+
+    expect_change :class:`bool`:
+        Whether the region must have changed before it counts as settled, for
+        waits that may start before the screen reacted to the action
+
+    name :class:`str`:
+        The name to record the time the wait took under in `wait_times`
+
+    sleep :class:`Callable[[float], None]`:
+        The function to sleep with, pass the players sleep to respect pausing
+
+    Returns
+    -------
+    Whether the predicate held or the region settled before the timeout
+    """
+    start = time.time()
+    detector = None
+    if region is not None:
+        detector = SettleDetector(region, tolerance=tolerance, settle=settle)
+    done = False
+
+    while (time.time() - start) < timeout:
+        sleep(poll)
+        if isinstance(Ark.window, FrameCache):
+            Ark.window.invalidate()
+
+        if predicate is not None and predicate():
+            done = True
+            break
+
+        if detector is None:
+            continue
+
+        if detector.update(Ark.window) and (detector.changes or not expect_change):
+            done = True
+            break
+
+    wait_times.setdefault(name, WaitHistogram()).add(time.time() - start, not done)
+    return done
+
+
+def wait_settled(
+    *regions: tuple[int, int, int, int],
+    timeout: float,
+    name: str,
+    sleep: Callable[[float], None] = time.sleep,
+    expect_change: bool = True,
+) -> bool:
+    """Waits for the screen to settle after a transfer, drop or craft, rather
+    than sleeping the time it takes on a bad server every time.
+
+    Parameters
+    ----------
+    regions :class:`tuple[int, int, int, int]`:
+        The regions the action changes, for example the item regions of both
+        inventories of a transfer, each of them is watched on its own. The
+        whole screen if none are given.
+
+    timeout :class:`float`:
+        The maximum time to wait, the sleep the wait replaces
+
+    name :class:`str`:
+        The name to record the time the wait took under in `wait_times`
+
+    sleep :class:`Callable[[float], None]`:
+        The function to sleep with, pass the players sleep to respect pausing
+
+    expect_change :class:`bool`:
+        Whether to wait for the regions to change before they can settle,
+        leave on unless the action is known to have shown already
+    """
+    # a change and the settle after it take 5 samples, short waits poll faster
+    # so that those fit into a third of the timeout rather than all of it
+    settle = 3
+    return wait_until(
+        timeout=timeout,
+        poll=min(0.05, timeout / (3 * (settle + 2))),
+        region=list(regions) if regions else FULL_FRAME,
+        settle=settle,
+        expect_change=expect_change,
+        name=name,
+        sleep=sleep,
+    )
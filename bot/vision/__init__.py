@@ -0,0 +1,25 @@
+import sys
+
+if sys.platform != "win32":
+    # ark can only be imported on windows, elsewhere the vision code can still
+    # be run against recordings with the game window stood in for.
+    from ._stand_ins import install_stand_ins
+
+    install_stand_ins()
+
+from .capture import (
+    CaptureBackend,
+    LiveCapture,
+    RecordingCapture,
+    ReplayCapture,
+    create_capture_backend,
+    install_capture_backend,
+)
+from .digits import DigitRecognizer, Reading, segment_glyphs, vote
+from .frame_cache import FrameCache, install_frame_cache
+from .journal import Frame, Recording
+from .ocr import OCRBackend, OCRService, create_backend, ocr
+from .regions import RegionCapture, grab_thumbnail, union_region
+from .settle import SettleDetector
+from .slot_grid import SlotGrid
+from .templates import Template, TemplateRegistry, station_templates, templates
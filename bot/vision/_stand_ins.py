@@ -0,0 +1,133 @@
+"""Stand ins for the modules ark needs to find and control the game window,
+which can only be imported on windows (or with a display attached).
+
+Away from windows the vision code can only ever run against a recording (see
+`bot.vision.replay`), so the stand ins report a single 1920x1080 game window
+on a 1920x1080 monitor and raise if the bot tries to control the game. The
+paths ark resolves to its assets are kept in a form posix understands.
+"""
+
+import importlib.abc
+import importlib.machinery
+import os
+import sys
+from types import ModuleType, SimpleNamespace
+from typing import Optional
+
+
+def _unavailable(module: str):
+    def fail(*args, **kwargs):
+        raise RuntimeError(f"{module} is not available on {sys.platform}.")
+
+    return fail
+
+
+class _StandIn(ModuleType):
+    """A module whose every attribute that was not set explicitly is a
+    function raising a `RuntimeError` once it is called."""
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _unavailable(self.__name__)
+
+
+def _stand_in(name: str, **attributes) -> ModuleType:
+    module = _StandIn(name)
+    module.__dict__.update(attributes)
+    return module
+
+
+def _window(title: str) -> list[SimpleNamespace]:
+    return [SimpleNamespace(left=0, top=0, width=1920, height=1080, _hWnd=0)]
+
+
+def _monitors() -> list[SimpleNamespace]:
+    return [SimpleNamespace(x=0, y=0, width=1920, height=1080)]
+
+
+def _find(path: str) -> Optional[str]:
+    """Finds the path ignoring the case of its names, like windows does."""
+    if os.path.exists(path):
+        return path
+
+    parent, name = os.path.split(path)
+    parent = _find(parent) if parent and parent != path else parent
+    if not parent or not os.path.isdir(parent):
+        return None
+    for entry in os.listdir(parent):
+        if entry.lower() == name.lower():
+            return os.path.join(parent, entry)
+    return None
+
+
+class _PosixPaths(importlib.abc.MetaPathFinder):
+    """Keeps the paths ark resolves to its assets usable, it converts them to
+    use backslashes and relies on their case not mattering, like on windows."""
+
+    def find_spec(self, name, path, target=None):
+        if name != "ark._helpers":
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        if spec is None or spec.loader is None:
+            return None
+
+        exec_module = spec.loader.exec_module
+
+        def patched(module: ModuleType) -> None:
+            exec_module(module)
+            package = os.path.dirname(module.__file__)  # type: ignore[type-var]
+
+            def get_filepath(filepath: str) -> str:
+                found = _find(filepath) or _find(os.path.join(package, filepath))
+                if found is None:
+                    raise FileNotFoundError(f"Could not find {filepath} anywhere.")
+                return found
+
+            module.get_filepath = get_filepath  # type: ignore[attr-defined]
+
+        spec.loader.exec_module = patched  # type: ignore[method-assign]
+        return spec
+
+
+def _normalize(x, y=None) -> tuple:
+    return (x[0], x[1]) if y is None else (x, y)
+
+
+def install_stand_ins() -> None:
+    """Puts the stand ins in place of the windows only modules, unless they
+    were already imported."""
+    # the template matching of pyautogui is done by pyscreeze, which does
+    # not need a display. ark expects templates that were not found to be
+    # `None` rather than raise, like older versions of pyscreeze did.
+    import pyscreeze  # type: ignore[import]
+
+    pyscreeze.USE_IMAGE_NOT_FOUND_EXCEPTION = False
+
+    pynput = _stand_in("pynput")
+    stand_ins = {
+        "pyautogui": _stand_in(
+            "pyautogui",
+            locate=pyscreeze.locate,
+            locateAll=pyscreeze.locateAll,
+            _normalizeXYArgs=_normalize,
+        ),
+        "pydirectinput": _stand_in("pydirectinput"),
+        "pygetwindow": _stand_in(
+            "pygetwindow", getWindowsWithTitle=_window, Win32Window=SimpleNamespace
+        ),
+        "win32clipboard": _stand_in("win32clipboard"),
+        "screeninfo": _stand_in("screeninfo", get_monitors=_monitors),
+        "pynput": pynput,
+        "pynput.mouse": _stand_in(
+            "pynput.mouse",
+            Button=SimpleNamespace(),
+            # ark creates its mouse controller as the class is defined
+            Controller=lambda: _stand_in("pynput.mouse.Controller"),
+        ),
+    }
+    pynput.mouse = stand_ins["pynput.mouse"]  # type: ignore[attr-defined]
+    for name, module in stand_ins.items():
+        sys.modules.setdefault(name, module)
+    if "ark" not in sys.modules:
+        sys.meta_path.insert(0, _PosixPaths())
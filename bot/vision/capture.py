@@ -0,0 +1,254 @@
+import atexit
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Literal, Optional
+
+import ark
+import numpy as np
+from ark import ArkWindow
+from mss import mss, tools  # type: ignore[import]
+from mss.screenshot import ScreenShot  # type: ignore[import]
+
+from ..sleeps import call_site, sleep_accounting
+from .journal import Frame, Recording, Region
+
+# captures are attributed to the first caller outside of ark and the vision code
+_SKIPPED_DIRS = (os.path.dirname(ark.__file__), os.path.dirname(__file__))
+
+
+def contains(outer: Region, inner: Region) -> bool:
+    """Returns whether the inner region lies entirely within the outer one."""
+    ox, oy, ow, oh = outer
+    x, y, w, h = inner
+    return ox <= x and oy <= y and x + w <= ox + ow and y + h <= oy + oh
+
+
+def crop(pixels: np.ndarray, source: Region, region: Region) -> ScreenShot:
+    """Crops the region, in screen coordinates, from the pixels of a capture
+    of the source region and wraps it like a capture of its own."""
+    x, y, w, h = region
+    sx, sy, _, _ = source
+    pixels = pixels[y - sy : y - sy + h, x - sx : x - sx + w]
+    return ScreenShot(
+        bytearray(np.ascontiguousarray(pixels).tobytes()),
+        {"left": x, "top": y, "width": w, "height": h},
+    )
+
+
+class CaptureBackend(ABC):
+    """Provides the pixels of a region of the screen, in place of mss."""
+
+    name: str
+
+    @abstractmethod
+    def grab(self, region: Region) -> ScreenShot:
+        """Captures the region, given in screen coordinates (already converted
+        to the boundaries of the window)."""
+        ...
+
+    def close(self) -> None:
+        """Releases whatever the backend holds on to."""
+
+
+class LiveCapture(CaptureBackend):
+    """Captures the screen with mss, keeping one mss instance per thread rather
+    than creating one for every capture as ark does."""
+
+    name = "live"
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def grab(self, region: Region) -> ScreenShot:
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            sct = mss()
+            self._local.sct = sct
+
+        x, y, w, h = region
+        return sct.grab({"left": x, "top": y, "width": w, "height": h})
+
+
+class RecordingCapture(CaptureBackend):
+    """Captures the screen with another backend and tees every capture into a
+    recording, along with the station being completed and the line of bot
+    code that grabbed it. The frames are encoded and written on a background
+    thread so that the run being recorded is slowed down as little as possible.
+
+    Frames are dropped rather than queued once `MAX_PENDING` of them are
+    waiting to be written, each holds a full copy of the captured pixels.
+
+    Parameters
+    ----------
+    recording :class:`Recording`:
+        The recording to append the frames to
+
+    source :class:`CaptureBackend`: [optional]
+        The backend to capture with, live capture by default
+    """
+
+    name = "record"
+
+    # how many frames may wait to be written before further ones are dropped
+    MAX_PENDING = 32
+
+    def __init__(
+        self, recording: Recording, source: Optional[CaptureBackend] = None
+    ) -> None:
+        self.recording = recording
+        self.source = source or LiveCapture()
+        self.dropped = 0
+        self._pending = threading.BoundedSemaphore(self.MAX_PENDING)
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="recorder")
+        atexit.register(self.close)
+
+    def grab(self, region: Region) -> ScreenShot:
+        img = self.source.grab(region)
+        if not self._pending.acquire(blocking=False):
+            self.dropped += 1
+            return img
+
+        timestamp = time.time()
+        # the pixels must be copied before mss reuses its buffer
+        pixels = np.array(img)
+        future = self._writer.submit(
+            self.recording.append,
+            region,
+            pixels,
+            timestamp,
+            sleep_accounting.current_station,
+            call_site(_SKIPPED_DIRS),
+        )
+        future.add_done_callback(lambda _: self._pending.release())
+        return img
+
+    def close(self) -> None:
+        self._writer.shutdown(wait=True)
+        if self.dropped:
+            print(f"Dropped {self.dropped} frames the recorder fell behind on.")
+            self.dropped = 0
+        self.source.close()
+        self.recording.close()
+
+
+class ReplayCapture(CaptureBackend):
+    """Serves the frames of a recording in place of the screen.
+
+    As long as the code being replayed grabs the same regions in the same
+    order as during the recording, each grab is served the next frame. A
+    grab of a different region is served from the next few frames or the
+    last served frame containing it, so that changes to which regions are
+    grabbed can still be replayed. A region that is in none of them raises a
+    `LookupError`.
+
+    Parameters
+    ----------
+    recording :class:`Recording`:
+        The recording to replay
+    """
+
+    name = "replay"
+
+    # how many frames ahead of the cursor to look for a containing frame
+    LOOKAHEAD = 8
+
+    def __init__(self, recording: Recording) -> None:
+        self.recording = recording
+        self.cursor = 0
+        self.served = 0
+        self._last: Optional[Frame] = None
+        self._pinned: Optional[Frame] = None
+        self._lock = threading.Lock()
+
+    @property
+    def exhausted(self) -> bool:
+        return self.cursor >= len(self.recording)
+
+    def pin(self, index: Optional[int]) -> None:
+        """Serves every grab from the given frame only, `None` to continue
+        serving the frames in order."""
+        self._pinned = None if index is None else self.recording.frames[index]
+
+    def grab(self, region: Region) -> ScreenShot:
+        region = tuple(region)  # type: ignore[assignment]
+        with self._lock:
+            frame = self._find(region)
+            if frame is None:
+                raise LookupError(f"No recorded frame contains {region}.")
+            self.served += 1
+            return crop(self.recording.read(frame), frame.region, region)
+
+    def _find(self, region: Region) -> Optional[Frame]:
+        if self._pinned is not None:
+            return self._pinned if contains(self._pinned.region, region) else None
+
+        frames = self.recording.frames
+        for frame in frames[self.cursor : self.cursor + self.LOOKAHEAD]:
+            if contains(frame.region, region):
+                self.cursor = frame.index + 1
+                self._last = frame
+                return frame
+
+        if self._last is not None and contains(self._last.region, region):
+            return self._last
+        return None
+
+
+def create_capture_backend(
+    mode: Literal["live", "record", "replay"], directory: str
+) -> CaptureBackend:
+    """Creates the backend for the given mode. Recordings are made into a new
+    directory for each session within the directory, a replay serves the
+    recording in the directory itself."""
+    if mode == "live":
+        return LiveCapture()
+    if mode == "replay":
+        return ReplayCapture(Recording(directory))
+
+    session = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    return RecordingCapture(Recording(os.path.join(directory, session)))
+
+
+_backend: Optional[CaptureBackend] = None
+
+
+def install_capture_backend(backend: CaptureBackend) -> CaptureBackend:
+    """Routes `ArkWindow.grab_screen`, and thereby every template match and
+    screenshot ark takes, through the given backend. Installing another
+    backend later replaces the previous one."""
+    global _backend
+    if _backend is None:
+        _patch_grab_screen()
+    else:
+        _backend.close()
+    _backend = backend
+
+    if isinstance(backend, RecordingCapture):
+        print(f"Recording captures to {backend.recording.directory}.")
+    elif isinstance(backend, ReplayCapture):
+        print(f"Replaying {len(backend.recording)} captures.")
+    return backend
+
+
+def _patch_grab_screen() -> None:
+    def grab_screen(
+        window: ArkWindow,
+        region: Region,
+        path: Optional[str] = None,
+        convert: bool = True,
+    ):
+        if convert:
+            region = window.convert_region(region)
+        assert _backend is not None
+        img = _backend.grab(tuple(region))  # type: ignore[arg-type]
+
+        if path is None:
+            return img
+        tools.to_png(img.rgb, img.size, output=path)
+        return path
+
+    ArkWindow.grab_screen = grab_screen  # type: ignore[method-assign, assignment]
@@ -0,0 +1,267 @@
+import glob
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+import cv2 as cv  # type: ignore[import]
+import numpy as np
+
+# the size each glyph is normalized to before classifying it
+GLYPH_SIZE = 12
+
+
+@dataclass
+class Reading:
+    """The result of reading a number, `value` is `None` if no digits could be
+    found. Each digit comes with its confidence between 0 and 1."""
+
+    value: Optional[int]
+    digits: str = ""
+    confidences: list[float] = field(default_factory=list)
+
+    @property
+    def confidence(self) -> float:
+        """The confidence of the least certain digit."""
+        return min(self.confidences, default=0.0)
+
+
+def vote(reads: Iterable[str]) -> tuple[Optional[int], float]:
+    """Takes a per digit majority vote over several reads of the same number.
+
+    Only reads of the most common length take part, so that a read that
+    dropped or added a digit does not shift the others. Reads that are not
+    numbers are ignored.
+
+    Returns
+    -------
+    :class:`tuple[int | None, float]`:
+        The voted number, `None` without any valid reads, and the share of
+        votes the least agreed on digit got
+    """
+    numbers = [read for read in reads if read.isdigit()]
+    if not numbers:
+        return None, 0.0
+
+    length = Counter(map(len, numbers)).most_common(1)[0][0]
+    candidates = [read for read in numbers if len(read) == length]
+
+    digits = ""
+    agreement = 1.0
+    for position in zip(*candidates):
+        digit, count = Counter(position).most_common(1)[0]
+        digits += digit
+        agreement = min(agreement, count / len(numbers))
+    return int(digits), agreement
+
+
+def segment_glyphs(mask: np.ndarray) -> list[np.ndarray]:
+    """Splits a denoised text mask into its glyphs, from left to right.
+
+    Components much smaller than the tallest one are dropped as noise, each
+    glyph is padded to a square to keep its aspect ratio (a 1 must not look
+    like an 8) and resized to `GLYPH_SIZE`.
+
+    Parameters
+    ----------
+    mask :class:`np.ndarray`:
+        The binary mask as returned by `ArkWindow.denoise_text`
+
+    Returns
+    -------
+    :class:`list[np.ndarray]`:
+        The flattened glyphs as float32 arrays between 0 and 1
+    """
+    mask = np.asarray(mask)
+    if mask.ndim == 3:
+        mask = cv.cvtColor(mask, cv.COLOR_BGR2GRAY)
+    binary = (mask > 127).astype(np.uint8)
+
+    count, _, stats, _ = cv.connectedComponentsWithStats(binary, connectivity=8)
+    # the first component is the background
+    boxes = stats[1:count]
+    if not len(boxes):
+        return []
+
+    tallest = boxes[:, cv.CC_STAT_HEIGHT].max()
+    boxes = boxes[boxes[:, cv.CC_STAT_HEIGHT] >= tallest * 0.5]
+    boxes = boxes[np.argsort(boxes[:, cv.CC_STAT_LEFT])]
+
+    glyphs = []
+    for x, y, w, h, _ in boxes:
+        glyph = binary[y : y + h, x : x + w]
+        side = max(w, h)
+        square = np.zeros((side, side), dtype=np.uint8)
+        top, left = (side - h) // 2, (side - w) // 2
+        square[top : top + h, left : left + w] = glyph * 255
+
+        resized = cv.resize(
+            square, (GLYPH_SIZE, GLYPH_SIZE), interpolation=cv.INTER_AREA
+        )
+        glyphs.append(resized.astype(np.float32).ravel() / 255)
+    return glyphs
+
+
+class DigitRecognizer:
+    """Reads the numbers on the dedicated storages without tesseract by
+    classifying each glyph against a labelled corpus of glyphs using the k
+    nearest neighbours, all in numpy.
+
+    The corpus is a directory of denoised dedi images named after the number
+    they show, which is built up from the reads that passed validation. The
+    images can be relabelled by renaming them and are split into glyphs when
+    the recognizer is loaded.
+
+    Parameters
+    ----------
+    directory :class:`str`:
+        The directory of the labelled corpus
+
+    k :class:`int`:
+        The amount of neighbours to consider for each glyph
+    """
+
+    MIN_CONFIDENCE = 0.75
+    MAX_CORPUS = 500
+
+    # mean squared difference to the nearest glyph at which confidence is lost
+    MAX_DISTANCE = 0.12
+
+    def __init__(self, directory: str = "bot/_data/dedi_corpus", k: int = 3) -> None:
+        self.directory = directory
+        self.k = k
+        self._samples = np.empty((0, GLYPH_SIZE * GLYPH_SIZE), dtype=np.float32)
+        self._labels = np.empty(0, dtype=np.int64)
+        self._norms = np.empty(0, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    @property
+    def trained(self) -> bool:
+        return len(self) >= self.k
+
+    @property
+    def complete(self) -> bool:
+        """Whether the corpus has at least `k` glyphs of every digit, until
+        then any number with a digit it lacks is misread."""
+        counts = np.bincount(self._labels, minlength=10)
+        return bool(counts.min() >= self.k)
+
+    @staticmethod
+    def corpus(directory: str) -> list[tuple[str, int]]:
+        """Returns the images of the corpus with their labels, oldest first."""
+        entries = []
+        for path in glob.glob(os.path.join(directory, "*.png")):
+            label = os.path.basename(path).split("_")[0]
+            if label.isdigit():
+                entries.append((path, int(label)))
+        return sorted(entries, key=lambda entry: os.path.getmtime(entry[0]))
+
+    @classmethod
+    def load(cls, directory: str = "bot/_data/dedi_corpus") -> "DigitRecognizer":
+        """Creates a recognizer trained on the corpus in the given directory."""
+        start = time.perf_counter()
+        recognizer = cls(directory)
+        for path, value in cls.corpus(directory):
+            mask = cv.imread(path, cv.IMREAD_GRAYSCALE)
+            if mask is not None:
+                recognizer.train(mask, value)
+
+        print(
+            f"Loaded {len(recognizer)} dedi glyphs in "
+            f"{round((time.perf_counter() - start) * 1000)}ms."
+        )
+        return recognizer
+
+    def train(self, mask: np.ndarray, value: int) -> bool:
+        """Adds the glyphs of the mask labelled with the digits of the value,
+        only if the mask splits into exactly as many glyphs as there are
+        digits.
+
+        Returns
+        -------
+        Whether the glyphs were added
+        """
+        glyphs = segment_glyphs(mask)
+        digits = str(value)
+        if len(glyphs) != len(digits):
+            return False
+
+        samples = np.stack(glyphs)
+        self._samples = np.vstack((self._samples, samples))
+        self._labels = np.concatenate(
+            (self._labels, np.array([int(d) for d in digits], dtype=np.int64))
+        )
+        self._norms = np.concatenate((self._norms, (samples**2).sum(axis=1)))
+        return True
+
+    def learn(self, mask: np.ndarray, value: int) -> None:
+        """Trains on the mask and adds it to the corpus, removing the oldest
+        images once the corpus is full."""
+        if not self.train(mask, value):
+            return
+
+        os.makedirs(self.directory, exist_ok=True)
+        cv.imwrite(
+            os.path.join(self.directory, f"{value}_{time.time_ns()}.png"),
+            np.asarray(mask),
+        )
+        entries = self.corpus(self.directory)
+        for path, _ in entries[: max(0, len(entries) - self.MAX_CORPUS)]:
+            os.remove(path)
+
+    def classify(self, glyphs: Iterable[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+        """Classifies the glyphs against the corpus in a single pass.
+
+        The confidence of a glyph is the distance weighted share of the k
+        nearest neighbours that agree on its digit, lowered by how far it
+        is from the nearest one so that unknown shapes are never confident.
+
+        Returns
+        -------
+        :class:`tuple[np.ndarray, np.ndarray]`:
+            The digit of each glyph and the confidence of each digit
+        """
+        queries = np.stack(list(glyphs))
+        if not self.trained:
+            return np.zeros(len(queries), dtype=np.int64), np.zeros(len(queries))
+
+        distances = (
+            (queries**2).sum(axis=1)[:, None]
+            + self._norms[None, :]
+            - 2 * queries @ self._samples.T
+        )
+        distances = np.maximum(distances, 0) / queries.shape[1]
+
+        nearest = np.argpartition(distances, self.k - 1, axis=1)[:, : self.k]
+        nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+        weights = 1 / (nearest_distances + 1e-3)
+
+        votes = np.zeros((len(queries), 10))
+        rows = np.repeat(np.arange(len(queries)), self.k)
+        np.add.at(votes, (rows, self._labels[nearest].ravel()), weights.ravel())
+
+        digits = votes.argmax(axis=1)
+        confidences = votes.max(axis=1) / votes.sum(axis=1)
+        confidences *= np.clip(
+            1 - nearest_distances.min(axis=1) / self.MAX_DISTANCE, 0, 1
+        )
+        return digits, confidences
+
+    def read(self, mask: np.ndarray) -> Reading:
+        """Reads the number shown in the denoised text mask.
+
+        Parameters
+        ----------
+        mask :class:`np.ndarray`:
+            The binary mask as returned by `ArkWindow.denoise_text`
+        """
+        glyphs = segment_glyphs(mask)
+        if not glyphs:
+            return Reading(None)
+
+        digits, confidences = self.classify(glyphs)
+        text = "".join(map(str, digits))
+        return Reading(int(text), text, [float(c) for c in confidences])
@@ -0,0 +1,148 @@
+import functools
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+import pyautogui as pg  # type: ignore[import]
+import pydirectinput  # type: ignore[import]
+from ark import Ark, ArkWindow
+from mss.screenshot import ScreenShot  # type: ignore[import]
+
+from .capture import contains, crop
+
+# the input functions that may change what is on the screen
+_PYAUTOGUI_INPUTS = (
+    "press",
+    "click",
+    "moveTo",
+    "moveRel",
+    "dragTo",
+    "keyDown",
+    "keyUp",
+    "mouseDown",
+    "mouseUp",
+    "typewrite",
+    "write",
+    "hotkey",
+    "scroll",
+)
+_PYDIRECTINPUT_INPUTS = (
+    "press",
+    "click",
+    "moveTo",
+    "moveRel",
+    "keyDown",
+    "keyUp",
+    "mouseDown",
+    "mouseUp",
+)
+
+
+class FrameCache(ArkWindow):
+    """Takes the place of the shared `ArkWindow` to serve consecutive screen
+    grabs from the same capture, as long as no input was sent in between and
+    the capture is younger than the TTL.
+
+    A grab is served from a cached capture if its region is contained in the
+    captured region, so a `has` followed by a `count` on the same inventory
+    only captures the screen once.
+
+    Parameters
+    ----------
+    window :class:`ArkWindow`:
+        The window to take the boundaries and monitor from
+
+    ttl :class:`float`:
+        The amount of seconds a capture may be served for
+    """
+
+    MAX_FRAMES = 8
+
+    def __init__(self, window: ArkWindow, ttl: float) -> None:
+        # take over the state of the window rather than querying it again
+        self.__dict__.update(window.__dict__)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._frames: list[tuple[tuple[int, int, int, int], ScreenShot, float]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def invalidate(self) -> None:
+        """Drops all captures, called whenever an input was sent."""
+        with self._lock:
+            self._frames.clear()
+
+    def grab_screen(
+        self,
+        region: tuple[int, int, int, int],
+        path: Optional[str] = None,
+        convert: bool = True,
+    ):
+        if path is not None:
+            return super().grab_screen(region, path, convert)
+
+        if convert:
+            region = self.convert_region(region)
+        region = tuple(region)  # type: ignore[assignment]
+
+        with self._lock:
+            cached = self._find(region)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+        img = super().grab_screen(region, convert=False)
+        with self._lock:
+            self.misses += 1
+            self._frames.append((region, img, time.perf_counter()))
+            del self._frames[: -self.MAX_FRAMES]
+        return img
+
+    def _find(self, region: tuple[int, int, int, int]) -> Optional[ScreenShot]:
+        """Returns the region from a valid capture containing it, if any."""
+        now = time.perf_counter()
+        self._frames = [f for f in self._frames if now - f[2] <= self.ttl]
+
+        for frame_region, img, _ in reversed(self._frames):
+            if frame_region == region:
+                return img
+            if contains(frame_region, region):
+                return crop(np.asarray(img), frame_region, region)
+        return None
+
+
+def install_frame_cache(ttl: float) -> FrameCache:
+    """Replaces the shared window of all ark objects with a frame cache and
+    hooks the input functions to invalidate it. Requires the window to have
+    been created already, for example by creating the `Player`."""
+    if isinstance(Ark.window, FrameCache):
+        return Ark.window
+
+    cache = FrameCache(Ark.window, ttl)
+    Ark.window = cache
+
+    def invalidating(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache.invalidate()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                cache.invalidate()
+
+        return wrapper
+
+    inputs = ((pg, _PYAUTOGUI_INPUTS), (pydirectinput, _PYDIRECTINPUT_INPUTS))
+    for module, names in inputs:
+        for name in names:
+            if hasattr(module, name):
+                setattr(module, name, invalidating(getattr(module, name)))
+
+    Ark.mouse.scroll = invalidating(Ark.mouse.scroll)
+    return cache
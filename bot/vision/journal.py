@@ -0,0 +1,275 @@
+import json
+import mmap
+import os
+import threading
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+Region = tuple[int, int, int, int]
+
+# one fixed size record per frame, so that the index can be read in one go
+# and searched by timestamp, station or call site without touching the frames
+INDEX_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("region", "<i4", 4),
+        ("base", "<i4"),
+        ("offset", "<u8"),
+        ("length", "<u4"),
+        ("station", "<u2"),
+        ("site", "<u2"),
+    ]
+)
+
+
+@dataclass
+class Frame:
+    """A frame of a recording, captured of `region` at `timestamp` while the
+    station was being completed, by the line of code given as `site`."""
+
+    index: int
+    timestamp: float
+    region: Region
+    station: Optional[str] = None
+    site: Optional[str] = None
+
+
+class Recording:
+    """A journal of captured frames, stored in a directory as three files:
+
+    - `frames.journal`, the compressed pixels of each frame back to back
+    - `frames.index`, a fixed size record of each frame pointing into it
+    - `labels.jsonl`, the station and call site names the records refer to
+
+    Captures of the same region as a recent frame (such as consecutive full
+    frames or polling the same inventory) are stored as the difference to
+    that frame, which is mostly zeros and compresses to a fraction of its
+    size. Every `KEYFRAME_INTERVAL` captures of a region are stored whole
+    so that reading any frame only ever needs a bounded chain of frames.
+
+    The journal is memory-mapped for reading, only the frames that are read
+    are ever decompressed.
+
+    Parameters
+    ----------
+    directory :class:`str`:
+        The directory of the recording, created on the first frame
+    """
+
+    JOURNAL = "frames.journal"
+    INDEX = "frames.index"
+    LABELS = "labels.jsonl"
+
+    KEYFRAME_INTERVAL = 30
+    # zlib level 1 compresses the deltas nearly as well as the highest level
+    COMPRESSION = 1
+
+    # the amount of regions to keep the last capture of for delta encoding
+    MAX_BASES = 16
+    MAX_DECODED = 16
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.frames: list[Frame] = []
+        self.labels: list[Optional[str]] = [None]
+        # the index grows geometrically, so appending a record is amortized
+        # constant rather than copying the whole index every time
+        self._buffer = np.empty(0, dtype=INDEX_DTYPE)
+        self._count = 0
+        self._lock = threading.Lock()
+
+        self._journal = None
+        self._index = None
+        self._size = 0
+        self._bases: dict[Region, tuple[int, int, np.ndarray]] = {}
+
+        self._map: Optional[mmap.mmap] = None
+        self._decoded: dict[int, np.ndarray] = {}
+
+        if os.path.exists(self._path(self.INDEX)):
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    @property
+    def _records(self) -> np.ndarray:
+        return self._buffer[: self._count]
+
+    @property
+    def duration(self) -> float:
+        """The amount of seconds between the first and the last frame."""
+        if not self.frames:
+            return 0
+        return self.frames[-1].timestamp - self.frames[0].timestamp
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the compressed frames."""
+        return int(self._records["length"].sum())
+
+    @property
+    def raw_nbytes(self) -> int:
+        """The size the frames would take up uncompressed."""
+        sizes = self._records["region"][:, 2].astype(np.int64)
+        return int((sizes * self._records["region"][:, 3] * 4).sum())
+
+    def seek(self, timestamp: float) -> int:
+        """Returns the index of the first frame captured at or after the time."""
+        return int(np.searchsorted(self._records["timestamp"], timestamp))
+
+    def select(
+        self, station: Optional[str] = None, site: Optional[str] = None
+    ) -> list[Frame]:
+        """Returns the frames captured for the station and by the call site,
+        either may be left out. The site matches any site containing it."""
+        mask = np.ones(len(self._records), dtype=bool)
+        if station is not None:
+            ids = [i for i, label in enumerate(self.labels) if label == station]
+            mask &= np.isin(self._records["station"], ids)
+        if site is not None:
+            ids = [i for i, label in enumerate(self.labels) if label and site in label]
+            mask &= np.isin(self._records["site"], ids)
+        return [self.frames[i] for i in np.flatnonzero(mask)]
+
+    def append(
+        self,
+        region: Region,
+        pixels: np.ndarray,
+        timestamp: float,
+        station: Optional[str] = None,
+        site: Optional[str] = None,
+    ) -> Frame:
+        """Writes the BGRA pixels of a capture of the region as the next frame."""
+        region = tuple(region)  # type: ignore[assignment]
+        with self._lock:
+            index = len(self.frames)
+            base, payload = index, pixels
+            previous = self._bases.pop(region, None)
+            if previous is not None and previous[1] < self.KEYFRAME_INTERVAL:
+                base, payload = previous[0], np.bitwise_xor(pixels, previous[2])
+                self._bases[region] = (index, previous[1] + 1, pixels)
+            else:
+                self._bases[region] = (index, 1, pixels)
+            if len(self._bases) > self.MAX_BASES:
+                del self._bases[next(iter(self._bases))]
+
+            data = zlib.compress(np.ascontiguousarray(payload), self.COMPRESSION)
+            record = np.array(
+                [
+                    (
+                        timestamp,
+                        region,
+                        base,
+                        self._size,
+                        len(data),
+                        self._label(station),
+                        self._label(site),
+                    )
+                ],
+                dtype=INDEX_DTYPE,
+            )
+
+            if self._journal is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._journal = open(self._path(self.JOURNAL), "ab")
+                self._index = open(self._path(self.INDEX), "ab")
+            assert self._index is not None
+            # the frame is only indexed once its pixels are on disk
+            self._journal.write(data)
+            self._journal.flush()
+            self._index.write(record.tobytes())
+            self._index.flush()
+
+            self._size += len(data)
+            if self._count == len(self._buffer):
+                buffer = np.empty(max(64, self._count * 2), dtype=INDEX_DTYPE)
+                buffer[: self._count] = self._records
+                self._buffer = buffer
+            self._buffer[self._count] = record[0]
+            self._count += 1
+            frame = Frame(index, timestamp, region, station, site)
+            self.frames.append(frame)
+        return frame
+
+    def read(self, frame: Frame) -> np.ndarray:
+        """Returns the BGRA pixels of the frame."""
+        with self._lock:
+            # walk back to a frame that is decoded already or stored whole
+            chain = [frame.index]
+            while True:
+                index = chain[-1]
+                base = int(self._records[index]["base"])
+                if index in self._decoded or base == index:
+                    break
+                chain.append(base)
+
+            pixels = self._decoded.get(chain[-1])
+            if pixels is None:
+                pixels = self._decompress(chain[-1])
+            for index in reversed(chain[:-1]):
+                pixels = np.bitwise_xor(pixels, self._decompress(index))
+
+            self._decoded[frame.index] = pixels
+            if len(self._decoded) > self.MAX_DECODED:
+                del self._decoded[next(iter(self._decoded))]
+            return pixels
+
+    def close(self) -> None:
+        with self._lock:
+            for file in (self._journal, self._index, self._map):
+                if file is not None:
+                    file.close()
+            self._journal = self._index = self._map = None
+
+    def _decompress(self, index: int) -> np.ndarray:
+        record = self._records[index]
+        offset, length = int(record["offset"]), int(record["length"])
+        if self._map is None or offset + length > len(self._map):
+            if self._map is not None:
+                self._map.close()
+            with open(self._path(self.JOURNAL), "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        data = zlib.decompress(memoryview(self._map)[offset : offset + length])
+        _, _, w, h = record["region"]
+        return np.frombuffer(data, dtype=np.uint8).reshape(h, w, 4)
+
+    def _label(self, label: Optional[str]) -> int:
+        if label in self.labels:
+            return self.labels.index(label)
+
+        self.labels.append(label)
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(self.LABELS), "a") as f:
+            f.write(json.dumps(label) + "\n")
+        return len(self.labels) - 1
+
+    def _load(self) -> None:
+        if os.path.exists(self._path(self.LABELS)):
+            with open(self._path(self.LABELS)) as f:
+                self.labels.extend(json.loads(line) for line in f)
+
+        records = np.fromfile(self._path(self.INDEX), dtype=INDEX_DTYPE)
+        journal = self._path(self.JOURNAL)
+        self._size = os.path.getsize(journal) if os.path.exists(journal) else 0
+        # drop records of frames that did not make it to disk entirely
+        records = records[records["offset"] + records["length"] <= self._size]
+
+        self._buffer, self._count = records, len(records)
+        self.frames = [
+            Frame(
+                index,
+                float(record["timestamp"]),
+                tuple(int(v) for v in record["region"]),  # type: ignore[arg-type]
+                self.labels[record["station"]],
+                self.labels[record["site"]],
+            )
+            for index, record in enumerate(records)
+        ]
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
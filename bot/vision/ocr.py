@@ -0,0 +1,204 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Hashable, Literal, Optional, TypeVar
+
+import numpy as np
+from ark import config
+from PIL import Image  # type: ignore[import]
+from pytesseract import pytesseract as tes  # type: ignore[import]
+
+K = TypeVar("K", bound=Hashable)
+
+
+class OCRBackend(ABC):
+    """Reads the text of an image, implementations are used from several
+    worker threads at once."""
+
+    name: str
+
+    @abstractmethod
+    def read(self, image: np.ndarray, whitelist: Optional[str], psm: int) -> str:
+        """Returns the text in the image.
+
+        Parameters
+        ----------
+        image :class:`np.ndarray`:
+            The image to read, usually a denoised text mask
+
+        whitelist :class:`str`:
+            The only characters to recognize, `None` for all
+
+        psm :class:`int`:
+            The tesseract page segmentation mode
+        """
+        ...
+
+
+class PytesseractBackend(OCRBackend):
+    """Runs a tesseract process for every read, the pool still allows several
+    reads to run at the same time."""
+
+    name = "pytesseract"
+
+    def read(self, image: np.ndarray, whitelist: Optional[str], psm: int) -> str:
+        options = f"--psm {psm}"
+        if whitelist is not None:
+            options = f"-c tessedit_char_whitelist={whitelist} {options}"
+        return tes.image_to_string(image, config=options)
+
+
+class TesserocrBackend(OCRBackend):
+    """Keeps one tesseract engine loaded per worker thread through the tesserocr
+    bindings, so that reading does not spawn a process or write a file."""
+
+    name = "tesserocr"
+
+    def __init__(self) -> None:
+        import tesserocr  # type: ignore[import]
+
+        self._tesserocr = tesserocr
+        self._tessdata = os.path.join(
+            os.path.dirname(config.TESSERACT_PATH), "tessdata"
+        )
+        self._local = threading.local()
+
+    def read(self, image: np.ndarray, whitelist: Optional[str], psm: int) -> str:
+        api = getattr(self._local, "api", None)
+        if api is None:
+            api = self._tesserocr.PyTessBaseAPI(path=self._tessdata)
+            self._local.api = api
+
+        api.SetPageSegMode(psm)
+        api.SetVariable("tessedit_char_whitelist", whitelist or "")
+        api.SetImage(Image.fromarray(np.asarray(image)))
+        return api.GetUTF8Text()
+
+
+def create_backend(
+    backend: Literal["auto", "tesserocr", "pytesseract"] = "auto",
+) -> OCRBackend:
+    """Creates the given backend, "auto" uses tesserocr if it is installed."""
+    if backend == "pytesseract":
+        return PytesseractBackend()
+
+    try:
+        return TesserocrBackend()
+    except ImportError:
+        if backend == "tesserocr":
+            raise
+        print(
+            "WARNING! tesserocr is not installed, every OCR read starts a "
+            "tesseract process. Install the requirements again to fix it."
+        )
+        return PytesseractBackend()
+
+
+class OCRService:
+    """Reads images on a pool of long lived OCR workers, so that several
+    regions can be recognized at once while the bot continues with its next
+    steps. The latency of each read, from submitting it to its result, is
+    recorded until reported.
+
+    Parameters
+    ----------
+    backend :class:`str`:
+        The backend to use, see `create_backend`
+
+    workers :class:`int`:
+        The amount of reads to run at the same time
+
+    vote_frames :class:`int`:
+        The amount of frames to vote over when a read is invalid, 0 to disable
+    """
+
+    def __init__(
+        self,
+        backend: Literal["auto", "tesserocr", "pytesseract"] = "auto",
+        workers: int = 3,
+        vote_frames: int = 0,
+    ) -> None:
+        self._backend_name = backend
+        self._workers = workers
+        self.vote_frames = vote_frames
+        self._backend: Optional[OCRBackend] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.latencies: list[float] = []
+
+    def configure(
+        self,
+        backend: Literal["auto", "tesserocr", "pytesseract"],
+        workers: int,
+        vote_frames: int = 0,
+    ) -> None:
+        """Changes the backend and amount of workers, only possible before the
+        first read. The backend is created right away, so that the one in use
+        shows when the bot starts."""
+        assert self._pool is None, "OCR service is already running."
+        self._backend_name = backend
+        self._workers = workers
+        self.vote_frames = vote_frames
+        self._backend = None
+        self.backend  # creates the backend and reports it
+
+    @property
+    def backend(self) -> OCRBackend:
+        if self._backend is None:
+            self._backend = create_backend(self._backend_name)
+            print(f"OCR using {self._backend.name} with {self._workers} workers.")
+        return self._backend
+
+    def submit(
+        self, image: np.ndarray, whitelist: Optional[str] = None, psm: int = 6
+    ) -> Future[str]:
+        """Queues the image to be read, returns the future of its text."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self._workers, thread_name_prefix="ocr")
+        backend = self.backend
+        submitted = time.perf_counter()
+
+        def read() -> str:
+            try:
+                return backend.read(image, whitelist, psm)
+            finally:
+                with self._lock:
+                    self.latencies.append(time.perf_counter() - submitted)
+
+        return self._pool.submit(read)
+
+    def submit_batch(
+        self, images: dict[K, np.ndarray], whitelist: Optional[str] = None, psm: int = 6
+    ) -> dict[K, Future[str]]:
+        """Queues each of the images, returns the future of each of their texts."""
+        return {
+            key: self.submit(image, whitelist, psm) for key, image in images.items()
+        }
+
+    def read(
+        self, image: np.ndarray, whitelist: Optional[str] = None, psm: int = 6
+    ) -> str:
+        """Reads the image and waits for its text."""
+        return self.submit(image, whitelist, psm).result()
+
+    def report(self) -> str:
+        """Returns the amount and latencies of the reads since the last report,
+        an empty string if there were none."""
+        with self._lock:
+            latencies = sorted(self.latencies)
+            self.latencies.clear()
+
+        if not latencies:
+            return ""
+        mean = sum(latencies) / len(latencies)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        return (
+            f"{len(latencies)} reads with {self.backend.name}, "
+            f"avg {round(mean * 1000)}ms, p95 {round(p95 * 1000)}ms"
+        )
+
+
+ocr = OCRService()
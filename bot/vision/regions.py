@@ -0,0 +1,57 @@
+from typing import Iterable
+
+from ark import ArkWindow
+from PIL import Image  # type: ignore[import]
+
+FULL_FRAME = (0, 0, 1920, 1080)
+
+
+def union_region(
+    regions: Iterable[tuple[int, int, int, int]]
+) -> tuple[int, int, int, int]:
+    """Returns the smallest region containing all of the given regions."""
+    regions = list(regions)
+    left = min(x for x, _, _, _ in regions)
+    top = min(y for _, y, _, _ in regions)
+    right = max(x + w for x, _, w, _ in regions)
+    bottom = max(y + h for _, y, _, h in regions)
+    return left, top, right - left, bottom - top
+
+
+class RegionCapture:
+    """A single capture of the union of several regions of the screen, so that
+    only the part of the frame that is actually needed is grabbed and converted.
+
+    Parameters
+    ----------
+    window :class:`ArkWindow`:
+        The window to grab the screen with
+
+    regions :class:`Iterable[tuple[int, int, int, int]]`:
+        The regions that will be cropped from the capture later
+    """
+
+    def __init__(
+        self, window: ArkWindow, regions: Iterable[tuple[int, int, int, int]]
+    ) -> None:
+        self.region = union_region(regions)
+        img = window.grab_screen(self.region)
+        self.image: Image.Image = Image.frombytes("RGB", img.size, img.rgb)
+
+    def crop(self, region: tuple[int, int, int, int]) -> Image.Image:
+        """Crops the given region, in screen coordinates, from the capture."""
+        x, y, w, h = region
+        left, top = x - self.region[0], y - self.region[1]
+        return self.image.crop((left, top, left + w, top + h))
+
+
+def grab_thumbnail(window: ArkWindow, scale: float = 0.5) -> Image.Image:
+    """Grabs the full frame and downscales it, for when an overview of the
+    screen is needed rather than the details (for example error reports)."""
+    img = window.grab_screen(FULL_FRAME)
+    image = Image.frombytes("RGB", img.size, img.rgb)
+    if scale >= 1:
+        return image
+
+    size = (round(image.width * scale), round(image.height * scale))
+    return image.resize(size, Image.Resampling.BILINEAR)
@@ -0,0 +1,223 @@
+"""Replays the vision checks of the stations against a recording of a run.
+
+Every check is run against every recorded frame that contains the regions it
+needs, the results are compared to those stored with the recording so that
+changes to the vision code can be validated without the game running.
+
+Usage: py -m bot.vision.replay RECORDING [--check NAME ...] [--station NAME]
+    [--site TEXT] [--update]
+
+The game does not need to be installed, away from windows the modules ark
+uses to control it are stood in for (see `bot.vision._stand_ins`).
+"""
+
+import argparse
+import functools
+import json
+import os
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+from ark import (
+    Ark,
+    ArkWindow,
+    InputSettings,
+    Inventory,
+    PlayerInventory,
+    UserSettings,
+    items,
+)
+from ark.exceptions import InventoryNotOpenError
+
+from ..stations.grinding._settings import GrindingStationSettings
+from .capture import Recording, ReplayCapture, install_capture_backend
+from .digits import DigitRecognizer
+from .regions import RegionCapture
+
+# the items whose icons the stations look for in the player inventory
+INVENTORY_ITEMS = (
+    items.PELLET,
+    items.SPARKPOWDER,
+    items.GUNPOWDER,
+    items.TINTOBERRY,
+    items.DUST,
+    items.BLACK_PEARL,
+)
+
+
+@functools.cache
+def grinding_settings() -> GrindingStationSettings:
+    return GrindingStationSettings.load()
+
+
+@functools.cache
+def recognizer() -> DigitRecognizer:
+    return DigitRecognizer.load()
+
+
+def check_dedi(window: ArkWindow) -> dict[str, int | None]:
+    settings = grinding_settings()
+    regions = {
+        "pearls": settings.pearls_region,
+        "paste": settings.paste_region,
+        "electronics": settings.electronics_region,
+        "ingots": settings.ingots_region,
+        "crystal": settings.crystal_region,
+        "hide": settings.hide_region,
+    }
+    capture = RegionCapture(window, regions.values())
+    return {
+        name: recognizer()
+        .read(window.denoise_text(capture.crop(region), settings.text_rgb, 22))
+        .value
+        for name, region in regions.items()
+    }
+
+
+def check_has(window: ArkWindow) -> dict[str, bool]:
+    inventory = PlayerInventory()
+    return {item.name: inventory.has(item) for item in INVENTORY_ITEMS}
+
+
+def check_count(window: ArkWindow) -> dict[str, int]:
+    inventory = PlayerInventory()
+    return {item.name: inventory.count(item) for item in INVENTORY_ITEMS}
+
+
+def check_full(window: ArkWindow) -> bool | None:
+    vault = Inventory("Vault", capacity="assets/templates/vault_capped.png")
+    try:
+        return vault.is_full()
+    except InventoryNotOpenError:
+        return None
+
+
+def check_folder(window: ArkWindow) -> int | None:
+    # a single pass of `get_folder_index`, which waits and retries otherwise
+    inventory = Inventory("Crop Plot")
+    for index, option in enumerate(inventory._FOLDERS, start=1):
+        if window.locate_template(
+            f"{inventory.PKG_DIR}/assets/interfaces/folder_{option}.png",
+            region=(1240, 290, 55, 34),
+            confidence=0.9,
+        ):
+            return index
+    return None
+
+
+def prepare(window: ArkWindow) -> None:
+    """Sets up ark to run the checks with the window. The checks only ever
+    look at the frames, so the configs of a game that may not even be
+    installed are stood in for where they can not be loaded."""
+    Ark.window = window
+    for attr, settings in (("keybinds", InputSettings), ("settings", UserSettings)):
+        try:
+            setattr(Ark, attr, settings.load())
+        except OSError:
+            setattr(Ark, attr, SimpleNamespace())
+
+
+CHECKS: dict[str, Callable[[ArkWindow], object]] = {
+    "dedi": check_dedi,
+    "has": check_has,
+    "count": check_count,
+    "full": check_full,
+    "folder": check_folder,
+}
+
+
+def summarize(name: str, latencies: list[float], mismatches: int) -> str:
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return (
+        f"{name}: {len(latencies)} frames, {mismatches} mismatches, "
+        f"mean {statistics.mean(latencies) * 1000:.2f}ms, p95 {p95 * 1000:.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="py -m bot.vision.replay",
+        description="Runs the vision checks against a recording of a run.",
+    )
+    parser.add_argument("recording")
+    parser.add_argument(
+        "--check", nargs="+", choices=list(CHECKS), default=list(CHECKS)
+    )
+    parser.add_argument("--station", help="only replay the frames of the station")
+    parser.add_argument(
+        "--site", help="only replay the frames grabbed by lines matching the text"
+    )
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="store the results as the expected results of the recording",
+    )
+    args = parser.parse_args()
+
+    recording = Recording(args.recording)
+    if not recording:
+        print(f"No frames recorded in {args.recording}.")
+        return
+    frames = recording.select(args.station, args.site)
+    print(
+        f"Replaying {len(frames)} of {len(recording)} frames spanning "
+        f"{round(recording.duration)}s, {recording.nbytes / 2**20:.1f} MiB "
+        f"compressed from {recording.raw_nbytes / 2**20:.1f} MiB."
+    )
+
+    replay = ReplayCapture(recording)
+    install_capture_backend(replay)
+    window = ArkWindow()
+    prepare(window)
+
+    expected_path = os.path.join(args.recording, "expected.json")
+    expected: dict[str, dict[str, object]] = {}
+    if os.path.exists(expected_path):
+        with open(expected_path) as f:
+            expected = json.load(f)
+
+    results: dict[str, dict[str, object]] = {name: {} for name in args.check}
+    latencies: dict[str, list[float]] = {name: [] for name in args.check}
+    mismatches: dict[str, int] = {name: 0 for name in args.check}
+
+    for frame in frames:
+        replay.pin(frame.index)
+        for name in args.check:
+            start = time.perf_counter()
+            try:
+                result = CHECKS[name](window)
+            except LookupError:
+                # the frame does not contain what the check looks at
+                continue
+            latencies[name].append(time.perf_counter() - start)
+
+            # compare through json so that tuples and lists are equal
+            result = json.loads(json.dumps(result))
+            results[name][str(frame.index)] = result
+            previous = expected.get(name, {}).get(str(frame.index), result)
+            if previous != result:
+                mismatches[name] += 1
+                print(f"Frame {frame.index} {name}: expected {previous}, got {result}")
+
+    for name in args.check:
+        if latencies[name]:
+            print(summarize(name, latencies[name], mismatches[name]))
+        else:
+            print(f"{name}: no frame contains the regions it checks.")
+
+    if args.update:
+        for name, checked in results.items():
+            expected.setdefault(name, {}).update(checked)
+        with open(expected_path, "w") as f:
+            json.dump(expected, f, indent=2)
+        print(f"Stored the results as expected in {expected_path}.")
+    elif any(mismatches.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from typing import Optional
+
+import cv2 as cv  # type: ignore[import]
+import numpy as np
+from ark import ArkWindow
+
+
+class SettleDetector:
+    """Tells when regions of the screen stopped changing, for example the
+    slots of both inventories once a transfer went through.
+
+    Each region is sampled as a small grayscale thumbnail of its own, which is
+    cheap enough to grab and compare many times a second and averages away
+    the noise of single pixels, such as the animated background of the slots.
+    Sampling the regions separately keeps whatever lies between two regions
+    far apart out of the check, they have settled once none of them changed.
+
+    Parameters
+    ----------
+    region :class:`tuple[int, int, int, int] | list[tuple[int, int, int, int]]`:
+        The region or regions to watch
+
+    scale :class:`float`:
+        The factor to scale the samples down by
+
+    tolerance :class:`float`:
+        The mean difference (0-255) of two samples still considered unchanged
+
+    settle :class:`int`:
+        The amount of unchanged samples in a row for the region to be settled
+    """
+
+    def __init__(
+        self,
+        region: tuple[int, int, int, int] | list[tuple[int, int, int, int]],
+        *,
+        scale: float = 0.125,
+        tolerance: float = 2.0,
+        settle: int = 3,
+    ) -> None:
+        self.regions = region if isinstance(region, list) else [region]
+        self.scale = scale
+        self.tolerance = tolerance
+        self.settle = settle
+
+        self.samples = 0
+        self.changes = 0
+        self.unchanged = 0
+        self._previous: Optional[list[np.ndarray]] = None
+
+    @property
+    def settled(self) -> bool:
+        return self.unchanged >= self.settle
+
+    def sample(self, window: ArkWindow) -> list[np.ndarray]:
+        """Grabs each region as a downscaled grayscale image."""
+        return [self._sample(window, region) for region in self.regions]
+
+    def _sample(
+        self, window: ArkWindow, region: tuple[int, int, int, int]
+    ) -> np.ndarray:
+        # the grab goes past the frame cache, which would serve the same frame
+        img = np.asarray(ArkWindow.grab_screen(window, region))
+        gray = cv.cvtColor(img, cv.COLOR_BGRA2GRAY)
+        size = (
+            max(1, round(gray.shape[1] * self.scale)),
+            max(1, round(gray.shape[0] * self.scale)),
+        )
+        return cv.resize(gray, size, interpolation=cv.INTER_AREA)
+
+    def update(self, window: ArkWindow) -> bool:
+        """Takes the next sample and returns whether the regions have settled."""
+        sample = self.sample(window)
+        self.samples += 1
+        if self._previous is not None:
+            if all(
+                cv.absdiff(current, previous).mean() <= self.tolerance
+                for current, previous in zip(sample, self._previous)
+            ):
+                self.unchanged += 1
+            else:
+                self.unchanged = 0
+                self.changes += 1
+        self._previous = sample
+        return self.settled
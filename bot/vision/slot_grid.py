@@ -0,0 +1,143 @@
+from typing import Optional, Sequence
+
+import cv2 as cv  # type: ignore[import]
+import numpy as np
+from ark import ArkWindow
+from ark.items import Item
+
+from .regions import union_region
+from .templates import Template
+
+
+class SlotGrid:
+    """Matches a set of item icons against every slot of an inventory grid at
+    once, from a single capture of the grid.
+
+    Each icon is matched over the whole grid in one pass, the best score of
+    every slot is then taken from the result in one vectorized reduction so
+    that a whole inventory page costs as much as a single template match per
+    icon, no matter how many slots are checked.
+
+    Parameters
+    ----------
+    slots :class:`Sequence[tuple]`:
+        The regions of the slots, row by row, as in `Inventory.SLOTS`
+    """
+
+    def __init__(self, slots: Sequence[tuple[int, int, int, int]]) -> None:
+        self.slots = list(slots)
+        _, first_y, self.slot_width, self.slot_height = self.slots[0]
+        self.columns = sum(1 for _, y, _, _ in self.slots if y == first_y)
+        self.rows = len(self.slots) // self.columns
+        self.region = union_region(self.slots)
+
+    def capture(self, window: ArkWindow, grayscale: bool = False) -> np.ndarray:
+        """Grabs the grid, scaled back to 1920x1080 if the game runs at a
+        different resolution so that it matches the unscaled icons."""
+        grid = np.asarray(window.grab_screen(self.region))
+        conversion = cv.COLOR_BGRA2GRAY if grayscale else cv.COLOR_BGRA2BGR
+        grid = cv.cvtColor(grid, conversion)
+
+        _, _, width, height = self.region
+        if grid.shape[:2] != (height, width):
+            grid = cv.resize(grid, (width, height), interpolation=cv.INTER_AREA)
+        return grid
+
+    def scores(
+        self, window: ArkWindow, icons: Sequence[Template], grayscale: bool = False
+    ) -> np.ndarray:
+        """Returns the match score of every icon in every slot.
+
+        Parameters
+        ----------
+        window :class:`ArkWindow`:
+            The window to capture the grid from
+
+        icons :class:`Sequence[Template]`:
+            The icons to score the slots against
+
+        grayscale :class:`bool`: [optional]
+            Whether to match the grayscale variants, default False
+
+        Returns
+        -------
+        :class:`np.ndarray`:
+            An array of shape (icons, slots) with the scores between -1 and 1
+        """
+        grid = self.capture(window, grayscale)
+        height, width = self.rows * self.slot_height, self.columns * self.slot_width
+        grid = grid[:height, :width]
+        results = np.full((len(icons), height, width), -1, dtype=np.float32)
+
+        # offsets of each position within the slot it lies in
+        offset_y = np.arange(height) % self.slot_height
+        offset_x = np.arange(width) % self.slot_width
+
+        for i, icon in enumerate(icons):
+            needle = icon.gray if grayscale else icon.bgr
+            icon_height, icon_width = needle.shape[:2]
+            if icon_height > self.slot_height or icon_width > self.slot_width:
+                continue
+
+            result = cv.matchTemplate(grid, needle, cv.TM_CCOEFF_NORMED)
+            rows, cols = result.shape
+            results[i, :rows, :cols] = result
+
+            # a match only counts towards a slot if the icon lies within it
+            results[i, offset_y > self.slot_height - icon_height] = -1
+            results[i, :, offset_x > self.slot_width - icon_width] = -1
+
+        per_slot = results.reshape(
+            len(icons), self.rows, self.slot_height, self.columns, self.slot_width
+        ).max(axis=(2, 4))
+        return per_slot.reshape(len(icons), -1)
+
+    def occupancy(
+        self,
+        window: ArkWindow,
+        icons: dict[Item, Template],
+        confidence: float,
+        grayscale: bool = False,
+    ) -> dict[int, Optional[Item]]:
+        """Returns the item in each slot, `None` for slots that do not match
+        any of the icons with the given confidence.
+
+        Parameters
+        ----------
+        window :class:`ArkWindow`:
+            The window to capture the grid from
+
+        icons :class:`dict[Item, Template]`:
+            The items to look for and the icons to match them by
+
+        confidence :class:`float`:
+            How restrictive to be in whats considered a match
+
+        grayscale :class:`bool`: [optional]
+            Whether to match the grayscale variants, default False
+        """
+        candidates = list(icons)
+        scores = self.scores(window, list(icons.values()), grayscale)
+        best = scores.argmax(axis=0)
+        matched = scores.max(axis=0) >= confidence
+
+        return {
+            slot: candidates[best[slot]] if matched[slot] else None
+            for slot in range(len(self.slots))
+        }
+
+    def count(
+        self,
+        window: ArkWindow,
+        item: Item,
+        icon: Template,
+        confidence: float,
+        *,
+        start: int = 0,
+        grayscale: bool = False,
+    ) -> int:
+        """Returns how many slots from the given slot on contain the item."""
+        occupancy = self.occupancy(window, {item: icon}, confidence, grayscale)
+        return sum(
+            1 for slot, found in occupancy.items() if slot >= start and found is item
+        )
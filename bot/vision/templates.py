@@ -0,0 +1,229 @@
+import glob
+import os
+import threading
+import time
+from typing import Iterable, Literal, Optional, overload
+
+import cv2 as cv  # type: ignore[import]
+import numpy as np
+import PIL  # type: ignore[import]
+from ark import ArkWindow, items
+from ark.items import Item
+from PIL import Image, ImageOps
+
+
+class Template:
+    """A template image decoded once, with its grayscale and scaled variants
+    kept as contiguous arrays so that matching it does not read or convert
+    the file again.
+
+    Parameters
+    ----------
+    path :class:`str`:
+        The path of the image to load
+    """
+
+    def __init__(self, path: str) -> None:
+        bgr = cv.imread(path, cv.IMREAD_COLOR)
+        if bgr is None:
+            raise FileNotFoundError(f"Could not load template '{path}'.")
+
+        self.path = path
+        self.bgr: np.ndarray = np.ascontiguousarray(bgr)
+        self.gray: np.ndarray = np.ascontiguousarray(
+            cv.cvtColor(bgr, cv.COLOR_BGR2GRAY)
+        )
+        self._scaled: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
+
+    def __repr__(self) -> str:
+        return f"Template({self.path!r})"
+
+    @property
+    def nbytes(self) -> int:
+        """The memory used by the template and all its variants."""
+        return (
+            self.bgr.nbytes
+            + self.gray.nbytes
+            + sum(bgr.nbytes + gray.nbytes for bgr, gray in self._scaled.values())
+        )
+
+    def scaled(self, size: tuple[int, int], grayscale: bool = False) -> np.ndarray:
+        """Returns the template scaled to fit within the given size, keeping
+        its aspect ratio just like ark scales the templates it is given."""
+        if size not in self._scaled:
+            rgb = Image.fromarray(cv.cvtColor(self.bgr, cv.COLOR_BGR2RGB))
+            resized = ImageOps.contain(rgb, size, PIL.Image.Resampling.LANCZOS)
+            bgr = cv.cvtColor(np.asarray(resized), cv.COLOR_RGB2BGR)
+            self._scaled[size] = (
+                np.ascontiguousarray(bgr),
+                np.ascontiguousarray(cv.cvtColor(bgr, cv.COLOR_BGR2GRAY)),
+            )
+        return self._scaled[size][grayscale]
+
+    def for_window(self, window: ArkWindow, grayscale: bool = False) -> np.ndarray:
+        """Returns the variant of the template matching the windows resolution."""
+        if not window.need_boundary_scaling():
+            return self.gray if grayscale else self.bgr
+
+        height, width = self.gray.shape
+        return self.scaled(window.convert_point(width, height), grayscale)
+
+    @overload
+    def locate(
+        self,
+        window: ArkWindow,
+        region: tuple[int, int, int, int],
+        confidence: float,
+        *,
+        grayscale: bool = False,
+        center: Literal[True],
+    ) -> tuple[int, int] | None:
+        ...
+
+    @overload
+    def locate(
+        self,
+        window: ArkWindow,
+        region: tuple[int, int, int, int],
+        confidence: float,
+        *,
+        grayscale: bool = False,
+        center: Literal[False] = False,
+    ) -> tuple[int, int, int, int] | None:
+        ...
+
+    def locate(
+        self,
+        window: ArkWindow,
+        region: tuple[int, int, int, int],
+        confidence: float,
+        *,
+        grayscale: bool = False,
+        center: bool = False,
+    ) -> tuple[int, int, int, int] | tuple[int, int] | None:
+        """Locates the template in the given region of the window, same as
+        `ArkWindow.locate_template` but matching the preloaded variant.
+
+        Parameters
+        ----------
+        window :class:`ArkWindow`:
+            The window to locate the template in
+
+        region :class:`tuple`:
+            The region to locate the template in, in 1920x1080 coordinates
+
+        confidence :class:`float`:
+            How restrictive to be in whats considered a match
+
+        grayscale :class:`bool`: [optional]
+            Whether to match the grayscale variant, default False
+
+        center :class:`bool`: [optional]
+            Whether to get the matches center, default False
+        """
+        return window.locate_template(
+            self.for_window(window, grayscale),
+            window.convert_region(region),
+            confidence,
+            grayscale=grayscale,
+            convert=False,
+            center=center,  # type: ignore[arg-type]
+        )
+
+
+class TemplateRegistry:
+    """Keeps every template the bot matches decoded in memory.
+
+    Templates are loaded the first time they are requested, or ahead of time
+    with `preload`. Once installed, ark's own template matching, which is
+    handed the paths of the structure, dinosaur and item templates, is served
+    the preloaded variants instead of reading the file on every call.
+    """
+
+    def __init__(self) -> None:
+        self._templates: dict[str, Template] = {}
+        self._lock = threading.Lock()
+        self._installed = False
+        self.load_time = 0.0
+
+    def __getitem__(self, path: str) -> Template:
+        path = os.path.normpath(path)
+        template = self._templates.get(path)
+        if template is not None:
+            return template
+
+        with self._lock:
+            if path not in self._templates:
+                start = time.perf_counter()
+                self._templates[path] = Template(path)
+                self.load_time += time.perf_counter() - start
+        return self._templates[path]
+
+    def __contains__(self, path: str) -> bool:
+        return os.path.normpath(path) in self._templates
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(template.nbytes for template in self._templates.values())
+
+    def preload(
+        self, paths: Iterable[str], window: Optional[ArkWindow] = None
+    ) -> None:
+        """Loads the given templates and, if a window is given, the variants
+        for its resolution, then reports the time and memory it took.
+
+        Parameters
+        ----------
+        paths :class:`Iterable[str]`:
+            The paths of the templates to load
+
+        window :class:`ArkWindow`: [optional]
+            The window to prepare the scaled variants for
+        """
+        start = time.perf_counter()
+        for path in paths:
+            template = self[path]
+            if window is not None:
+                template.for_window(window)
+                template.for_window(window, grayscale=True)
+
+        print(
+            f"Preloaded {len(self)} templates in "
+            f"{round((time.perf_counter() - start) * 1000)}ms, "
+            f"{round(self.nbytes / 1024)} KiB resident."
+        )
+
+    def install(self) -> None:
+        """Wraps `ArkWindow.convert_image` so that ark matches the preloaded
+        variant of any template it is given by path, only done once."""
+        if self._installed:
+            return
+
+        original = ArkWindow.convert_image
+
+        def convert_image(window: ArkWindow, image):
+            if isinstance(image, str):
+                try:
+                    return self[image].for_window(window)
+                except FileNotFoundError:
+                    pass
+            return original(window, image)
+
+        ArkWindow.convert_image = convert_image  # type: ignore[method-assign]
+        self._installed = True
+
+
+def station_templates() -> list[str]:
+    """Returns the templates of the bots structures and dinosaurs as well as
+    the inventory icons of every item."""
+    paths = sorted(glob.glob("assets/templates/*.png"))
+    paths.extend(
+        item.inventory_icon for item in vars(items).values() if isinstance(item, Item)
+    )
+    return paths
+
+
+templates = TemplateRegistry()
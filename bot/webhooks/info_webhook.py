@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from io import BytesIO
 from typing import Optional
 
@@ -5,8 +6,10 @@ from ark import ArkWindow
 from discord import File  # type:ignore[import]
 from discord import Embed, RequestsWebhookAdapter, Webhook
 from mss.screenshot import ScreenShot  # type:ignore[import]
+from PIL import Image  # type:ignore[import]
 
-from ..tools import mss_to_pil, threaded
+from ..tools import io_worker, mss_to_pil, run_on
+from ..vision import grab_thumbnail
 
 
 class InfoWebhook:
@@ -24,6 +27,9 @@ class InfoWebhook:
 
     DISCORD_AVATAR = "https://i.kym-cdn.com/entries/icons/facebook/000/022/293/Bloodyshadow_rolled_user_shutupandsleepwith_i_m_bisexual_let_s_work_from__a48265eae6a474904cdc2cae9f184aad.jpg"
 
+    # error screenshots only need to show what is going on, not the details
+    THUMBNAIL_SCALE = 0.5
+
     def __init__(self, url: str, user_id: str):
         self._hook = Webhook.from_url(url, adapter=RequestsWebhookAdapter())
         self._hook.user = "Ling Ling"
@@ -43,9 +49,13 @@ class InfoWebhook:
     def url(self) -> str:
         return self._url
 
-    @threaded("Sending embed")
+    @run_on(io_worker)
     def send_embed(
-        self, embed: Embed, *, img: Optional[ScreenShot] = None, mention: bool = False
+        self,
+        embed: Embed,
+        *,
+        img: Optional[ScreenShot | Image.Image] = None,
+        mention: bool = False,
     ) -> None:
         """Sends an embed to the info webhook alongside a mention. If an image is passed
         it will be converted to a bytes-like object and integrated into the embed.
@@ -55,7 +65,7 @@ class InfoWebhook:
         embed :class:`discord.Embed`:
             The embed to send
 
-        img :class:`Optional[mss.Screenshot]`:
+        img :class:`Optional[mss.Screenshot | Image.Image]`:
             The image to include into the embed, `None` by default
 
         mention :class:`bool`:
@@ -64,7 +74,7 @@ class InfoWebhook:
         if img is None:
             file = None
         else:
-            image_pil = mss_to_pil(img)
+            image_pil = img if isinstance(img, Image.Image) else mss_to_pil(img)
             with BytesIO() as image_binary:
                 image_pil.save(image_binary, "PNG")
                 image_binary.seek(0)
@@ -82,18 +92,20 @@ class InfoWebhook:
         except Exception:
             print("Failed to send embed.")
 
-    @threaded("Sending error")
     def send_error(
         self,
         task: str,
         exception: Exception,
-        image: Optional[ScreenShot] = None,
+        image: Optional[ScreenShot | Image.Image] = None,
         *,
         mention: bool = False,
-    ) -> None:
+    ) -> Future:
         """Posts an image of the current screenshot alongside current
         bed and the exception to discord for debugging purposes.
 
+        The screenshot is taken right away, posting it may be queued behind
+        other embeds while the screen has long moved on.
+
         Parameters:
         ------------
         bed :class:`Bed`:
@@ -102,6 +114,19 @@ class InfoWebhook:
         exception: :class:`Exception`:
             The description of the occured exception
         """
+        if image is None:
+            image = grab_thumbnail(self.screen, self.THUMBNAIL_SCALE)
+        return self._post_error(task, exception, image, mention=mention)
+
+    @run_on(io_worker)
+    def _post_error(
+        self,
+        task: str,
+        exception: Exception,
+        image: ScreenShot | Image.Image,
+        *,
+        mention: bool,
+    ) -> None:
         embed = Embed(
             type="rich",
             title="Ran into a problem!",
@@ -114,10 +139,7 @@ class InfoWebhook:
 
         embed.set_image(url="attachment://image.png"),
 
-        if image is None:
-            image = self.screen.grab_screen((0, 0, 1920, 1080))
-
-        image_pil = mss_to_pil(image)
+        image_pil = image if isinstance(image, Image.Image) else mss_to_pil(image)
 
         with BytesIO() as image_binary:
             image_pil.save(image_binary, "PNG")
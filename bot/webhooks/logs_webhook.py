@@ -5,7 +5,7 @@ from discord import RequestsWebhookAdapter  # type:ignore[import]
 from discord import Embed, Webhook, WebhookMessage
 from mss.screenshot import ScreenShot  # type:ignore[import]
 
-from ..tools import img_to_file, mss_to_pil, threaded
+from ..tools import img_to_file, io_worker, mss_to_pil, run_on
 from .alert_settings import AlertSettings
 
 
@@ -46,7 +46,7 @@ class TribeLogWebhook:
 
         self.check_alerts(current_logs)
 
-    @threaded("Tribe log thread")
+    @run_on(io_worker)
     def check_alerts(self, image: ScreenShot) -> None:
         updates = self.tribelog.find_tribelog_events(image)
 
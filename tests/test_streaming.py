@@ -0,0 +1,42 @@
+import importlib.util
+import random
+from pathlib import Path
+
+# the streaming statistics do not depend on the rest of the bot, which needs
+# the game to be importable, so the module is loaded on its own
+spec = importlib.util.spec_from_file_location(
+    "streaming", Path(__file__).parent.parent / "bot" / "streaming.py"
+)
+streaming = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(streaming)
+
+
+def validate(stats, amount: float) -> bool:
+    """Accepts the amount the way `CrystalStation.validate_dust_amount` does."""
+    if not stats.is_outlier(amount, default=500, fallback=15000):
+        stats.add(amount)
+        return True
+    return stats.reject(amount)
+
+
+def test_yield_follows_a_step_change() -> None:
+    rng = random.Random(0)
+    stats = streaming.YieldStats()
+    for _ in range(30):
+        assert validate(stats, rng.gauss(10000, 300))
+
+    accepted = [validate(stats, rng.gauss(15000, 300)) for _ in range(100)]
+
+    assert sum(accepted) >= 100 - stats.DRIFT_SAMPLES
+    assert abs(stats.expected(500) - 15000) < 500
+
+
+def test_scattered_outliers_do_not_move_the_yield() -> None:
+    rng = random.Random(1)
+    stats = streaming.YieldStats()
+    for _ in range(30):
+        validate(stats, rng.gauss(10000, 300))
+
+    for misread in (100, 40000, 1000, 99999, 0, 25000, 3):
+        assert not validate(stats, misread)
+    assert abs(stats.expected(500) - 10000) < 500